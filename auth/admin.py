@@ -0,0 +1,48 @@
+"""
+Administrator access module for Finance Tracker API.
+
+This module restricts internal endpoints (dashboards, diagnostics) to the
+operators listed in the ``ADMIN_EMAILS`` setting. Administrators are
+recognised by the verified email address in their JWT.
+"""
+
+from fastapi import HTTPException, Request, status
+from config import Settings
+
+
+def is_admin(user_info: dict, settings: Settings):
+    """
+    Check whether an authenticated user is an administrator.
+
+    Args:
+        user_info (dict): Decoded JWT payload of the user
+        settings (Settings): Application settings
+
+    Returns:
+        bool: True if the user's verified email is listed in ``ADMIN_EMAILS``
+    """
+    admin_emails = {
+        email.strip().lower()
+        for email in settings.admin_emails.split(",")
+        if email.strip()
+    }
+    return bool(user_info.get("verified_email")) and (
+        user_info.get("email", "").lower() in admin_emails
+    )
+
+
+def require_admin(request: Request):
+    """
+    Dependency that rejects requests of users who are not administrators.
+
+    Args:
+        request (Request): The HTTP request object containing user authentication info
+
+    Raises:
+        HTTPException: 403 Forbidden if the user is not an administrator
+    """
+    if not is_admin(request.state.user_info, request.app.state.settings):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Administrator access required",
+        )
@@ -10,34 +10,35 @@ The authentication flow:
 2. Google redirects back with authorization code
 3. Exchange code for access token and ID token
 4. Verify ID token and extract user information
-5. Create or retrieve user from database
+5. Create or retrieve user from database (by the unique ``sub_id`` index),
+   updating profile fields that changed in the Google account
 6. Generate JWT token and set secure cookie
 7. Redirect user to frontend application
 
 Endpoints:
 - GET /api/v1/auth/oauth: Initiate Google OAuth2 authentication
 - GET /api/v1/auth/callback: Handle OAuth2 callback from Google
+
+The Google client libraries are imported on the first callback rather than
+at startup, and token requests share the application's HTTP client that is
+created in the lifespan (see ``main.create_app``).
 """
 
 from sqlalchemy.orm import Session
 from fastapi import APIRouter, Request, Depends, HTTPException, status
 from fastapi.responses import RedirectResponse
-from google.oauth2 import id_token
-from google.auth.transport import requests as auth_requests
-import httpx
 from auth.jwt_generation import generate_jwt
-from config import get_settings
 
 from db.connect import get_db
 from db.models.users_model import User
+from services.profiling import ProfiledRoute
+from services.user_cache import invalidate_user_profile
 
-env_variables = get_settings()
-
-router = APIRouter(prefix="/api/v1/auth", tags=["Auth"])
+router = APIRouter(prefix="/api/v1/auth", tags=["Auth"], route_class=ProfiledRoute)
 
 
 @router.get("/oauth")
-def oauth():
+def oauth(request: Request):
     """
     Initiate Google OAuth2 authentication flow.
 
@@ -45,6 +46,9 @@ def oauth():
     can use to redirect users to Google's authentication service. The URL
     includes the necessary parameters for OAuth2 authorization code flow.
 
+    Args:
+        request (Request): FastAPI request object
+
     Returns:
         dict: JSON response containing the Google OAuth2 redirect URL
 
@@ -60,6 +64,7 @@ def oauth():
         3. User authenticates with Google
         4. Google redirects to the callback endpoint with authorization code
     """
+    env_variables = request.app.state.settings
     google_auth_url = f"https://accounts.google.com/o/oauth2/auth?client_id={env_variables.client_id}&redirect_uri={env_variables.redirect_url}&response_type=code&scope=openid email profile"
 
     return {"redirectUrl": google_auth_url}
@@ -87,6 +92,11 @@ async def auth_callback(code: str, request: Request, db: Session = Depends(get_d
         HTTPException: 400 Bad Request if ID token is missing or invalid
         HTTPException: 500 Internal Server Error if authentication fails
     """
+    # google-auth is slow to import and only needed here.
+    from google.oauth2 import id_token
+    from google.auth.transport import requests as auth_requests
+
+    env_variables = request.app.state.settings
     token = env_variables.token_uri
     data = {
         "code": code,
@@ -96,10 +106,9 @@ async def auth_callback(code: str, request: Request, db: Session = Depends(get_d
         "grant_type": "authorization_code",
     }
 
-    async with httpx.AsyncClient() as client:
-        resp = await client.post(token, data=data)
-        resp.raise_for_status()
-        token_response = resp.json()
+    resp = await request.app.state.http_client.post(token, data=data)
+    resp.raise_for_status()
+    token_response = resp.json()
 
     id_token_value = token_response.get("id_token")
     if not id_token_value:
@@ -112,19 +121,24 @@ async def auth_callback(code: str, request: Request, db: Session = Depends(get_d
         user_info = id_token.verify_oauth2_token(
             id_token_value, auth_requests.Request(), env_variables.client_id
         )
+        profile = {
+            "email": user_info["email"],
+            "name": user_info["name"],
+            "picture": user_info["picture"],
+            "verified_email": user_info["email_verified"],
+        }
         user = db.query(User).filter_by(sub_id=user_info["sub"]).first()
         if not user:
-            user = User(
-                sub_id=user_info["sub"],
-                email=user_info["email"],
-                name=user_info["name"],
-                picture=user_info["picture"],
-                verified_email=user_info["email_verified"],
-            )
+            user = User(sub_id=user_info["sub"], **profile)
             db.add(user)
             db.commit()
             db.refresh(user)
-        jwt_token = generate_jwt(user)
+        elif any(getattr(user, field) != value for field, value in profile.items()):
+            for field, value in profile.items():
+                setattr(user, field, value)
+            db.commit()
+            invalidate_user_profile(user.id)
+        jwt_token = generate_jwt(user, env_variables)
         redirect_response = RedirectResponse(url=env_variables.fe_url)
         redirect_response.set_cookie(
             key="jwt_token", value=jwt_token, secure=True, httponly=True
@@ -13,14 +13,12 @@ The module includes:
 
 from datetime import datetime, timedelta, timezone
 import jwt
-from config import get_settings
+from config import Settings, get_settings
 
 from db.models.users_model import User
 
-env_variables = get_settings()
 
-
-def generate_jwt(user: User):
+def generate_jwt(user: User, settings: Settings = None):
     """
     Generate a JWT token for the authenticated user.
 
@@ -30,10 +28,12 @@ def generate_jwt(user: User):
 
     Args:
         user (User): The authenticated user object from the database
+        settings (Settings, optional): Application settings. Defaults to ``get_settings()``
 
     Returns:
         str: Encoded JWT token string
     """
+    settings = settings or get_settings()
     expire = datetime.now(timezone.utc) + timedelta(hours=24)
     to_encode = {
         "id": user.id,
@@ -45,13 +45,11 @@ def generate_jwt(user: User):
         "exp": expire,
     }
 
-    encoded_jwt = jwt.encode(
-        to_encode, env_variables.jwt_secret, env_variables.jwt_algo
-    )
+    encoded_jwt = jwt.encode(to_encode, settings.jwt_secret, settings.jwt_algo)
     return encoded_jwt
 
 
-def decode_jwt(token: str):
+def decode_jwt(token: str, settings: Settings = None):
     """
     Decode and validate a JWT token.
 
@@ -61,6 +59,7 @@ def decode_jwt(token: str):
 
     Args:
         token (str): The JWT token string to decode
+        settings (Settings, optional): Application settings. Defaults to ``get_settings()``
 
     Returns:
         dict: Decoded token payload containing user information
@@ -68,4 +67,5 @@ def decode_jwt(token: str):
     Raises:
         jwt.InvalidTokenError: If the token is invalid, expired, or malformed
     """
-    return jwt.decode(token, env_variables.jwt_secret, env_variables.jwt_algo)
+    settings = settings or get_settings()
+    return jwt.decode(token, settings.jwt_secret, settings.jwt_algo)
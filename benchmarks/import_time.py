@@ -0,0 +1,107 @@
+"""
+Cold-start report for Finance Tracker API.
+
+This script measures what a freshly started worker pays before it can serve
+its first request. Every run uses a new Python interpreter, so nothing is
+shared between runs through ``sys.modules`` or the filesystem cache of the
+interpreter itself.
+
+Phases:
+- import main: importing the application module
+- create_app: building the application (routers, middleware)
+- lifespan startup: creating the database engines and the HTTP client
+
+The median of ``--runs`` runs is printed for each phase, followed by the
+top-level packages that ``import main`` spends the most time in, summed
+from the self times reported by ``python -X importtime``.
+
+Usage:
+    python -m benchmarks.import_time [--runs 5] [--top 15]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+
+PHASES_SCRIPT = """
+import asyncio, json, time
+started = time.perf_counter()
+import main
+imported = time.perf_counter()
+app = main.create_app()
+created = time.perf_counter()
+
+async def start():
+    async with app.router.lifespan_context(app):
+        return time.perf_counter()
+
+started_up = asyncio.run(start())
+print(json.dumps({
+    "import main": imported - started,
+    "create_app": created - imported,
+    "lifespan startup": started_up - created,
+}))
+"""
+
+
+def measure_phases(runs: int):
+    """Run the phases script ``runs`` times and return the timings in ms per phase."""
+    timings = defaultdict(list)
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", PHASES_SCRIPT],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        for phase, seconds in json.loads(output.splitlines()[-1]).items():
+            timings[phase].append(seconds * 1000)
+    return timings
+
+
+def measure_packages():
+    """Return the import time in ms spent in each top-level package."""
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stderr
+    packages = defaultdict(float)
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_time, _, name = line.removeprefix("import time:").split("|")
+        packages[name.strip().split(".")[0]] += int(self_time) / 1000
+    return packages
+
+
+def main():
+    """Parse command line arguments and print the cold-start report."""
+    parser = argparse.ArgumentParser(description="Report application cold-start cost.")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    timings = measure_phases(args.runs)
+    print(f"{'phase':<20}{'median ms':>10}{'min ms':>10}{'max ms':>10}")
+    for phase, values in timings.items():
+        print(
+            f"{phase:<20}{statistics.median(values):>10.1f}"
+            f"{min(values):>10.1f}{max(values):>10.1f}"
+        )
+    total = sum(statistics.median(values) for values in timings.values())
+    print(f"{'total':<20}{total:>10.1f}")
+
+    print()
+    print(f"{'package (import main)':<30}{'ms':>10}")
+    packages = sorted(measure_packages().items(), key=lambda item: -item[1])
+    for name, milliseconds in packages[: args.top]:
+        print(f"{name:<30}{milliseconds:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
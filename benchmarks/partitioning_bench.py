@@ -0,0 +1,207 @@
+"""
+Partitioning benchmark for Finance Tracker API.
+
+This script compares query plans and timings of the transaction list queries
+on an unpartitioned transactions table and on a table range partitioned by
+month (see ``db.partitioning``). Both tables are built in separate schemas of
+the configured database with identical synthetic data and the same
+``(user_id, date)`` index.
+
+The queries mirror ``get_transactions`` with a period filter:
+- page: one page of a user's transactions inside a period
+- count: the total count of a user's transactions inside a period
+- month report: the sum of all users' amounts in one month
+
+For each query the median planning time, execution time, buffers touched and
+number of scanned partitions over ``--samples`` random users/periods is printed.
+
+Usage:
+    python -m benchmarks.partitioning_bench [--rows 50000000] [--users 100000]
+        [--years 5] [--samples 20] [--keep]
+"""
+
+import argparse
+import json
+import random
+import statistics
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import text
+from db.connect import get_engine
+from db.partitioning import add_months
+
+SCHEMAS = ("bench_plain", "bench_partitioned")
+
+COLUMNS = """
+    id bigserial,
+    category_id integer NOT NULL,
+    wallet_id integer,
+    date timestamptz NOT NULL,
+    amount double precision NOT NULL,
+    comment varchar,
+    user_id integer NOT NULL,
+    type varchar NOT NULL
+"""
+
+QUERIES = {
+    "page": (
+        "SELECT id, category_id, date, amount, comment, type FROM transactions "
+        "WHERE user_id = :user_id AND date >= :start AND date <= :end "
+        "ORDER BY date LIMIT 20"
+    ),
+    "count": (
+        "SELECT count(*) FROM transactions "
+        "WHERE user_id = :user_id AND date >= :start AND date <= :end"
+    ),
+    "month report": (
+        "SELECT sum(amount) FROM transactions WHERE date >= :start AND date < :end"
+    ),
+}
+
+
+def create_tables(connection, start: datetime, years: int):
+    """Create the unpartitioned and the monthly partitioned benchmark tables."""
+    for schema in SCHEMAS:
+        connection.execute(text(f"DROP SCHEMA IF EXISTS {schema} CASCADE"))
+        connection.execute(text(f"CREATE SCHEMA {schema}"))
+
+    connection.execute(
+        text(f"CREATE TABLE bench_plain.transactions ({COLUMNS}, PRIMARY KEY (id))")
+    )
+    connection.execute(
+        text(
+            f"CREATE TABLE bench_partitioned.transactions "
+            f"({COLUMNS}, PRIMARY KEY (id, date)) PARTITION BY RANGE (date)"
+        )
+    )
+    month = start.date()
+    for _ in range(years * 12):
+        next_month = add_months(month, 1)
+        connection.execute(
+            text(
+                f"CREATE TABLE bench_partitioned.transactions_y{month.year}m{month.month:02d} "
+                f"PARTITION OF bench_partitioned.transactions "
+                f"FOR VALUES FROM ('{month.isoformat()} 00:00+00') "
+                f"TO ('{next_month.isoformat()} 00:00+00')"
+            )
+        )
+        month = next_month
+
+
+def load_data(connection, rows: int, users: int, start: datetime, years: int):
+    """Fill both tables with the same synthetic rows and build the indexes."""
+    seconds = int(timedelta(days=365 * years).total_seconds())
+    connection.execute(
+        text(
+            "INSERT INTO bench_plain.transactions "
+            "(category_id, date, amount, comment, user_id, type) "
+            "SELECT (random() * 20)::int + 1, "
+            "  :start + random() * make_interval(secs => :seconds), "
+            "  round((random() * 200)::numeric, 2), 'benchmark', "
+            "  (random() * (:users - 1))::int + 1, "
+            "  CASE WHEN random() < 0.8 THEN 'expense' ELSE 'income' END "
+            "FROM generate_series(1, :rows)"
+        ),
+        {"start": start, "seconds": seconds, "users": users, "rows": rows},
+    )
+    connection.execute(
+        text(
+            "INSERT INTO bench_partitioned.transactions "
+            "SELECT * FROM bench_plain.transactions"
+        )
+    )
+    for schema in SCHEMAS:
+        connection.execute(
+            text(f"CREATE INDEX ON {schema}.transactions (user_id, date)")
+        )
+        connection.execute(text(f"ANALYZE {schema}.transactions"))
+
+
+def count_scanned_relations(plan):
+    """Count the table scans in an EXPLAIN JSON plan tree."""
+    scanned = 1 if "Relation Name" in plan else 0
+    return scanned + sum(
+        count_scanned_relations(child) for child in plan.get("Plans", [])
+    )
+
+
+def explain(connection, schema: str, query: str, parameters: dict):
+    """Run EXPLAIN ANALYZE for a query in a schema and extract its metrics."""
+    connection.execute(text(f"SET search_path TO {schema}"))
+    result = connection.execute(
+        text(f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {query}"), parameters
+    ).scalar()
+    plan = (json.loads(result) if isinstance(result, str) else result)[0]
+    root = plan["Plan"]
+    return {
+        "planning": plan["Planning Time"],
+        "execution": plan["Execution Time"],
+        "buffers": root.get("Shared Hit Blocks", 0) + root.get("Shared Read Blocks", 0),
+        "scans": count_scanned_relations(root),
+    }
+
+
+def run_benchmark(connection, users: int, start: datetime, years: int, samples: int):
+    """Sample random users and periods and print median metrics per query."""
+    random.seed(0)
+    parameter_sets = []
+    for _ in range(samples):
+        period_start = start + timedelta(days=random.randrange(0, 365 * years - 31))
+        parameter_sets.append(
+            {
+                "user_id": random.randrange(1, users + 1),
+                "start": period_start,
+                "end": period_start + timedelta(days=30),
+            }
+        )
+
+    print(
+        f"{'query':<14}{'table':<20}{'planning ms':>12}{'execution ms':>14}"
+        f"{'buffers':>10}{'scans':>7}"
+    )
+    for name, query in QUERIES.items():
+        for schema in SCHEMAS:
+            results = [
+                explain(connection, schema, query, parameters)
+                for parameters in parameter_sets
+            ]
+            print(
+                f"{name:<14}{schema:<20}"
+                f"{statistics.median(r['planning'] for r in results):>12.3f}"
+                f"{statistics.median(r['execution'] for r in results):>14.3f}"
+                f"{statistics.median(r['buffers'] for r in results):>10.0f}"
+                f"{statistics.median(r['scans'] for r in results):>7.0f}"
+            )
+    connection.execute(text("RESET search_path"))
+
+
+def main():
+    """Parse command line arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark transactions partitioning.")
+    parser.add_argument("--rows", type=int, default=50_000_000)
+    parser.add_argument("--users", type=int, default=100_000)
+    parser.add_argument("--years", type=int, default=5)
+    parser.add_argument("--samples", type=int, default=20)
+    parser.add_argument(
+        "--keep", action="store_true", help="keep the benchmark schemas afterwards"
+    )
+    args = parser.parse_args()
+
+    start = datetime(
+        datetime.now(timezone.utc).year - args.years, 1, 1, tzinfo=timezone.utc
+    )
+
+    with get_engine().begin() as connection:
+        create_tables(connection, start, args.years)
+        load_data(connection, args.rows, args.users, start, args.years)
+
+    with get_engine().connect() as connection:
+        run_benchmark(connection, args.users, start, args.years, args.samples)
+
+    if not args.keep:
+        with get_engine().begin() as connection:
+            for schema in SCHEMAS:
+                connection.execute(text(f"DROP SCHEMA IF EXISTS {schema} CASCADE"))
+
+
+if __name__ == "__main__":
+    main()
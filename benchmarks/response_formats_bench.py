@@ -0,0 +1,123 @@
+"""
+Response formats benchmark for Finance Tracker API.
+
+This script compares the payload size and encode time of a transaction list
+page in the formats offered by ``services.response_formats`` against the
+``Pagination`` JSON returned by ``get_transactions`` before content
+negotiation was added.
+
+Formats:
+- pagination json: ``Pagination`` model serialized by FastAPI's JSON response
+- msgpack: the same structure encoded as MessagePack
+- columnar json: one array per field, categories in a lookup table
+- columnar msgpack: the columnar shape encoded as MessagePack
+
+For each page size the raw and gzip-compressed sizes in bytes and the median
+encode time over ``--repeat`` runs are printed. Pages are built from synthetic
+transactions spread over ``--categories`` categories; no database is needed.
+
+Usage:
+    python -m benchmarks.response_formats_bench [--sizes 20,100,1000,10000]
+        [--categories 15] [--repeat 20]
+"""
+
+import argparse
+import gzip
+import random
+import statistics
+import time
+from datetime import datetime, timedelta, timezone
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from schemas.pagination_schema import Pagination
+from schemas.transaction_schema import TransactionResponse
+from services.response_formats import (
+    COLUMNAR_JSON,
+    COLUMNAR_MSGPACK,
+    MSGPACK,
+    encode,
+    to_columnar,
+)
+
+COMMENTS = ("Lunch", "Groceries", "Taxi to the airport", "Salary", "", "Coffee")
+
+
+def build_page(size: int, categories: int):
+    """Build one page of synthetic transactions as plain dicts."""
+    random.seed(size)
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    names = [f"Category {index}" for index in range(1, categories + 1)]
+    items = []
+    for index in range(size):
+        category_id = random.randrange(1, categories + 1)
+        items.append(
+            {
+                "id": index + 1,
+                "category": {"name": names[category_id - 1], "id": category_id},
+                "date": start + timedelta(minutes=random.randrange(0, 525600)),
+                "amount": round(random.uniform(1, 500), 2),
+                "comment": random.choice(COMMENTS),
+                "type": "income" if random.random() < 0.2 else "expense",
+            }
+        )
+    return items
+
+
+def encode_pagination(items, envelope):
+    """Encode a page like the default ``response_model=Pagination`` path."""
+    pagination = Pagination(
+        content=[TransactionResponse(**item) for item in items], **envelope
+    )
+    return JSONResponse(content=jsonable_encoder(pagination)).body
+
+
+ENCODERS = {
+    "pagination json": encode_pagination,
+    "msgpack": lambda items, envelope: encode({**envelope, "content": items}, MSGPACK),
+    "columnar json": lambda items, envelope: encode(
+        {**envelope, **to_columnar(items)}, COLUMNAR_JSON
+    ),
+    "columnar msgpack": lambda items, envelope: encode(
+        {**envelope, **to_columnar(items)}, COLUMNAR_MSGPACK
+    ),
+}
+
+
+def measure(encoder, items, envelope, repeat: int):
+    """Encode a page ``repeat`` times and return the body and median time in ms."""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        body = encoder(items, envelope)
+        timings.append((time.perf_counter() - started) * 1000)
+    return body, statistics.median(timings)
+
+
+def main():
+    """Parse command line arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark list response formats.")
+    parser.add_argument("--sizes", default="20,100,1000,10000")
+    parser.add_argument("--categories", type=int, default=15)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    print(
+        f"{'page size':>9}  {'format':<18}{'bytes':>10}{'gzip bytes':>12}"
+        f"{'vs json':>9}{'encode ms':>11}"
+    )
+    for size in (int(value) for value in args.sizes.split(",")):
+        items = build_page(size, args.categories)
+        envelope = {"totalCount": size * 10, "page": 0, "size": size}
+        baseline = None
+        for name, encoder in ENCODERS.items():
+            body, encode_ms = measure(encoder, items, envelope, args.repeat)
+            baseline = baseline or len(body)
+            print(
+                f"{size:>9}  {name:<18}{len(body):>10}"
+                f"{len(gzip.compress(body)):>12}"
+                f"{len(body) / baseline:>9.2f}{encode_ms:>11.3f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
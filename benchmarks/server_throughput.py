@@ -0,0 +1,197 @@
+"""
+Server throughput benchmark for Finance Tracker API.
+
+This script starts the production server (``python -m serve``) with 1, 2, 4
+and 8 worker processes and measures request throughput and latency of an
+authenticated endpoint against the configured database.
+
+For every worker count the server is started on a free local port, warmed
+up, and then loaded for ``--duration`` seconds by ``--client-processes``
+load generator processes, each keeping ``--concurrency`` requests in flight
+over keep-alive connections. The load generators run on the same machine,
+so results are only comparable between runs on the same hardware; on
+machines with fewer cores than workers the extra workers mostly add
+contention.
+
+Requests are authenticated with a JWT for ``--user-id`` signed with the
+configured ``JWT_SECRET``; the user does not need to exist for endpoints
+that only filter by user ID.
+
+All load comes from one user, so the server is started with admission
+control switched off (``ADMISSION_OFF``); otherwise the per-user rate limit
+would turn most requests into 429 responses. Pass ``--admission`` to keep
+the configured limits and measure them instead. Throughput counts 2xx
+responses only; 429/503 rejections and other errors are reported separately.
+
+Usage:
+    python -m benchmarks.server_throughput [--workers 1,2,4,8]
+        [--path /api/v1/transaction-category/] [--user-id 1] [--duration 10]
+        [--concurrency 32] [--client-processes 2] [--admission]
+"""
+
+import argparse
+import asyncio
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta, timezone
+import httpx
+import jwt
+from config import get_settings
+
+# Settings that switch off rate limiting and load shedding in the server.
+ADMISSION_OFF = {
+    "RATE_LIMIT_PER_SECOND": "0",
+    "MAX_IN_FLIGHT_REQUESTS": "0",
+    "DB_POOL_QUEUE_THRESHOLD": "0",
+}
+REJECTED_STATUSES = (429, 503)
+
+
+def create_token(user_id: int):
+    """Sign a JWT for a user with the configured secret."""
+    settings = get_settings()
+    payload = {
+        "id": user_id,
+        "name": "benchmark",
+        "email": "benchmark@example.com",
+        "sub_id": "benchmark",
+        "picture": "",
+        "verified_email": True,
+        "exp": datetime.now(timezone.utc) + timedelta(hours=1),
+    }
+    return jwt.encode(payload, settings.jwt_secret, settings.jwt_algo)
+
+
+def free_port():
+    """Return a free local TCP port."""
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        return probe.getsockname()[1]
+
+
+def start_server(workers: int, port: int, admission: bool):
+    """Start ``python -m serve`` and wait until it answers requests."""
+    environment = dict(os.environ)
+    if not admission:
+        environment.update(ADMISSION_OFF)
+    server = subprocess.Popen(
+        [sys.executable, "-m", "serve", "--host", "127.0.0.1"]
+        + ["--port", str(port), "--workers", str(workers)],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        env=environment,
+    )
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        try:
+            httpx.get(f"http://127.0.0.1:{port}/docs", timeout=1)
+            return server
+        except httpx.TransportError:
+            time.sleep(0.2)
+    server.terminate()
+    raise RuntimeError(f"Server with {workers} workers did not start")
+
+
+async def generate_load(url: str, token: str, duration: float, concurrency: int):
+    """
+    Keep ``concurrency`` requests in flight for ``duration`` seconds.
+
+    Returns:
+        tuple: Latencies of the 2xx responses, number of 429/503 rejections
+            and number of other failed responses
+    """
+    latencies = []
+    rejected = 0
+    errors = 0
+    deadline = time.monotonic() + duration
+
+    async def worker(client):
+        nonlocal rejected, errors
+        while time.monotonic() < deadline:
+            started = time.perf_counter()
+            response = await client.get(url)
+            elapsed = time.perf_counter() - started
+            if response.is_success:
+                latencies.append(elapsed)
+            elif response.status_code in REJECTED_STATUSES:
+                rejected += 1
+            else:
+                errors += 1
+
+    limits = httpx.Limits(max_connections=concurrency)
+    async with httpx.AsyncClient(
+        cookies={"jwt_token": token}, limits=limits, timeout=30
+    ) as client:
+        await asyncio.gather(*(worker(client) for _ in range(concurrency)))
+    return latencies, rejected, errors
+
+
+def run_client(url: str, token: str, duration: float, concurrency: int):
+    """Run one load generator process."""
+    return asyncio.run(generate_load(url, token, duration, concurrency))
+
+
+def measure(url: str, token: str, args):
+    """Warm up the server, load it and return throughput and latency metrics."""
+    run_client(url, token, 1, args.concurrency)
+    with ProcessPoolExecutor(max_workers=args.client_processes) as executor:
+        futures = [
+            executor.submit(run_client, url, token, args.duration, args.concurrency)
+            for _ in range(args.client_processes)
+        ]
+        results = [future.result() for future in futures]
+    latencies = sorted(latency for result, _, _ in results for latency in result)
+    if not latencies:
+        raise RuntimeError(f"No successful responses from {url}")
+    return {
+        "rps": len(latencies) / args.duration,
+        "p50": statistics.median(latencies) * 1000,
+        "p99": latencies[int(len(latencies) * 0.99)] * 1000,
+        "rejected": sum(rejected for _, rejected, _ in results),
+        "errors": sum(errors for _, _, errors in results),
+    }
+
+
+def main():
+    """Parse command line arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark server throughput.")
+    parser.add_argument("--workers", default="1,2,4,8")
+    parser.add_argument("--path", default="/api/v1/transaction-category/")
+    parser.add_argument("--user-id", type=int, default=1)
+    parser.add_argument("--duration", type=float, default=10)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--client-processes", type=int, default=2)
+    parser.add_argument(
+        "--admission",
+        action="store_true",
+        help="keep the configured rate limits and load shedding",
+    )
+    args = parser.parse_args()
+
+    token = create_token(args.user_id)
+    print(f"cpu cores: {os.cpu_count()}, path: {args.path}")
+    print(
+        f"{'workers':>7}{'req/s':>10}{'p50 ms':>9}{'p99 ms':>9}"
+        f"{'rejected':>10}{'errors':>8}"
+    )
+    for workers in (int(value) for value in args.workers.split(",")):
+        port = free_port()
+        server = start_server(workers, port, args.admission)
+        try:
+            result = measure(f"http://127.0.0.1:{port}{args.path}", token, args)
+        finally:
+            server.terminate()
+            server.wait()
+        print(
+            f"{workers:>7}{result['rps']:>10.0f}{result['p50']:>9.1f}"
+            f"{result['p99']:>9.1f}{result['rejected']:>10}{result['errors']:>8}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+"""
+Transaction export benchmark for Finance Tracker API.
+
+This script compares the formats of ``GET /api/v1/transactions/export``
+(see ``services.transaction_export``): the Arrow IPC stream and Parquet
+against the CSV path.
+
+A ``bench_export`` schema of the configured database is filled with
+``--rows`` synthetic transactions of one user spread over ``--categories``
+categories. Every format is then streamed from a server-side cursor with the
+export's own query and encoder, in batches of ``--batch-size`` rows.
+
+For each format the median wall time over ``--repeat`` runs, the throughput,
+the export size, and the peak memory of one extra run are printed. Peak
+memory is the Python heap peak reported by ``tracemalloc`` plus the peak of
+the Arrow memory pool. It should stay roughly constant as ``--rows`` grows.
+
+Usage:
+    python -m benchmarks.transaction_export_bench [--rows 1000000]
+        [--categories 20] [--batch-size 10000] [--repeat 3] [--keep]
+"""
+
+import argparse
+import statistics
+import time
+import tracemalloc
+from datetime import datetime, timezone
+import pyarrow as pa
+from sqlalchemy import text
+from db.connect import get_engine
+from services.transaction_export import (
+    ARROW,
+    CSV,
+    PARQUET,
+    encode_batches,
+    export_statement,
+)
+
+SCHEMA = "bench_export"
+USER_ID = 1
+
+DDL = (
+    f"""
+    CREATE TABLE {SCHEMA}.transaction_categories (
+        id serial PRIMARY KEY,
+        user_id integer NOT NULL,
+        name varchar NOT NULL,
+        type varchar
+    )
+    """,
+    f"""
+    CREATE TABLE {SCHEMA}.transactions (
+        id serial PRIMARY KEY,
+        category_id integer NOT NULL,
+        wallet_id integer,
+        date timestamptz NOT NULL DEFAULT now(),
+        amount double precision NOT NULL,
+        comment varchar,
+        user_id integer NOT NULL,
+        type varchar NOT NULL
+    )
+    """,
+)
+
+
+def create_tables(connection, rows: int, categories: int):
+    """Create and fill the benchmark tables."""
+    connection.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+    connection.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+    for statement in DDL:
+        connection.execute(text(statement))
+
+    connection.execute(
+        text(
+            f"INSERT INTO {SCHEMA}.transaction_categories (user_id, name, type) "
+            "SELECT :user_id, 'Category ' || n, 'expense' "
+            "FROM generate_series(1, :categories) AS n"
+        ),
+        {"user_id": USER_ID, "categories": categories},
+    )
+    connection.execute(
+        text(
+            f"INSERT INTO {SCHEMA}.transactions "
+            "(category_id, wallet_id, date, amount, comment, user_id, type) "
+            "SELECT (random() * (:categories - 1))::int + 1, "
+            "  CASE WHEN random() < 0.5 THEN (random() * 4)::int + 1 END, "
+            "  :start + random() * interval '3650 days', "
+            "  round((random() * 500)::numeric, 2), "
+            "  CASE WHEN random() < 0.3 THEN 'Lunch with colleagues' END, "
+            "  :user_id, "
+            "  CASE WHEN random() < 0.8 THEN 'expense' ELSE 'income' END "
+            "FROM generate_series(1, :rows)"
+        ),
+        {
+            "categories": categories,
+            "start": datetime(2015, 1, 1, tzinfo=timezone.utc),
+            "user_id": USER_ID,
+            "rows": rows,
+        },
+    )
+    connection.execute(
+        text(f"CREATE INDEX ON {SCHEMA}.transactions (user_id, date, id)")
+    )
+    connection.execute(text(f"ANALYZE {SCHEMA}.transactions"))
+
+
+def export(export_format: str, batch_size: int):
+    """Stream one export and return its size in bytes."""
+    with get_engine().connect() as connection:
+        connection.execute(text(f"SET search_path TO {SCHEMA}"))
+        result = connection.execution_options(yield_per=batch_size).execute(
+            export_statement(USER_ID)
+        )
+        return sum(
+            len(chunk) for chunk in encode_batches(result.partitions(), export_format)
+        )
+
+
+def peak_memory(export_format: str, batch_size: int):
+    """Return the peak Python heap plus Arrow pool memory of one export in MB."""
+    pool = pa.default_memory_pool()
+    arrow_before = pool.max_memory() or 0
+    tracemalloc.start()
+    export(export_format, batch_size)
+    _, python_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    arrow_peak = max(0, (pool.max_memory() or 0) - arrow_before)
+    return (python_peak + arrow_peak) / 1e6
+
+
+def main():
+    """Parse command line arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark transaction exports.")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--categories", type=int, default=20)
+    parser.add_argument("--batch-size", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--keep", action="store_true", help="keep the benchmark schema afterwards"
+    )
+    args = parser.parse_args()
+
+    with get_engine().begin() as connection:
+        create_tables(connection, args.rows, args.categories)
+
+    print(
+        f"{'format':<9}{'median s':>10}{'rows/s':>12}{'MB':>9}"
+        f"{'vs csv':>8}{'peak MB':>9}"
+    )
+    baseline = None
+    for export_format in (CSV, ARROW, PARQUET):
+        timings = []
+        for _ in range(args.repeat):
+            started = time.perf_counter()
+            size = export(export_format, args.batch_size)
+            timings.append(time.perf_counter() - started)
+        seconds = statistics.median(timings)
+        baseline = baseline or seconds
+        print(
+            f"{export_format:<9}{seconds:>10.2f}{args.rows / seconds:>12.0f}"
+            f"{size / 1e6:>9.1f}{seconds / baseline:>8.2f}"
+            f"{peak_memory(export_format, args.batch_size):>9.1f}"
+        )
+
+    if not args.keep:
+        with get_engine().begin() as connection:
+            connection.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+
+
+if __name__ == "__main__":
+    main()
@@ -31,6 +31,14 @@ class Settings(BaseSettings):
     - Google OAuth2: Authentication provider configuration
     - JWT Security: Token generation and validation settings
     - Application URLs: API endpoints and redirect URLs
+    - Background Jobs: Batch sizes, worker counts and throttling
+    - Server: Worker processes, event loop, connection handling and the
+      database connection budget shared by the workers
+    - Admission Control: Per-user rate limits and load shedding thresholds
+    - Analytics: Parquet export and the embedded DuckDB report engine
+    - Administration: Operators allowed to use internal endpoints
+    - Live Updates: Delivery of server-sent change events between workers
+    - Profiling: Selection and storage of request profiles
 
     Attributes:
         fe_origins (str): Allowed CORS origins for frontend integration
@@ -41,6 +49,9 @@ class Settings(BaseSettings):
         db_name (str): Database name to connect to
         db_host (str): Database host address
         db_ssl_mode (str): SSL mode for database connections
+        db_url (str): Full primary database URL, overrides the individual parameters
+        db_replica_urls (str): Comma-separated database URLs of read replicas
+        read_your_writes_seconds (int): Seconds reads go to the primary after a user's write
         client_id (str): Google OAuth2 client ID
         client_secret (str): Google OAuth2 client secret
         redirect_url (str): OAuth2 redirect URL after authentication
@@ -51,6 +62,38 @@ class Settings(BaseSettings):
         google_user_info_url (str): Google user information API endpoint
         jwt_secret (str): Secret key for JWT token signing
         jwt_algo (str): Algorithm used for JWT token signing
+        recurring_job_chunk_size (int): Users processed per recurring-detection chunk
+        recurring_job_workers (int): Worker processes used for recurring detection
+        recurring_job_pause_seconds (float): Pause between recurring-detection chunks
+        recurring_job_lookback_days (int): Days of history scanned for recurrences
+        snapshot_cache_max_age (int): Cache lifetime in seconds for closed period summaries
+            (0 = clients revalidate with the ETag on every use)
+        server_host (str): Address the server binds to
+        server_port (int): Port the server listens on
+        server_workers (int): Worker processes (0 = one per CPU core)
+        server_loop (str): Event loop implementation ('auto', 'uvloop' or 'asyncio')
+        server_http (str): HTTP protocol implementation ('auto', 'httptools' or 'h11')
+        server_keep_alive_seconds (int): Idle keep-alive connection timeout in seconds
+        server_backlog (int): Maximum number of pending connections
+        server_graceful_timeout_seconds (int): Seconds to finish requests on shutdown
+        db_max_connections (int): Database connections all workers may open together
+        rate_limit_per_second (float): Requests per second a user may sustain per worker
+            (0 = unlimited)
+        rate_limit_burst (int): Requests a user may send at once before being throttled
+        max_in_flight_requests (int): Concurrent requests per worker (0 = unlimited)
+        db_pool_queue_threshold (int): Requests waiting for a database connection
+            before new requests are shed (0 = disabled)
+        analytics_dir (str): Directory of the Parquet files of the analytics engine
+        analytics_export_chunk_size (int): Rows per exported Parquet part file
+        analytics_threads (int): Threads DuckDB may use per worker process
+        admin_emails (str): Comma-separated verified emails of administrators
+        event_backend (str): Event delivery between workers ('memory' or 'postgres')
+        event_heartbeat_seconds (int): Seconds between keep-alive comments of event streams
+        profile_enabled (bool): Install request profiling (off = no overhead)
+        profile_dir (str): Directory the request profile reports are stored in
+        profile_sample_rate (float): Fraction of requests profiled at random (0 = none)
+        profile_user_ids (str): Comma-separated IDs of users whose requests are all profiled
+        profile_max_reports (int): Number of newest profile reports kept on disk
     """
 
     fe_origins: str
@@ -61,6 +104,9 @@ class Settings(BaseSettings):
     db_name: str
     db_host: str
     db_ssl_mode: str
+    db_url: str = ""
+    db_replica_urls: str = ""
+    read_your_writes_seconds: int = 5
     client_id: str
     client_secret: str
     redirect_url: str
@@ -71,6 +117,35 @@ class Settings(BaseSettings):
     google_user_info_url: str
     jwt_secret: str
     jwt_algo: str
+    recurring_job_chunk_size: int = 200
+    recurring_job_workers: int = 2
+    recurring_job_pause_seconds: float = 1.0
+    recurring_job_lookback_days: int = 730
+    snapshot_cache_max_age: int = 0
+    server_host: str = "0.0.0.0"
+    server_port: int = 8000
+    server_workers: int = 0
+    server_loop: str = "auto"
+    server_http: str = "auto"
+    server_keep_alive_seconds: int = 5
+    server_backlog: int = 2048
+    server_graceful_timeout_seconds: int = 30
+    db_max_connections: int = 15
+    rate_limit_per_second: float = 10.0
+    rate_limit_burst: int = 40
+    max_in_flight_requests: int = 100
+    db_pool_queue_threshold: int = 20
+    analytics_dir: str = "analytics_data"
+    analytics_export_chunk_size: int = 100000
+    analytics_threads: int = 2
+    admin_emails: str = ""
+    event_backend: str = "memory"
+    event_heartbeat_seconds: int = 15
+    profile_enabled: bool = False
+    profile_dir: str = "profiles"
+    profile_sample_rate: float = 0.0
+    profile_user_ids: str = ""
+    profile_max_reports: int = 200
     model_config = SettingsConfigDict(env_file=".env")
 
 
@@ -0,0 +1,150 @@
+"""
+Change tracking module for Finance Tracker API.
+
+This module installs the database side of the change feed (see
+``services.change_feed``) on the transactions, transaction categories and
+finance periods tables:
+
+- a ``row_version`` column defaulting to the ID of the inserting database
+  transaction (``pg_current_xact_id()``); rows that existed before get 0
+- a ``BEFORE UPDATE`` trigger that sets ``row_version`` to the ID of the
+  updating transaction
+- an ``AFTER DELETE`` trigger that writes a ``change_tombstones`` row,
+  named after the table it was created on (not the partition of the row)
+
+The triggers track every write, including those of jobs and manual SQL.
+Maintenance that moves rows without changing them (e.g. between partitions,
+see ``db.partitioning``) runs ``SET LOCAL finance.skip_change_tracking = on``
+first so the moves are not reported as deletions.
+
+The ``(user_id, row_version)`` indexes are declared on the models and built
+with ``python -m db.indexes`` afterwards.
+
+Usage:
+    python -m db.change_tracking
+"""
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+from db.connect import get_engine
+from db.models.change_tombstones_model import CURRENT_TRANSACTION_ID, ChangeTombstone
+
+TRACKED_TABLES = ("transactions", "transaction_categories", "finance_periods")
+SKIP_SETTING = "finance.skip_change_tracking"
+
+FUNCTIONS = (
+    f"""
+    CREATE OR REPLACE FUNCTION change_tracking_bump_version() RETURNS trigger AS $$
+    BEGIN
+        IF current_setting('{SKIP_SETTING}', true) IS DISTINCT FROM 'on' THEN
+            NEW.row_version := {CURRENT_TRANSACTION_ID};
+        END IF;
+        RETURN NEW;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+    f"""
+    CREATE OR REPLACE FUNCTION change_tracking_tombstone() RETURNS trigger AS $$
+    BEGIN
+        IF current_setting('{SKIP_SETTING}', true) IS DISTINCT FROM 'on' THEN
+            INSERT INTO change_tombstones (user_id, entity, entity_id)
+            VALUES (OLD.user_id::integer, TG_ARGV[0], OLD.id);
+        END IF;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+)
+
+
+def skip_change_tracking(connection: Connection):
+    """
+    Stop reporting writes to the change feed until the end of the transaction.
+
+    Args:
+        connection (Connection): Database connection inside a transaction
+    """
+    connection.execute(text(f"SET LOCAL {SKIP_SETTING} = on"))
+
+
+def track_table(connection: Connection, table: str):
+    """
+    Add the ``row_version`` column and the triggers to a table.
+
+    Safe to run again, e.g. after the table was recreated.
+
+    Args:
+        connection (Connection): Database connection inside a transaction
+        table (str): Name of the table (one of ``TRACKED_TABLES``)
+    """
+    # Existing rows get version 0, new rows the ID of their transaction.
+    connection.execute(
+        text(
+            f"ALTER TABLE {table} "
+            f"ADD COLUMN IF NOT EXISTS row_version bigint NOT NULL DEFAULT 0"
+        )
+    )
+    connection.execute(
+        text(
+            f"ALTER TABLE {table} "
+            f"ALTER COLUMN row_version SET DEFAULT {CURRENT_TRANSACTION_ID}"
+        )
+    )
+    connection.execute(text(f"DROP TRIGGER IF EXISTS {table}_bump_version ON {table}"))
+    connection.execute(
+        text(
+            f"CREATE TRIGGER {table}_bump_version BEFORE UPDATE ON {table} "
+            f"FOR EACH ROW EXECUTE FUNCTION change_tracking_bump_version()"
+        )
+    )
+    connection.execute(text(f"DROP TRIGGER IF EXISTS {table}_tombstone ON {table}"))
+    connection.execute(
+        text(
+            f"CREATE TRIGGER {table}_tombstone AFTER DELETE ON {table} "
+            f"FOR EACH ROW EXECUTE FUNCTION change_tracking_tombstone('{table}')"
+        )
+    )
+
+
+def is_tracked(connection: Connection, table: str):
+    """
+    Check whether a table already has the ``row_version`` column.
+
+    Args:
+        connection (Connection): Database connection
+        table (str): Name of the table
+
+    Returns:
+        bool: True if change tracking was installed on the table
+    """
+    return connection.execute(
+        text(
+            "SELECT EXISTS (SELECT 1 FROM information_schema.columns "
+            "WHERE table_name = :table AND column_name = 'row_version')"
+        ),
+        {"table": table},
+    ).scalar()
+
+
+def install(connection: Connection):
+    """
+    Install change tracking on all tracked tables.
+
+    Args:
+        connection (Connection): Database connection inside a transaction
+    """
+    ChangeTombstone.__table__.create(connection, checkfirst=True)
+    for function in FUNCTIONS:
+        connection.execute(text(function))
+    for table in TRACKED_TABLES:
+        track_table(connection, table)
+
+
+def main():
+    """Install change tracking on the configured database."""
+    with get_engine().begin() as connection:
+        install(connection)
+
+
+if __name__ == "__main__":
+    main()
@@ -6,28 +6,231 @@ Finance Tracker application using SQLAlchemy ORM. It handles database
 configuration, engine creation, session factory setup, and provides
 dependency injection for database sessions in FastAPI endpoints.
 
-The module configures a PostgreSQL database connection using environment
-variables and provides a generator function for database session management
+The module configures a PostgreSQL database connection from the application
+settings and provides a generator function for database session management
 with proper cleanup.
+
+Each worker process started by ``serve.py`` sizes its connection pools to
+its share of ``DB_MAX_CONNECTIONS`` (see ``pool_options``), so all workers
+together stay within the database's connection budget. A process started any
+other way (``uvicorn main:app``, jobs, scripts) uses the whole budget.
+
+Engines are not created at import time. ``init_db`` creates them from a
+``Settings`` instance; the application calls it from its lifespan (see
+``main.create_app``) and disposes them again with ``dispose_db`` on shutdown.
+Scripts and jobs use ``get_engine``, which initializes the engines from
+``get_settings()`` on first use.
+
+Read scaling:
+- Optional read replicas are configured with ``DB_REPLICA_URLS``
+- Sessions are ``RoutingSession`` instances that send reads of read-only
+  handlers (``get_read_db``) to one replica and everything else, including
+  every flush, to the primary
+- After a successful write the user is marked for a short read-your-writes
+  window during which ``get_read_db`` also uses the primary
 """
 
-from sqlalchemy import create_engine
+import os
+import random
+from fastapi import Request
+from sqlalchemy import Delete, Insert, Update, create_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
-from config import get_settings
+from sqlalchemy.orm import Session, sessionmaker
+from config import Settings, get_settings
+from services.cache import LRUCache
+
+engine = None
+replica_engines = []
+
+READ_YOUR_WRITES_COOKIE = "rw_primary"
+RECENT_WRITES_SIZE = 100000
 
+# Markers expire with the window; the least recently marked users are dropped
+# first when the cache is full (their cookie still keeps reads on the primary).
+_recent_writes = LRUCache(max_entries=RECENT_WRITES_SIZE)
+
+
+class RoutingSession(Session):
+    """
+    Session that routes reads to a replica and writes to the primary.
+
+    A session created with ``use_replica=True`` picks one replica engine for
+    its whole lifetime, so all reads of a request see the same snapshot of
+    data. Flushes and DML statements are always executed on the primary engine.
+    """
 
-env_variables = get_settings()
+    def __init__(self, *args, use_replica: bool = False, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.replica = (
+            random.choice(replica_engines) if use_replica and replica_engines else None
+        )
 
-DB_URL = f"postgresql://{env_variables.db_username}:{env_variables.db_password}@{env_variables.db_host}/{env_variables.db_name}"
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        """
+        Return the engine for the next statement.
 
-engine = create_engine(DB_URL)
+        Returns:
+            Engine: The session's replica for reads, the primary otherwise
+        """
+        if self.replica is not None and not (
+            self._flushing or isinstance(clause, (Insert, Update, Delete))
+        ):
+            return self.replica
+        return get_engine()
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+SessionLocal = sessionmaker(class_=RoutingSession, autocommit=False, autoflush=False)
 
 Base = declarative_base()
 
 
+def database_url(settings: Settings):
+    """
+    Build the URL of the primary database.
+
+    Args:
+        settings (Settings): Application settings
+
+    Returns:
+        str: ``DB_URL`` if set, otherwise a URL built from the individual parameters
+    """
+    return (
+        settings.db_url
+        or f"postgresql://{settings.db_username}:{settings.db_password}@{settings.db_host}/{settings.db_name}"
+    )
+
+
+def worker_count(settings: Settings):
+    """
+    Return the number of server worker processes.
+
+    Args:
+        settings (Settings): Application settings
+
+    Returns:
+        int: ``SERVER_WORKERS``, or the number of CPU cores if it is 0
+    """
+    return settings.server_workers or os.cpu_count() or 1
+
+
+def pool_options(settings: Settings):
+    """
+    Size the connection pool of one worker process.
+
+    ``serve.py`` exports the resolved worker count as ``SERVER_WORKERS`` and
+    every worker gets an equal share of ``DB_MAX_CONNECTIONS``. When it is 0
+    the process is assumed to be the only one and gets the whole budget. A
+    third of the share is kept open in the pool; the rest is opened on demand
+    as overflow and closed again when it is returned.
+
+    Args:
+        settings (Settings): Application settings
+
+    Returns:
+        dict: ``pool_size`` and ``max_overflow`` for ``create_engine``
+
+    Raises:
+        ValueError: If there are more workers than ``DB_MAX_CONNECTIONS``
+    """
+    workers = settings.server_workers or 1
+    if workers > settings.db_max_connections:
+        raise ValueError(
+            f"{workers} workers need at least {workers} database connections, "
+            f"DB_MAX_CONNECTIONS is {settings.db_max_connections}"
+        )
+    share = settings.db_max_connections // workers
+    pool_size = max(1, share // 3)
+    return {"pool_size": pool_size, "max_overflow": share - pool_size}
+
+
+def init_db(settings: Settings = None):
+    """
+    Create the primary and replica engines.
+
+    Engines created by an earlier call are disposed first, so the database
+    can be swapped by calling this function with other settings.
+
+    Args:
+        settings (Settings, optional): Application settings. Defaults to ``get_settings()``
+
+    Returns:
+        Engine: The primary engine
+    """
+    global engine, replica_engines
+    settings = settings or get_settings()
+    dispose_db()
+
+    engine = create_engine(database_url(settings), **pool_options(settings))
+    replica_engines = [
+        create_engine(url.strip(), **pool_options(settings))
+        for url in settings.db_replica_urls.split(",")
+        if url.strip()
+    ]
+    SessionLocal.configure(bind=engine)
+    return engine
+
+
+def dispose_db():
+    """Close the connection pools of all engines and forget the engines."""
+    global engine, replica_engines
+    for existing_engine in [engine, *replica_engines]:
+        if existing_engine is not None:
+            existing_engine.dispose()
+    engine = None
+    replica_engines = []
+
+
+def get_engine():
+    """
+    Return the primary engine, creating the engines on first use.
+
+    Returns:
+        Engine: The primary engine
+    """
+    return engine if engine is not None else init_db()
+
+
+def mark_user_write(user_id: int, window_seconds: float):
+    """
+    Start the read-your-writes window of a user.
+
+    Args:
+        user_id (int): ID of the user who has just written data
+        window_seconds (float): Length of the window in seconds
+    """
+    _recent_writes.set(user_id, True, ttl_seconds=window_seconds)
+
+
+def has_recent_write(user_id: int):
+    """
+    Check whether a user is inside their read-your-writes window.
+
+    Args:
+        user_id (int): ID of the user to check
+
+    Returns:
+        bool: True if the user wrote data within the window
+    """
+    return _recent_writes.get(user_id, False)
+
+
+def in_read_your_writes_window(request: Request):
+    """
+    Check whether the user of a request has written data very recently.
+
+    Args:
+        request (Request): The HTTP request object containing user authentication info
+
+    Returns:
+        bool: True if reads of the request must see the user's latest writes
+    """
+    user = getattr(request.state, "user_info", None)
+    return bool(
+        request.cookies.get(READ_YOUR_WRITES_COOKIE)
+        or (user and has_recent_write(user["id"]))
+    )
+
+
 def get_db():
     """
     Database session dependency for FastAPI endpoints.
@@ -64,3 +267,29 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+def get_read_db(request: Request):
+    """
+    Database session dependency for read-only FastAPI endpoints.
+
+    This works like ``get_db`` but routes the session's reads to a read
+    replica when replicas are configured. Requests of a user inside their
+    read-your-writes window are served by the primary instead, so users
+    always see the data they have just created. The window is tracked both
+    in this process and with a short-lived cookie, so it also holds when the
+    next request is handled by another worker.
+
+    Args:
+        request (Request): The HTTP request object containing user authentication info
+
+    Yields:
+        Session: SQLAlchemy database session for read operations
+    """
+    use_replica = bool(replica_engines) and not in_read_your_writes_window(request)
+    db = SessionLocal(use_replica=use_replica)
+
+    try:
+        yield db
+    finally:
+        db.close()
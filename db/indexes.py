@@ -0,0 +1,85 @@
+"""
+Index management module for Finance Tracker API.
+
+The database schema is managed outside the application, so indexes that are
+added to the models with ``__table_args__`` are not created automatically on
+existing databases. This module creates every index declared on the models
+that does not exist yet.
+
+Indexes are built with ``CREATE INDEX CONCURRENTLY`` where PostgreSQL allows
+it, so the tables stay writable while they are built. Partitioned tables
+(see ``db.partitioning``) do not support concurrent builds; their indexes are
+created with a regular ``CREATE INDEX`` that also builds them on every
+partition.
+
+Usage:
+    python -m db.indexes
+"""
+
+import importlib
+import logging
+import pkgutil
+from sqlalchemy import MetaData, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.schema import CreateIndex
+from db.connect import Base, get_engine
+import db.models
+
+logger = logging.getLogger(__name__)
+
+
+def load_models():
+    """Import every model module so that all tables are registered on ``Base``."""
+    for module in pkgutil.iter_modules(db.models.__path__):
+        importlib.import_module(f"db.models.{module.name}")
+
+
+def create_missing_indexes(connection: Connection):
+    """
+    Create the model indexes that are missing in the database.
+
+    Args:
+        connection (Connection): Database connection in autocommit mode
+
+    Returns:
+        list: Names of the created indexes
+    """
+    created = []
+    for table in Base.metadata.sorted_tables:
+        relkind = connection.execute(
+            text("SELECT relkind FROM pg_class WHERE oid = to_regclass(:table)"),
+            {"table": table.name},
+        ).scalar()
+        if relkind is None:
+            continue
+
+        # Indexes are built from a copy of the table, so the concurrent build
+        # option never reaches the models (``create_all`` would then emit
+        # CREATE INDEX CONCURRENTLY inside a transaction).
+        indexes = table.to_metadata(MetaData()).indexes
+        for index in sorted(indexes, key=lambda index: index.name):
+            exists = connection.execute(
+                text("SELECT to_regclass(:name) IS NOT NULL"), {"name": index.name}
+            ).scalar()
+            if exists:
+                continue
+            if relkind != "p":
+                index.dialect_options["postgresql"]["concurrently"] = True
+            connection.execute(CreateIndex(index))
+            created.append(index.name)
+    return created
+
+
+def main():
+    """Create the missing model indexes and log their names."""
+    logging.basicConfig(level=logging.INFO)
+    load_models()
+    with get_engine().connect().execution_options(
+        isolation_level="AUTOCOMMIT"
+    ) as connection:
+        for name in create_missing_indexes(connection):
+            logger.info("Created index %s", name)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Category spend statistics model for Finance Tracker API.
+
+This module defines the SQLAlchemy model for the streaming spend statistics
+of a user's transaction category. The statistics are updated in constant
+time whenever a transaction is created, so typical amounts and anomaly
+scores never have to be computed from the transaction history.
+"""
+
+from typing import List
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import Float, ForeignKey, Integer, text
+from sqlalchemy.dialects.postgresql import ARRAY
+from db.connect import Base
+
+
+class CategorySpendStats(Base):
+    """
+    SQLAlchemy model for per-user, per-category spend statistics.
+
+    The running mean and variance are kept with Welford's algorithm; the
+    amount distribution is kept in a log-bucketed sketch (see
+    ``services.category_spend_stats``).
+
+    Attributes:
+        user_id (int): Primary key, foreign key reference to the user
+        category_id (int): Primary key, foreign key reference to the category
+        count (int): Number of transactions recorded
+        mean (float): Running mean of the amounts
+        m2 (float): Running sum of squared deviations from the mean
+        sketch (List[int]): Number of amounts per logarithmic bucket
+
+    Table: category_spend_stats
+
+    Relationships:
+        - user_id -> users.id
+        - category_id -> transaction_categories.id
+    """
+
+    __tablename__ = "category_spend_stats"
+
+    user_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("users.id"), primary_key=True, nullable=False
+    )
+    category_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("transaction_categories.id"),
+        primary_key=True,
+        nullable=False,
+    )
+    count: Mapped[int] = mapped_column(
+        Integer, nullable=False, server_default=text("0")
+    )
+    mean: Mapped[float] = mapped_column(Float, nullable=False, server_default=text("0"))
+    m2: Mapped[float] = mapped_column(Float, nullable=False, server_default=text("0"))
+    sketch: Mapped[List[int]] = mapped_column(ARRAY(Integer), nullable=False)
@@ -0,0 +1,65 @@
+"""
+Change tombstones model for Finance Tracker API.
+
+This module defines the SQLAlchemy model for change tombstones in the
+Finance Tracker application, and the ``row_version`` column shared by the
+tables of the change feed (transactions, transaction categories and finance
+periods).
+
+``row_version`` holds the ID of the database transaction that last wrote the
+row (``pg_current_xact_id()``). Inserts take it from the column default and
+updates from a trigger; deletes leave a tombstone with the version of the
+deleting transaction. The triggers are installed with
+``python -m db.change_tracking`` (see ``services.change_feed``).
+"""
+
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import BigInteger, Index, Integer, String, text
+from db.connect import Base
+
+CURRENT_TRANSACTION_ID = "pg_current_xact_id()::text::bigint"
+
+
+def row_version_column():
+    """
+    Build the ``row_version`` column of a change-tracked table.
+
+    Returns:
+        MappedColumn: Non-null BIGINT defaulting to the current transaction ID
+    """
+    return mapped_column(
+        BigInteger, nullable=False, server_default=text(CURRENT_TRANSACTION_ID)
+    )
+
+
+class ChangeTombstone(Base):
+    """
+    SQLAlchemy model for deleted change-tracked rows.
+
+    Tombstones are written by the delete trigger of every change-tracked
+    table, so deletions are seen by the change feed no matter which code
+    path deleted the row.
+
+    Attributes:
+        id (int): Primary key identifier of the tombstone
+        user_id (int): ID of the user who owned the deleted row
+        entity (str): Table of the deleted row (e.g. 'transactions')
+        entity_id (int): Primary key of the deleted row
+        row_version (int): ID of the database transaction that deleted the row
+
+    Table: change_tombstones
+
+    Indexes:
+        - (user_id, row_version): changes of a user since a version
+    """
+
+    __tablename__ = "change_tombstones"
+    __table_args__ = (
+        Index("ix_change_tombstones_user_id_row_version", "user_id", "row_version"),
+    )
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, nullable=False)
+    user_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    entity: Mapped[str] = mapped_column(String, nullable=False)
+    entity_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    row_version: Mapped[int] = row_version_column()
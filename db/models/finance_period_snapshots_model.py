@@ -0,0 +1,49 @@
+"""
+Finance period snapshots model for Finance Tracker API.
+
+This module defines the SQLAlchemy model for finance period snapshots in the
+Finance Tracker application. A snapshot stores the aggregated summary of a
+finance period once the period has ended, so reports on closed periods do not
+have to recompute the totals from raw transactions.
+"""
+
+from datetime import datetime
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import JSON, TIMESTAMP, Integer, ForeignKey, text
+from db.connect import Base
+
+
+class FinancePeriodSnapshot(Base):
+    """
+    SQLAlchemy model for closed finance period snapshots.
+
+    Snapshots are created lazily the first time a closed period is summarised
+    and deleted when a backdated transaction lands inside the period.
+
+    Attributes:
+        period_id (int): Primary key, foreign key reference to the finance period
+        user_id (int): Foreign key reference to the user who owns the period
+        summary (dict): Per-category and per-type totals of the period
+        transaction_count (int): Number of transactions in the period
+        created_at (datetime): Timestamp when the snapshot was taken (defaults to current time)
+
+    Table: finance_period_snapshots
+
+    Relationships:
+        - period_id -> finance_periods.id
+        - user_id -> users.id
+    """
+
+    __tablename__ = "finance_period_snapshots"
+
+    period_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("finance_periods.id"), primary_key=True, nullable=False
+    )
+    user_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("users.id"), nullable=False, index=True
+    )
+    summary: Mapped[dict] = mapped_column(JSON, nullable=False)
+    transaction_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True), nullable=False, server_default=text("now()")
+    )
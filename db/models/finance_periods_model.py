@@ -14,9 +14,11 @@ from sqlalchemy import (
     Integer,
     String,
     ForeignKey,
+    Index,
     text,
 )
 from db.connect import Base
+from db.models.change_tombstones_model import row_version_column
 
 
 class FinancePeriod(Base):
@@ -34,14 +36,21 @@ class FinancePeriod(Base):
         date_start (datetime): Start date of the finance period (defaults to current time)
         date_end (datetime): End date of the finance period (defaults to current time)
         name (str): Descriptive name for the finance period (e.g., 'Q1 2024', 'January 2024')
+        row_version (int): ID of the database transaction that last wrote the row
 
     Table: finance_periods
 
     Relationships:
         - user_id -> users.id
+
+    Indexes:
+        - (user_id, row_version): change feed
     """
 
     __tablename__ = "finance_periods"
+    __table_args__ = (
+        Index("ix_finance_periods_user_id_row_version", "user_id", "row_version"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, nullable=False)
     user_id: Mapped[str] = mapped_column(String, ForeignKey("users.id"), nullable=False)
@@ -52,3 +61,4 @@ class FinancePeriod(Base):
         TIMESTAMP(timezone=True), nullable=False, server_default=text("now()")
     )
     name: Mapped[str] = mapped_column(String)
+    row_version: Mapped[int] = row_version_column()
@@ -0,0 +1,38 @@
+"""
+Job checkpoints model for Finance Tracker API.
+
+This module defines the SQLAlchemy model for background job checkpoints in
+the Finance Tracker application. Checkpoints record how far a batch job got
+so that an interrupted run can resume where it stopped.
+"""
+
+from datetime import datetime
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import Integer, String, TIMESTAMP, text
+from db.connect import Base
+
+
+class JobCheckpoint(Base):
+    """
+    SQLAlchemy model for background job checkpoints.
+
+    Jobs that scan users in ascending ID order store the last fully
+    processed user ID after every committed chunk.
+
+    Attributes:
+        name (str): Primary key, unique name of the job
+        last_user_id (int): ID of the last user processed in the current pass
+        updated_at (datetime): Timestamp of the last checkpoint (defaults to current time)
+
+    Table: job_checkpoints
+    """
+
+    __tablename__ = "job_checkpoints"
+
+    name: Mapped[str] = mapped_column(String, primary_key=True, nullable=False)
+    last_user_id: Mapped[int] = mapped_column(
+        Integer, nullable=False, server_default=text("0")
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True), nullable=False, server_default=text("now()")
+    )
@@ -0,0 +1,66 @@
+"""
+Recurring transactions model for Finance Tracker API.
+
+This module defines the SQLAlchemy model for recurring transactions in the
+Finance Tracker application. Recurring transactions are repeated payments
+(e.g., subscriptions, rent, salary) detected by the recurring-transaction
+detection job from the history in the transactions table.
+"""
+
+from datetime import datetime
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import Integer, String, TIMESTAMP, Float, text, ForeignKey
+from db.connect import Base
+
+
+class RecurringTransaction(Base):
+    """
+    SQLAlchemy model for detected recurring transactions.
+
+    This model stores the recurrences found by the detection job. Rows are
+    replaced for a user every time the job processes that user, so the table
+    always reflects the latest detection run.
+
+    Attributes:
+        id (int): Primary key identifier for the recurrence
+        user_id (int): Foreign key reference to the user who owns the transactions
+        category_id (int): Foreign key reference to the transaction category
+        amount (float): Typical (median) amount of the repeated transactions
+        cadence (str): Detected cadence (e.g., 'weekly', 'monthly', 'yearly')
+        interval_days (float): Median number of days between occurrences
+        occurrences (int): Number of matching transactions found
+        last_date (datetime): Date of the most recent occurrence
+        next_date (datetime): Expected date of the next occurrence
+        confidence (float): Regularity score of the recurrence (0-1)
+        detected_at (datetime): Timestamp of the detection run (defaults to current time)
+
+    Table: recurring_transactions
+
+    Relationships:
+        - user_id -> users.id
+        - category_id -> transaction_categories.id
+    """
+
+    __tablename__ = "recurring_transactions"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, nullable=False)
+    user_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("users.id"), nullable=False, index=True
+    )
+    category_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("transaction_categories.id"), nullable=False
+    )
+    amount: Mapped[float] = mapped_column(Float, nullable=False)
+    cadence: Mapped[str] = mapped_column(String, nullable=False)
+    interval_days: Mapped[float] = mapped_column(Float, nullable=False)
+    occurrences: Mapped[int] = mapped_column(Integer, nullable=False)
+    last_date: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True), nullable=False
+    )
+    next_date: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True), nullable=False
+    )
+    confidence: Mapped[float] = mapped_column(Float, nullable=False)
+    detected_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True), nullable=False, server_default=text("now()")
+    )
@@ -8,8 +8,9 @@ and organize transactions into meaningful groups (e.g., 'Food', 'Transportation'
 """
 
 from sqlalchemy.orm import Mapped, mapped_column
-from sqlalchemy import Integer, String, ForeignKey
+from sqlalchemy import Integer, String, ForeignKey, Index
 from db.connect import Base
+from db.models.change_tombstones_model import row_version_column
 
 
 class TransactionCategory(Base):
@@ -25,15 +26,24 @@ class TransactionCategory(Base):
         user_id (int): Foreign key reference to the user who owns this category
         name (str): Name of the category (e.g., 'Food', 'Transportation', 'Salary')
         type (str): Type of category (e.g., 'income', 'expense')
+        row_version (int): ID of the database transaction that last wrote the row
 
     Table: transaction_categories
 
     Relationships:
         - user_id -> users.id
         - Referenced by Transaction.category_id
+
+    Indexes:
+        - (user_id, row_version): change feed
     """
 
     __tablename__ = "transaction_categories"
+    __table_args__ = (
+        Index(
+            "ix_transaction_categories_user_id_row_version", "user_id", "row_version"
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, nullable=False)
     user_id: Mapped[int] = mapped_column(
@@ -41,3 +51,4 @@ class TransactionCategory(Base):
     )
     name: Mapped[str] = mapped_column(String, nullable=False)
     type: Mapped[str] = mapped_column(String)
+    row_version: Mapped[int] = row_version_column()
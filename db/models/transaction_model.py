@@ -9,7 +9,8 @@ date, amount, and comments.
 
 from datetime import datetime
 from sqlalchemy.orm import Mapped, mapped_column
-from sqlalchemy import Integer, String, TIMESTAMP, Float, text, ForeignKey
+from sqlalchemy import Integer, String, TIMESTAMP, Float, Index, text, ForeignKey
+from db.models.change_tombstones_model import row_version_column
 from db.models.wallets_model import Wallet
 from db.connect import Base
 
@@ -17,11 +18,11 @@ from db.connect import Base
 class Transaction(Base):
     """
     SQLAlchemy model for financial transactions.
-    
+
     This model represents individual financial movements (income or expenses)
     with associated metadata. It serves as the core entity for tracking
     all financial activities in the application.
-    
+
     Attributes:
         id (int): Primary key identifier for the transaction
         category_id (int): Foreign key reference to the transaction category
@@ -31,16 +32,31 @@ class Transaction(Base):
         comment (str, optional): Optional comment or description for the transaction
         user_id (int): Foreign key reference to the user who owns this transaction
         type (str): Type of transaction (e.g., 'income', 'expense')
-        
+        row_version (int): ID of the database transaction that last wrote the row
+
     Table: transactions
-    
+
     Relationships:
         - category_id -> transaction_categories.id
         - wallet_id -> wallets.id (optional)
         - user_id -> users.id
+
+    Indexes:
+        - (user_id, date, id): date ranges, periods and the date sort
+        - (user_id, amount, id): amount ranges and the amount sort
+        - (user_id, category_id, date): category filters
+        - (user_id, wallet_id, date): wallet filter
+        - (user_id, row_version): change feed
     """
 
     __tablename__ = "transactions"
+    __table_args__ = (
+        Index("ix_transactions_user_id_date", "user_id", "date", "id"),
+        Index("ix_transactions_user_id_amount", "user_id", "amount", "id"),
+        Index("ix_transactions_user_id_category_id", "user_id", "category_id", "date"),
+        Index("ix_transactions_user_id_wallet_id", "user_id", "wallet_id", "date"),
+        Index("ix_transactions_user_id_row_version", "user_id", "row_version"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, nullable=False)
     category_id: Mapped[int] = mapped_column(
@@ -58,3 +74,4 @@ class Transaction(Base):
         Integer, ForeignKey("users.id"), nullable=False
     )
     type: Mapped[str] = mapped_column(String, nullable=False)
+    row_version: Mapped[int] = row_version_column()
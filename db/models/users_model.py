@@ -8,7 +8,7 @@ categories, and finance periods.
 """
 
 from sqlalchemy.orm import Mapped, mapped_column
-from sqlalchemy import Integer, String, Boolean
+from sqlalchemy import Index, Integer, String, Boolean
 from db.connect import Base
 
 
@@ -29,6 +29,9 @@ class User(Base):
         verified_email (bool): Whether the user's email is verified (defaults to False)
         
     Table: users
+
+    Indexes:
+        - (sub_id), unique: user lookup on login
     
     Relationships:
         - Referenced by multiple models as the owner of financial data
@@ -36,6 +39,7 @@ class User(Base):
     """
 
     __tablename__ = "users"
+    __table_args__ = (Index("ix_users_sub_id", "sub_id", unique=True),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, nullable=False)
     name: Mapped[str] = mapped_column(String, nullable=False)
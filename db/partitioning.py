@@ -0,0 +1,254 @@
+"""
+Transactions table partitioning module for Finance Tracker API.
+
+This module converts the transactions table into a PostgreSQL table that is
+range partitioned by ``date`` with one partition per month, and keeps
+partitions for the coming months in place. Queries that filter on
+``Transaction.date`` (the period and date filters of ``get_transactions``)
+then only scan the partitions of the requested months.
+
+Layout:
+- ``transactions``: partitioned parent, primary key ``(id, date)``
+- ``transactions_yYYYYmMM``: one partition per calendar month (UTC)
+- ``transactions_default``: default partition for rows outside all months
+
+Creating a month partition moves any rows of that month out of the default
+partition first, so partitions can be added at any time. The moves are not
+reported to the change feed (see ``db.change_tracking``), and ``migrate``
+reinstalls change tracking on the new table if the old one had it.
+
+Usage:
+    python -m db.partitioning migrate [--months-ahead N] [--drop-old]
+    python -m db.partitioning ensure [--months-ahead N]
+
+``migrate`` converts an existing (possibly empty) unpartitioned table in one
+transaction and keeps the old table as ``transactions_unpartitioned`` unless
+``--drop-old`` is given. ``ensure`` creates the partitions of the current and
+the next months and is meant to run periodically (e.g. daily from cron).
+"""
+
+import argparse
+from datetime import date, datetime, timezone
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+from sqlalchemy.schema import CreateIndex
+from db.change_tracking import is_tracked, skip_change_tracking, track_table
+from db.connect import get_engine
+from db.models.transaction_model import Transaction
+
+TABLE = "transactions"
+OLD_TABLE = "transactions_unpartitioned"
+DEFAULT_PARTITION = "transactions_default"
+FOREIGN_KEYS = (
+    ("category_id", "transaction_categories"),
+    ("wallet_id", "wallets"),
+    ("user_id", "users"),
+)
+
+
+def add_months(month: date, months: int):
+    """
+    Shift the first day of a month by a number of months.
+
+    Args:
+        month (date): First day of a month
+        months (int): Number of months to add (may be negative)
+
+    Returns:
+        date: First day of the resulting month
+    """
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date):
+    """
+    Build the name of the partition holding a month.
+
+    Args:
+        month (date): First day of the month
+
+    Returns:
+        str: Partition table name (e.g. ``transactions_y2024m01``)
+    """
+    return f"{TABLE}_y{month.year:04d}m{month.month:02d}"
+
+
+def is_partitioned(connection: Connection):
+    """
+    Check whether the transactions table is already partitioned.
+
+    Args:
+        connection (Connection): Database connection
+
+    Returns:
+        bool: True if ``transactions`` is a partitioned table
+    """
+    relkind = connection.execute(
+        text("SELECT relkind FROM pg_class WHERE oid = to_regclass(:table)"),
+        {"table": TABLE},
+    ).scalar()
+    return relkind == "p"
+
+
+def create_month_partition(connection: Connection, month: date):
+    """
+    Create the partition of a month if it does not exist yet.
+
+    Rows of the month that already landed in the default partition are moved
+    into the new partition before it is attached.
+
+    Args:
+        connection (Connection): Database connection inside a transaction
+        month (date): First day of the month
+    """
+    name = partition_name(month)
+    exists = connection.execute(
+        text("SELECT to_regclass(:name) IS NOT NULL"), {"name": name}
+    ).scalar()
+    if exists:
+        return
+
+    next_month = add_months(month, 1)
+    bounds = {
+        "start": datetime(month.year, month.month, 1, tzinfo=timezone.utc),
+        "end": datetime(next_month.year, next_month.month, 1, tzinfo=timezone.utc),
+    }
+    connection.execute(
+        text(
+            f"CREATE TABLE {name} "
+            f"(LIKE {TABLE} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+        )
+    )
+    skip_change_tracking(connection)
+    connection.execute(
+        text(
+            f"WITH moved AS (DELETE FROM {DEFAULT_PARTITION} "
+            f"WHERE date >= :start AND date < :end RETURNING *) "
+            f"INSERT INTO {name} SELECT * FROM moved"
+        ),
+        bounds,
+    )
+    connection.execute(
+        text(
+            f"ALTER TABLE {TABLE} ATTACH PARTITION {name} FOR VALUES "
+            f"FROM ('{bounds['start'].isoformat()}') TO ('{bounds['end'].isoformat()}')"
+        )
+    )
+
+
+def ensure_future_partitions(connection: Connection, months_ahead: int = 3):
+    """
+    Create the partitions of the current month and the next months.
+
+    Args:
+        connection (Connection): Database connection inside a transaction
+        months_ahead (int): Number of months after the current one to create
+    """
+    today = datetime.now(timezone.utc).date()
+    current_month = date(today.year, today.month, 1)
+    for offset in range(months_ahead + 1):
+        create_month_partition(connection, add_months(current_month, offset))
+
+
+def migrate_to_partitioned(connection: Connection, months_ahead: int = 3):
+    """
+    Convert the unpartitioned transactions table into a partitioned one.
+
+    The table is locked, renamed to ``transactions_unpartitioned`` and
+    replaced by a partitioned table with the same columns, defaults, foreign
+    keys and indexes. Partitions are created for every month that has data
+    and for the coming months, then all rows are copied over. The ID sequence
+    is handed over to the new table so IDs keep increasing.
+
+    Args:
+        connection (Connection): Database connection inside a transaction
+        months_ahead (int): Number of future months to create partitions for
+    """
+    if is_partitioned(connection):
+        return
+
+    connection.execute(text(f"LOCK TABLE {TABLE} IN ACCESS EXCLUSIVE MODE"))
+    connection.execute(text(f"ALTER TABLE {TABLE} RENAME TO {OLD_TABLE}"))
+    # Index names are schema-wide, free them for the new table's indexes.
+    old_indexes = connection.scalars(
+        text("SELECT indexname FROM pg_indexes WHERE tablename = :table"),
+        {"table": OLD_TABLE},
+    ).all()
+    for index_name in old_indexes:
+        connection.execute(
+            text(f"ALTER INDEX {index_name} RENAME TO {index_name}_unpartitioned")
+        )
+    sequence = connection.execute(
+        text("SELECT pg_get_serial_sequence(:table, 'id')"), {"table": OLD_TABLE}
+    ).scalar()
+
+    connection.execute(
+        text(
+            f"CREATE TABLE {TABLE} "
+            f"(LIKE {OLD_TABLE} INCLUDING DEFAULTS INCLUDING CONSTRAINTS) "
+            f"PARTITION BY RANGE (date)"
+        )
+    )
+    connection.execute(text(f"ALTER TABLE {TABLE} ADD PRIMARY KEY (id, date)"))
+    for column, referenced_table in FOREIGN_KEYS:
+        connection.execute(
+            text(
+                f"ALTER TABLE {TABLE} ADD FOREIGN KEY ({column}) "
+                f"REFERENCES {referenced_table} (id)"
+            )
+        )
+    for index in Transaction.__table__.indexes:
+        connection.execute(CreateIndex(index, if_not_exists=True))
+    if sequence:
+        connection.execute(text(f"ALTER SEQUENCE {sequence} OWNED BY {TABLE}.id"))
+
+    connection.execute(
+        text(f"CREATE TABLE {DEFAULT_PARTITION} PARTITION OF {TABLE} DEFAULT")
+    )
+    first, last = connection.execute(
+        text(
+            f"SELECT date_trunc('month', min(date) AT TIME ZONE 'UTC')::date, "
+            f"date_trunc('month', max(date) AT TIME ZONE 'UTC')::date FROM {OLD_TABLE}"
+        )
+    ).one()
+    month = first
+    while month is not None and month <= last:
+        create_month_partition(connection, month)
+        month = add_months(month, 1)
+    ensure_future_partitions(connection, months_ahead)
+
+    connection.execute(text(f"INSERT INTO {TABLE} SELECT * FROM {OLD_TABLE}"))
+    if is_tracked(connection, OLD_TABLE):
+        track_table(connection, TABLE)
+    connection.execute(text(f"ANALYZE {TABLE}"))
+
+
+def main():
+    """Parse command line arguments and run a partitioning command."""
+    parser = argparse.ArgumentParser(description="Manage transactions partitions.")
+    parser.add_argument("command", choices=("migrate", "ensure"))
+    parser.add_argument(
+        "--months-ahead",
+        type=int,
+        default=3,
+        help="number of future monthly partitions to keep in place",
+    )
+    parser.add_argument(
+        "--drop-old",
+        action="store_true",
+        help="drop the old unpartitioned table after migrating",
+    )
+    args = parser.parse_args()
+
+    with get_engine().begin() as connection:
+        if args.command == "migrate":
+            migrate_to_partitioned(connection, args.months_ahead)
+            if args.drop_old:
+                connection.execute(text(f"DROP TABLE IF EXISTS {OLD_TABLE}"))
+        else:
+            ensure_future_partitions(connection, args.months_ahead)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,220 @@
+"""
+Analytics entity module for Finance Tracker API.
+
+This module provides API endpoints for spending analytics in the Finance
+Tracker application. Analytics are computed from columnar transaction data
+with vectorized NumPy operations so that multi-year histories are summarised
+within a single request.
+
+Endpoints:
+- GET /api/v1/analytics/spending: Retrieve spending statistics for the authenticated user
+- GET /api/v1/analytics/heatmap: Retrieve daily totals for a calendar heatmap
+- GET /api/v1/analytics/typical-spend: Retrieve typical amounts per category
+"""
+
+from datetime import date, datetime, timedelta, timezone
+from typing import Optional
+from fastapi import APIRouter, HTTPException, Depends, Query, Request, status
+from sqlalchemy.orm import Session
+from db.connect import get_read_db
+from schemas.analytics_schema import (
+    SpendingHeatmapResponse,
+    SpendingStatisticsResponse,
+    TypicalSpendResponse,
+)
+from services.category_spend_stats import typical_spend
+from services.profiling import ProfiledRoute
+from services.spending_heatmap import (
+    MAX_HEATMAP_DAYS,
+    dense_daily_series,
+    load_daily_totals,
+)
+
+router = APIRouter(
+    prefix="/api/v1/analytics", tags=["Analytics"], route_class=ProfiledRoute
+)
+
+# UTC-14:00 to UTC+14:00 covers every timezone in use.
+MAX_TZ_OFFSET = 840
+
+
+@router.get("/spending", response_model=SpendingStatisticsResponse)
+def get_spending_statistics(
+    request: Request,
+    db: Session = Depends(get_read_db),
+    movingAverageWindow: int = 3,
+    tzOffset: int = Query(0, ge=-MAX_TZ_OFFSET, le=MAX_TZ_OFFSET),
+):
+    """
+    Retrieve spending statistics for the authenticated user.
+
+    This endpoint returns monthly spend trends with a moving average,
+    per-category median and percentile transaction amounts, and weekday
+    and hour-of-day spending profiles. Only expense transactions are
+    included in the statistics.
+
+    Args:
+        request (Request): The HTTP request object containing user authentication info
+        db (Session): Database session dependency for data access
+        movingAverageWindow (int, optional): Months in the moving average. Defaults to 3
+        tzOffset (int, optional): User's timezone offset from UTC in minutes, between
+            ``-MAX_TZ_OFFSET`` and ``MAX_TZ_OFFSET``. Defaults to 0
+
+    Returns:
+        SpendingStatisticsResponse: Spending statistics for the user
+
+    Raises:
+        HTTPException: 500 Internal Server Error if database operation fails
+
+    Example:
+        GET /api/v1/analytics/spending?movingAverageWindow=3
+        Returns: {
+            "transactionCount": 2,
+            "monthly": {
+                "months": ["2024-01", "2024-02"],
+                "totals": [25.5, 40.0],
+                "counts": [1, 1],
+                "movingAverage": [null, null]
+            },
+            "categories": [
+                {
+                    "categoryId": 2,
+                    "count": 2,
+                    "total": 65.5,
+                    "mean": 32.75,
+                    "median": 32.75,
+                    "percentiles": {"p25": 29.125, "p50": 32.75, ...}
+                }
+            ],
+            "profile": {"weekday": [...], "hour": [...], "weekdayHour": [[...]]}
+        }
+    """
+    # NumPy is imported on first use to keep application startup fast.
+    from services.spending_stats import (
+        compute_spending_statistics,
+        load_spending_columns,
+    )
+
+    try:
+        user = request.state.user_info
+        columns = load_spending_columns(db, user["id"])
+        return compute_spending_statistics(columns, movingAverageWindow, tzOffset)
+    except Exception:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal Server Error",
+        )
+
+
+@router.get("/heatmap", response_model=SpendingHeatmapResponse)
+def get_spending_heatmap(
+    request: Request,
+    db: Session = Depends(get_read_db),
+    dateFrom: Optional[date] = None,
+    dateTo: Optional[date] = None,
+    type: str = "expense",
+    tzOffset: int = Query(0, ge=-MAX_TZ_OFFSET, le=MAX_TZ_OFFSET),
+):
+    """
+    Retrieve daily totals for a calendar heatmap.
+
+    This endpoint returns dense per-day totals and transaction counts of the
+    authenticated user for a range of local days. The totals are computed by
+    the database with one GROUP BY over the days, so a year of data is a few
+    kilobytes regardless of the number of transactions.
+
+    Args:
+        request (Request): The HTTP request object containing user authentication info
+        db (Session): Database session dependency for data access
+        dateFrom (date, optional): First day of the range. Defaults to 364 days
+            before ``dateTo``
+        dateTo (date, optional): Last day of the range. Defaults to today in the
+            user's timezone
+        type (str, optional): Transaction type to include (empty = all types).
+            Defaults to 'expense'
+        tzOffset (int, optional): User's timezone offset from UTC in minutes, between
+            ``-MAX_TZ_OFFSET`` and ``MAX_TZ_OFFSET``. Defaults to 0
+
+    Returns:
+        SpendingHeatmapResponse: Dense daily totals and counts
+
+    Raises:
+        HTTPException: 400 Bad Request if the range is empty or longer than five years
+        HTTPException: 500 Internal Server Error if database operation fails
+
+    Example:
+        GET /api/v1/analytics/heatmap?dateFrom=2024-01-01&dateTo=2024-01-03
+        Returns: {
+            "startDate": "2024-01-01",
+            "endDate": "2024-01-03",
+            "totals": [25.5, 0.0, 12.0],
+            "counts": [1, 0, 2],
+            "maxTotal": 25.5
+        }
+    """
+    if dateTo is None:
+        dateTo = (datetime.now(timezone.utc) + timedelta(minutes=tzOffset)).date()
+    if dateFrom is None:
+        dateFrom = dateTo - timedelta(days=364)
+    if not 0 <= (dateTo - dateFrom).days < MAX_HEATMAP_DAYS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"The range must cover 1 to {MAX_HEATMAP_DAYS} days",
+        )
+
+    try:
+        user = request.state.user_info
+        rows = load_daily_totals(db, user["id"], dateFrom, dateTo, tzOffset, type)
+        return dense_daily_series(rows, dateFrom, dateTo)
+    except Exception:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal Server Error",
+        )
+
+
+@router.get("/typical-spend", response_model=TypicalSpendResponse)
+def get_typical_spend(
+    request: Request, db: Session = Depends(get_read_db), categoryId: int = 0
+):
+    """
+    Retrieve typical transaction amounts per category.
+
+    The amounts come from the streaming statistics that are updated whenever
+    a transaction is created, so this endpoint reads one small row per
+    category instead of the transaction history.
+
+    Args:
+        request (Request): The HTTP request object containing user authentication info
+        db (Session): Database session dependency for data access
+        categoryId (int, optional): Only this category (0 = all). Defaults to 0
+
+    Returns:
+        TypicalSpendResponse: Count, mean, standard deviation and percentiles per category
+
+    Raises:
+        HTTPException: 500 Internal Server Error if database operation fails
+
+    Example:
+        GET /api/v1/analytics/typical-spend?categoryId=2
+        Returns: {
+            "categories": [
+                {
+                    "categoryId": 2,
+                    "count": 48,
+                    "mean": 23.4,
+                    "std": 9.1,
+                    "percentiles": {"p25": 16.2, "p50": 23.3, "p75": 28.0,
+                                    "p90": 33.6, "p99": 48.4}
+                }
+            ]
+        }
+    """
+    try:
+        user = request.state.user_info
+        return {"categories": typical_spend(db, user["id"], categoryId)}
+    except Exception:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal Server Error",
+        )
@@ -0,0 +1,153 @@
+"""
+Bootstrap entity module for Finance Tracker API.
+
+This module provides the startup endpoint of the frontend. Instead of
+requesting the user profile, the categories, the finance periods and the
+first transactions page separately, the dashboard loads them with one
+request: one pass through the middlewares, one JWT decode and one database
+connection for all sections.
+
+Every section has its own ETag. A client that sends the ETags it holds in
+``If-None-Match`` receives ``null`` for the unchanged sections, and those
+sections are not queried (see ``services.bootstrap``).
+
+Endpoints:
+- GET /api/v1/bootstrap/: Retrieve the data the dashboard needs on startup
+"""
+
+from fastapi import APIRouter, HTTPException, Depends, Request, Response, status
+from sqlalchemy.orm import Session
+from db.connect import get_read_db
+from db.models.finance_periods_model import FinancePeriod
+from db.models.transaction_categories_model import TransactionCategory
+from entities.transactions import TRANSACTION_FIELDS, load_transaction_page
+from schemas.bootstrap_schema import BootstrapResponse
+from services.bootstrap import parse_if_none_match, section_etag, section_versions
+from services.profiling import ProfiledRoute
+from services.transaction_filters import DEFAULT_SORT, transaction_order
+from services.user_cache import get_user_profile
+
+MAX_PAGE_SIZE = 100
+
+router = APIRouter(
+    prefix="/api/v1/bootstrap", tags=["Bootstrap"], route_class=ProfiledRoute
+)
+
+
+@router.get("/", response_model=BootstrapResponse)
+def get_bootstrap(
+    request: Request,
+    db: Session = Depends(get_read_db),
+    periodId: int = 0,
+    size: int = 20,
+):
+    """
+    Retrieve the data the dashboard needs on startup.
+
+    All sections are read on the request's database session. The section
+    versions are read first, so data that changes while the request runs is
+    returned with an older ETag and simply fetched again next time.
+
+    Args:
+        request (Request): The HTTP request object containing user authentication info
+        db (Session): Database session dependency for data access
+        periodId (int, optional): Finance period of the transactions page (0 = all).
+            Defaults to 0
+        size (int, optional): Number of transactions on the first page. Defaults to 20
+
+    Returns:
+        BootstrapResponse: The sections that changed and the ETags of all sections
+        Response: 304 Not Modified if the client holds the current ETags of all sections
+
+    Raises:
+        HTTPException: 400 Bad Request if the page size is out of range
+        HTTPException: 500 Internal Server Error if database operation fails
+
+    Example:
+        GET /api/v1/bootstrap/?size=20
+        If-None-Match: "5f1c0e2a9b7d4c3e8a6f", "0b9e4d7c2a1f8e6d5c3b"
+        Returns: {
+            "user": {"id": 1, "name": "Jane", ...},
+            "categories": null,
+            "periods": null,
+            "transactions": {"content": [...], "totalCount": 150, "page": 0, "size": 20},
+            "etags": {
+                "user": "...",
+                "categories": "5f1c0e2a9b7d4c3e8a6f",
+                "periods": "0b9e4d7c2a1f8e6d5c3b",
+                "transactions": "..."
+            }
+        }
+    """
+    if not 1 <= size <= MAX_PAGE_SIZE:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"size must be between 1 and {MAX_PAGE_SIZE}",
+        )
+
+    user = request.state.user_info
+    known = parse_if_none_match(request.headers.get("if-none-match", ""))
+    try:
+        profile = get_user_profile(db, user["id"])
+        versions = section_versions(db, user["id"])
+        etags = {
+            "user": section_etag(profile),
+            "categories": section_etag("categories", versions["categories"]),
+            "periods": section_etag("periods", versions["periods"]),
+            # The page embeds category names and may be limited to a period.
+            "transactions": section_etag(
+                "transactions",
+                versions["transactions"],
+                versions["categories"],
+                versions["periods"],
+                periodId,
+                size,
+            ),
+        }
+        if set(etags.values()) <= known:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED)
+
+        sections = {"etags": etags}
+        if etags["user"] not in known:
+            sections["user"] = profile
+        if etags["categories"] not in known:
+            sections["categories"] = [
+                row._asdict()
+                for row in db.query(
+                    TransactionCategory.id,
+                    TransactionCategory.name,
+                    TransactionCategory.type,
+                ).filter(TransactionCategory.user_id == user["id"])
+            ]
+        if etags["periods"] not in known:
+            sections["periods"] = [
+                row._asdict()
+                for row in db.query(
+                    FinancePeriod.id,
+                    FinancePeriod.date_start.label("startDate"),
+                    FinancePeriod.date_end.label("endDate"),
+                    FinancePeriod.name,
+                ).filter(FinancePeriod.user_id == user["id"])
+            ]
+        if etags["transactions"] not in known:
+            content, total_count = load_transaction_page(
+                db,
+                user["id"],
+                list(TRANSACTION_FIELDS),
+                transaction_order(DEFAULT_SORT),
+                0,
+                size,
+                period_id=periodId,
+            )
+            sections["transactions"] = {
+                "content": content,
+                "totalCount": total_count,
+                "page": 0,
+                "size": size,
+            }
+        return sections
+    except Exception:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal Server Error",
+        )
@@ -0,0 +1,81 @@
+"""
+Changes entity module for Finance Tracker API.
+
+This module provides the delta-sync endpoint of offline-first clients. A
+client stores the ``token`` of its last sync and, when it reconnects, asks
+for the transactions, transaction categories and finance periods that were
+created, updated or deleted since then (see ``services.change_feed``).
+
+A client without a token sends ``since=0`` once to receive all of its data.
+
+Endpoints:
+- GET /api/v1/changes/: Retrieve the changes since a sync token
+"""
+
+from fastapi import APIRouter, HTTPException, Depends, Request, status
+from sqlalchemy.orm import Session
+from db.connect import get_read_db
+from schemas.change_schema import ChangesResponse
+from services.change_feed import load_changes
+from services.profiling import ProfiledRoute
+
+router = APIRouter(
+    prefix="/api/v1/changes", tags=["Changes"], route_class=ProfiledRoute
+)
+
+
+@router.get("/", response_model=ChangesResponse)
+def get_changes(request: Request, since: int = 0, db: Session = Depends(get_read_db)):
+    """
+    Retrieve the authenticated user's changes since a sync token.
+
+    Deleted rows are listed by ID only. Apply the changes in the order
+    returned, then store ``token`` and send it as ``since`` on the next sync.
+
+    Args:
+        request (Request): The HTTP request object containing user authentication info
+        since (int, optional): ``token`` of the previous sync (0 = everything).
+            Defaults to 0
+        db (Session): Database session dependency for data access
+
+    Returns:
+        ChangesResponse: Changed rows, deleted IDs and the next token
+
+    Raises:
+        HTTPException: 400 Bad Request if the token is negative
+        HTTPException: 500 Internal Server Error if database operation fails
+
+    Example:
+        GET /api/v1/changes/?since=48213
+        Returns: {
+            "token": 48290,
+            "transactions": [
+                {
+                    "id": 12,
+                    "categoryId": 2,
+                    "walletId": null,
+                    "date": "2024-01-15T10:30:00Z",
+                    "amount": 25.5,
+                    "comment": "Lunch",
+                    "type": "expense"
+                }
+            ],
+            "categories": [],
+            "periods": [],
+            "deleted": {"transactions": [7], "categories": [], "periods": []}
+        }
+    """
+    if since < 0:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="since must be a token returned by a previous sync or 0",
+        )
+
+    user = request.state.user_info
+    try:
+        return load_changes(db, user["id"], since)
+    except Exception:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal Server Error",
+        )
@@ -0,0 +1,60 @@
+"""
+Diagnostics entity module for Finance Tracker API.
+
+This module provides operator diagnostics and is limited to administrators
+(see ``auth.admin``).
+
+The in-process caches (see ``services.cache``) keep their counters in the
+memory of each worker process. A request is answered by one worker, so
+repeated requests may show the counters of different workers; ``pid`` tells
+them apart.
+
+Endpoints:
+- GET /api/v1/diagnostics/caches: Hit, miss and eviction counters of the caches
+"""
+
+import os
+from fastapi import APIRouter, Depends
+from auth.admin import require_admin
+from schemas.diagnostics_schema import CacheStatsResponse
+from services.cache import CACHES
+from services.profiling import ProfiledRoute
+
+router = APIRouter(
+    prefix="/api/v1/diagnostics",
+    tags=["Diagnostics"],
+    dependencies=[Depends(require_admin)],
+    route_class=ProfiledRoute,
+)
+
+
+@router.get("/caches", response_model=CacheStatsResponse)
+def get_cache_stats():
+    """
+    Return the counters of the in-process caches of the answering worker.
+
+    Returns:
+        CacheStatsResponse: Counters keyed by cache name
+
+    Raises:
+        HTTPException: 403 Forbidden if the user is not an administrator
+
+    Example:
+        GET /api/v1/diagnostics/caches
+        Returns: {
+            "pid": 4121,
+            "caches": {
+                "transaction_pages": {
+                    "size": 812,
+                    "maxEntries": 5000,
+                    "hits": 10423,
+                    "misses": 3310,
+                    "evictions": 0
+                }
+            }
+        }
+    """
+    return CacheStatsResponse(
+        pid=os.getpid(),
+        caches={name: cache.stats() for name, cache in sorted(CACHES.items())},
+    )
@@ -0,0 +1,105 @@
+"""
+Events entity module for Finance Tracker API.
+
+This module provides the live update stream of the Finance Tracker frontend.
+The stream is authenticated by the same ``jwt_token`` cookie as every other
+endpoint and carries the events of the authenticated user only, as
+Server-Sent Events (``EventSource`` in the browser):
+
+- ``transaction.created``: a new transaction, as returned by ``POST /api/v1/transactions/``
+- ``period.totals``: ``periodId``, ``totals`` and ``transactionCount`` of a
+  period that contains a new transaction
+- ``category.created`` and ``period.created``: a new category or finance period
+- ``resync``: events may have been lost; refetch the data
+
+Events are distributed by ``services.events``. A comment line is sent every
+``EVENT_HEARTBEAT_SECONDS`` so proxies keep idle streams open.
+
+Endpoints:
+- GET /api/v1/events/: Stream the authenticated user's change events
+"""
+
+import asyncio
+import json
+from fastapi import APIRouter, Request
+from fastapi.responses import StreamingResponse
+from services.profiling import ProfiledRoute
+
+# Milliseconds the browser waits before reconnecting a closed stream.
+RECONNECT_MILLISECONDS = 3000
+
+router = APIRouter(prefix="/api/v1/events", tags=["Events"], route_class=ProfiledRoute)
+
+
+def format_event(event: dict):
+    """
+    Encode an event as a Server-Sent Events message.
+
+    Args:
+        event (dict): Event with ``event`` and ``data`` keys
+
+    Returns:
+        str: The message, terminated by a blank line
+    """
+    return f"event: {event['event']}\ndata: {json.dumps(event['data'])}\n\n"
+
+
+async def event_stream(bus, user_id: int, heartbeat_seconds: int):
+    """
+    Yield the messages of a user's event stream until it is closed.
+
+    Args:
+        bus (EventBus): Event bus of the application
+        user_id (int): ID of the authenticated user
+        heartbeat_seconds (int): Seconds between keep-alive comments
+
+    Yields:
+        str: Server-Sent Events messages
+    """
+    async with bus.subscribe(user_id) as queue:
+        yield f"retry: {RECONNECT_MILLISECONDS}\n\n"
+        while True:
+            try:
+                event = await asyncio.wait_for(queue.get(), heartbeat_seconds)
+            except asyncio.TimeoutError:
+                yield ": keep-alive\n\n"
+                continue
+            if event is None:
+                return
+            yield format_event(event)
+
+
+@router.get("/")
+async def stream_events(request: Request):
+    """
+    Stream the change events of the authenticated user.
+
+    The response stays open until the client disconnects or the server shuts
+    down. A client that falls too far behind receives a ``resync`` event and
+    the stream is closed; the browser then reconnects on its own.
+
+    Args:
+        request (Request): The HTTP request object containing user authentication info
+
+    Returns:
+        StreamingResponse: ``text/event-stream`` response
+
+    Example:
+        GET /api/v1/events/
+        Returns:
+            event: transaction.created
+            data: {"id": 12, "category_id": 2, "amount": 25.5, ...}
+
+            event: period.totals
+            data: {"periodId": 3, "totals": {"expense": 812.4}, "transactionCount": 41}
+    """
+    user = request.state.user_info
+    return StreamingResponse(
+        event_stream(
+            request.app.state.events,
+            user["id"],
+            request.app.state.settings.event_heartbeat_seconds,
+        ),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -9,24 +9,53 @@ data and transactions.
 Endpoints:
 - GET /api/v1/finance-period/: Retrieve all finance periods for the authenticated user
 - POST /api/v1/finance-period/: Create a new finance period
+- GET /api/v1/finance-period/comparison: Compare the totals of many periods side by side
+- GET /api/v1/finance-period/{period_id}/forecast: Project end-of-period totals per category
+- GET /api/v1/finance-period/{period_id}/summary: Retrieve the aggregated totals of a period
+
+The period list can be limited to a subset of fields with ``fields=`` (see
+``services.fieldsets``).
 """
 
-from typing import List
-from fastapi import APIRouter, HTTPException, Depends, Request, status
+from datetime import datetime
+from typing import List, Optional
+from fastapi import APIRouter, HTTPException, Depends, Request, Response, status
 from sqlalchemy.orm import Session
-from db.connect import get_db
+from db.connect import get_db, get_read_db
 from db.models.finance_periods_model import FinancePeriod
 from schemas.finance_period_schema import (
     FinancePeriodCreateResponse,
     FinancePeriodResponse,
     FinancePeriodCreate,
+    PeriodComparisonResponse,
+    PeriodForecastResponse,
+    PeriodSummaryResponse,
+)
+from services.fieldsets import is_sparse, parse_fields, row_to_item, select_columns
+from services.period_comparison import compare_periods, load_periods
+from services.period_snapshots import get_period_summary, summary_etag
+from services.profiling import ProfiledRoute
+from services.response_formats import render_list
+
+router = APIRouter(
+    prefix="/api/v1/finance-period", tags=["Finance Periods"], route_class=ProfiledRoute
 )
 
-router = APIRouter(prefix="/api/v1/finance-period", tags=["Finance Periods"])
+MAX_COMPARED_PERIODS = 240
+MAX_HISTORY_PERIODS = 24
+
+PERIOD_FIELDS = {
+    "id": FinancePeriod.id,
+    "startDate": FinancePeriod.date_start,
+    "endDate": FinancePeriod.date_end,
+    "name": FinancePeriod.name,
+}
 
 
 @router.get("/", response_model=List[FinancePeriodResponse])
-def get_finance_period(request: Request, db: Session = Depends(get_db)):
+def get_finance_period(
+    request: Request, db: Session = Depends(get_read_db), fields: str = ""
+):
     """
     Retrieve all finance periods for the authenticated user.
 
@@ -37,11 +66,14 @@ def get_finance_period(request: Request, db: Session = Depends(get_db)):
     Args:
         request (Request): The HTTP request object containing user authentication info
         db (Session): Database session dependency for data access
+        fields (str, optional): Comma separated fields to return (e.g. ``id,name``);
+            ``id`` is always included. Defaults to all fields
 
     Returns:
         List[FinancePeriodResponse]: List of finance periods with their details
 
     Raises:
+        HTTPException: 400 Bad Request if an unknown field is requested
         HTTPException: 500 Internal Server Error if database operation fails
 
     Example:
@@ -55,18 +87,21 @@ def get_finance_period(request: Request, db: Session = Depends(get_db)):
             }
         ]
     """
+    selected = parse_fields(fields, PERIOD_FIELDS)
     try:
         user = request.state.user_info
-        periods = db.query(FinancePeriod).filter_by(user_id=user["id"]).all()
-        return [
-            FinancePeriodResponse(
-                id=period.id,
-                startDate=period.date_start,
-                endDate=period.date_end,
-                name=period.name,
-            )
-            for period in periods
+        periods = [
+            row_to_item(period, selected, PERIOD_FIELDS)
+            for period in db.query(*select_columns(selected, PERIOD_FIELDS))
+            .filter(FinancePeriod.user_id == user["id"])
+            .all()
         ]
+        encoded = render_list(
+            request, periods, sparse=is_sparse(selected, PERIOD_FIELDS)
+        )
+        if encoded is not None:
+            return encoded
+        return [FinancePeriodResponse(**period) for period in periods]
     except Exception:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -83,7 +118,8 @@ def create_finance_period(
 
     This endpoint creates a new finance period with the specified time range
     and name. Finance periods help organize financial data into meaningful
-    time segments for tracking and analysis.
+    time segments for tracking and analysis. The new period is published to
+    the user's event streams.
 
     Args:
         period (FinancePeriodCreate): The finance period data including name and date range
@@ -122,7 +158,7 @@ def create_finance_period(
         db.commit()
         db.refresh(new_period)
 
-        return FinancePeriodCreateResponse(
+        response = FinancePeriodCreateResponse(
             id=new_period.id,
             name=new_period.name,
             startDate=new_period.date_start,
@@ -133,3 +169,267 @@ def create_finance_period(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Internal Server Error",
         )
+
+    request.app.state.events.publish(user["id"], "period.created", response, db=db)
+    return response
+
+
+@router.get("/comparison", response_model=PeriodComparisonResponse)
+def get_finance_period_comparison(
+    request: Request,
+    db: Session = Depends(get_read_db),
+    dateFrom: Optional[datetime] = None,
+    dateTo: Optional[datetime] = None,
+):
+    """
+    Compare the totals of the user's finance periods side by side.
+
+    All periods overlapping the date range are summarised together: closed
+    periods from their snapshots and all others with one range join of
+    periods and transactions (see ``services.period_comparison``), instead of
+    one query per period. Transactions in overlapping periods count towards
+    every period that contains them.
+
+    Args:
+        request (Request): The HTTP request object containing user authentication info
+        db (Session): Database session dependency for data access
+        dateFrom (datetime, optional): Only periods ending on or after this date.
+            Defaults to no bound
+        dateTo (datetime, optional): Only periods starting on or before this date.
+            Defaults to no bound
+
+    Returns:
+        PeriodComparisonResponse: Totals per type and per category of every period
+
+    Raises:
+        HTTPException: 400 Bad Request if the range is empty or matches more than
+            ``MAX_COMPARED_PERIODS`` periods
+        HTTPException: 500 Internal Server Error if database operation fails
+
+    Example:
+        GET /api/v1/finance-period/comparison?dateFrom=2024-01-01T00:00:00Z
+        Returns: {
+            "periods": [
+                {
+                    "periodId": 1,
+                    "name": "January 2024",
+                    "startDate": "2024-01-01T00:00:00Z",
+                    "endDate": "2024-01-31T23:59:59Z",
+                    "transactionCount": 42,
+                    "totals": {"expense": 1250.0, "income": 3000.0},
+                    "categories": [
+                        {"categoryId": 2, "type": "expense", "total": 320.5, "count": 12}
+                    ]
+                }
+            ]
+        }
+    """
+    if dateFrom is not None and dateTo is not None and dateFrom > dateTo:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="dateFrom must not be after dateTo",
+        )
+
+    user = request.state.user_info
+    try:
+        periods = load_periods(
+            db, user["id"], dateFrom, dateTo, limit=MAX_COMPARED_PERIODS + 1
+        )
+    except Exception:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal Server Error",
+        )
+
+    if len(periods) > MAX_COMPARED_PERIODS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"More than {MAX_COMPARED_PERIODS} periods match, narrow dateFrom/dateTo",
+        )
+
+    try:
+        return PeriodComparisonResponse(
+            periods=compare_periods(db, user["id"], periods)
+        )
+    except Exception:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal Server Error",
+        )
+
+
+@router.get("/{period_id}/forecast", response_model=PeriodForecastResponse)
+def get_finance_period_forecast(
+    period_id: int,
+    request: Request,
+    db: Session = Depends(get_read_db),
+    historyPeriods: int = 6,
+):
+    """
+    Project end-of-period spend and income per category for a finance period.
+
+    This endpoint extrapolates the amounts recorded so far in the period to
+    its end, both from the current pace and from how past windows of the same
+    length evolved after the same point. The history of all categories is
+    loaded in a single query and projected with vectorized math.
+
+    Args:
+        period_id (int): The ID of the finance period to forecast
+        request (Request): The HTTP request object containing user authentication info
+        db (Session): Database session dependency for data access
+        historyPeriods (int, optional): Number of past windows to learn from, between 1
+            and ``MAX_HISTORY_PERIODS``. Defaults to 6
+
+    Returns:
+        PeriodForecastResponse: Projections per category and per transaction type
+
+    Raises:
+        HTTPException: 400 Bad Request if historyPeriods is out of range
+        HTTPException: 404 Not Found if the period does not belong to the user
+        HTTPException: 500 Internal Server Error if database operation fails
+
+    Example:
+        GET /api/v1/finance-period/1/forecast?historyPeriods=6
+        Returns: {
+            "periodId": 1,
+            "elapsedFraction": 0.5,
+            "historyPeriods": 6,
+            "categories": [
+                {
+                    "categoryId": 2,
+                    "type": "expense",
+                    "amountSoFar": 120.0,
+                    "paceProjection": 240.0,
+                    "historyProjection": 225.0,
+                    "projected": 225.0,
+                    "low": 190.0,
+                    "high": 260.0
+                }
+            ],
+            "totals": [{"type": "expense", "amountSoFar": 120.0, ...}]
+        }
+    """
+    if not 1 <= historyPeriods <= MAX_HISTORY_PERIODS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"historyPeriods must be between 1 and {MAX_HISTORY_PERIODS}",
+        )
+
+    user = request.state.user_info
+    try:
+        period = (
+            db.query(FinancePeriod).filter_by(id=period_id, user_id=user["id"]).first()
+        )
+    except Exception:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal Server Error",
+        )
+
+    if not period:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Finance period not found",
+        )
+
+    # NumPy is imported on first use to keep application startup fast.
+    from services.period_forecast import forecast_period
+
+    try:
+        return forecast_period(db, user["id"], period, historyPeriods)
+    except Exception:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal Server Error",
+        )
+
+
+@router.get("/{period_id}/summary", response_model=PeriodSummaryResponse)
+def get_finance_period_summary(
+    period_id: int, request: Request, response: Response, db: Session = Depends(get_db)
+):
+    """
+    Retrieve the aggregated totals of a finance period.
+
+    Open periods are aggregated from their transactions on every request.
+    Closed periods are served from a frozen snapshot with an ``ETag`` built
+    from the summary, which changes only when a backdated transaction changes
+    the totals; a matching ``If-None-Match`` header is answered with 304 Not
+    Modified. Browsers revalidate on every use unless ``SNAPSHOT_CACHE_MAX_AGE``
+    allows them to keep the summary for a while.
+
+    Args:
+        period_id (int): The ID of the finance period to summarise
+        request (Request): The HTTP request object containing user authentication info
+        response (Response): The outgoing response used to set cache headers
+        db (Session): Database session dependency for data access
+
+    Returns:
+        PeriodSummaryResponse: Totals per type and per category of the period
+
+    Raises:
+        HTTPException: 404 Not Found if the period does not belong to the user
+        HTTPException: 500 Internal Server Error if database operation fails
+
+    Example:
+        GET /api/v1/finance-period/1/summary
+        Returns: {
+            "periodId": 1,
+            "closed": true,
+            "transactionCount": 42,
+            "totals": {"expense": 1250.0, "income": 3000.0},
+            "categories": [
+                {"categoryId": 2, "type": "expense", "total": 320.5, "count": 12}
+            ]
+        }
+    """
+    user = request.state.user_info
+    try:
+        period = (
+            db.query(FinancePeriod).filter_by(id=period_id, user_id=user["id"]).first()
+        )
+    except Exception:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal Server Error",
+        )
+
+    if not period:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Finance period not found",
+        )
+
+    try:
+        summary, snapshot = get_period_summary(db, user["id"], period)
+    except Exception:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal Server Error",
+        )
+
+    if snapshot is None:
+        response.headers["Cache-Control"] = "private, no-cache"
+    else:
+        etag = summary_etag(period.id, summary)
+        max_age = request.app.state.settings.snapshot_cache_max_age
+        # Without a max-age, browsers revalidate, so an invalidated snapshot
+        # is seen at once and an unchanged one costs a 304.
+        cache_control = (
+            f"private, max-age={max_age}" if max_age else "private, no-cache"
+        )
+        if request.headers.get("if-none-match") == etag:
+            return Response(
+                status_code=status.HTTP_304_NOT_MODIFIED,
+                headers={"ETag": etag, "Cache-Control": cache_control},
+            )
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = cache_control
+
+    return PeriodSummaryResponse(
+        periodId=period.id,
+        closed=snapshot is not None,
+        transactionCount=summary["transactionCount"],
+        totals=summary["totals"],
+        categories=summary["categories"],
+    )
@@ -0,0 +1,165 @@
+"""
+Profiles entity module for Finance Tracker API.
+
+This module lets administrators download the request profile reports
+stored on the local disk of the worker's host (see ``services.profiling``
+and ``middlewares.profiling_middleware``). Every worker on a host shares
+``PROFILE_DIR``; with several hosts, a report is only available on the host
+that served the profiled request.
+
+Endpoints:
+- GET /api/v1/profiles/: List the stored reports, newest first
+- GET /api/v1/profiles/{profile_id}: Download a report with its SQL statements
+- GET /api/v1/profiles/{profile_id}/pstats: Download the raw cProfile statistics
+"""
+
+import json
+from fastapi import APIRouter, HTTPException, Depends, Request, status
+from fastapi.responses import FileResponse
+from auth.admin import require_admin
+from schemas.profile_schema import ProfileListResponse
+from services.profiling import ProfiledRoute, ProfileStore
+
+router = APIRouter(
+    prefix="/api/v1/profiles",
+    tags=["Profiles"],
+    dependencies=[Depends(require_admin)],
+    route_class=ProfiledRoute,
+)
+
+
+def profile_store(request: Request):
+    """
+    Return the report directory of the application.
+
+    Args:
+        request (Request): The HTTP request object
+
+    Returns:
+        ProfileStore: Store of the configured ``PROFILE_DIR``
+    """
+    settings = request.app.state.settings
+    return ProfileStore(settings.profile_dir, settings.profile_max_reports)
+
+
+@router.get("/", response_model=ProfileListResponse)
+def list_profiles(request: Request):
+    """
+    List the stored request profile reports.
+
+    Args:
+        request (Request): The HTTP request object containing user authentication info
+
+    Returns:
+        ProfileListResponse: Summaries of the reports, newest first
+
+    Raises:
+        HTTPException: 403 Forbidden if the user is not an administrator
+        HTTPException: 500 Internal Server Error if the reports cannot be read
+
+    Example:
+        GET /api/v1/profiles/
+        Returns: {
+            "profiles": [
+                {
+                    "id": "3f2a9c1d7e4b8a60",
+                    "method": "GET",
+                    "path": "/api/v1/transactions/",
+                    "userId": 42,
+                    "trigger": "user",
+                    "status": 200,
+                    "startedAt": "2024-01-15T10:30:00+00:00",
+                    "milliseconds": 812.4,
+                    "sqlMilliseconds": 640.1,
+                    "statementCount": 3
+                }
+            ]
+        }
+    """
+    try:
+        profiles = []
+        for path in profile_store(request).list():
+            try:
+                report = json.loads(path.read_text())
+            except FileNotFoundError:
+                # Pruned by a concurrent save since it was listed.
+                continue
+            report["statementCount"] = len(report.pop("statements"))
+            profiles.append(report)
+        return ProfileListResponse(profiles=profiles)
+    except Exception:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal Server Error",
+        )
+
+
+def report_file(request: Request, profile_id: str, suffix: str):
+    """
+    Find a stored report file.
+
+    Args:
+        request (Request): The HTTP request object
+        profile_id (str): Report ID
+        suffix (str): ``.json`` or ``.prof``
+
+    Returns:
+        Path: Path of the file
+
+    Raises:
+        HTTPException: 404 Not Found if the report does not exist
+    """
+    path = profile_store(request).path(profile_id, suffix)
+    if path is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Profile not found",
+        )
+    return path
+
+
+@router.get("/{profile_id}")
+def get_profile(profile_id: str, request: Request):
+    """
+    Download a request profile report.
+
+    Args:
+        profile_id (str): Report ID, as returned in the ``X-Profile-Id`` header
+        request (Request): The HTTP request object containing user authentication info
+
+    Returns:
+        FileResponse: JSON report with the request details, the SQL statements and
+            the top of the call-stack profile (``stats``, None for async endpoints)
+
+    Raises:
+        HTTPException: 403 Forbidden if the user is not an administrator
+        HTTPException: 404 Not Found if the report does not exist
+    """
+    return FileResponse(
+        report_file(request, profile_id, ".json"), media_type="application/json"
+    )
+
+
+@router.get("/{profile_id}/pstats")
+def get_profile_stats(profile_id: str, request: Request):
+    """
+    Download the raw cProfile statistics of a request profile.
+
+    The file can be loaded with ``pstats.Stats`` or viewed with snakeviz.
+
+    Args:
+        profile_id (str): Report ID, as returned in the ``X-Profile-Id`` header
+        request (Request): The HTTP request object containing user authentication info
+
+    Returns:
+        FileResponse: The ``.prof`` file as a download
+
+    Raises:
+        HTTPException: 403 Forbidden if the user is not an administrator
+        HTTPException: 404 Not Found if the request had no call-stack profile
+    """
+    return FileResponse(
+        report_file(request, profile_id, ".prof"),
+        media_type="application/octet-stream",
+        filename=f"{profile_id}.prof",
+    )
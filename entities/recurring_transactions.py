@@ -0,0 +1,106 @@
+"""
+Recurring transactions entity module for Finance Tracker API.
+
+This module provides API endpoints for recurring transactions in the
+Finance Tracker application. Recurring transactions are detected offline
+by the recurring-transaction detection job (``jobs.recurring_detection``);
+the endpoints only read its stored results.
+
+Endpoints:
+- GET /api/v1/recurring-transactions/: Retrieve detected recurring transactions for the authenticated user
+
+The list can be limited to a subset of fields with ``fields=`` (see
+``services.fieldsets``).
+"""
+
+from typing import List
+from fastapi import APIRouter, HTTPException, Depends, Request, status
+from sqlalchemy.orm import Session
+from db.connect import get_read_db
+from db.models.recurring_transactions_model import RecurringTransaction
+from schemas.recurring_transaction_schema import RecurringTransactionResponse
+from services.fieldsets import is_sparse, parse_fields, row_to_item, select_columns
+from services.profiling import ProfiledRoute
+from services.response_formats import render_list
+
+router = APIRouter(
+    prefix="/api/v1/recurring-transactions",
+    tags=["Recurring Transactions"],
+    route_class=ProfiledRoute,
+)
+
+RECURRENCE_FIELDS = {
+    "id": RecurringTransaction.id,
+    "categoryId": RecurringTransaction.category_id,
+    "amount": RecurringTransaction.amount,
+    "cadence": RecurringTransaction.cadence,
+    "intervalDays": RecurringTransaction.interval_days,
+    "occurrences": RecurringTransaction.occurrences,
+    "lastDate": RecurringTransaction.last_date,
+    "nextDate": RecurringTransaction.next_date,
+    "confidence": RecurringTransaction.confidence,
+}
+
+
+@router.get("/", response_model=List[RecurringTransactionResponse])
+def get_recurring_transactions(
+    request: Request, db: Session = Depends(get_read_db), fields: str = ""
+):
+    """
+    Retrieve detected recurring transactions for the authenticated user.
+
+    This endpoint returns the recurrences found by the latest detection run
+    for the user, ordered by the expected date of their next occurrence.
+
+    Args:
+        request (Request): The HTTP request object containing user authentication info
+        db (Session): Database session dependency for data access
+        fields (str, optional): Comma separated fields to return (e.g. ``categoryId,amount,nextDate``);
+            ``id`` is always included. Defaults to all fields
+
+    Returns:
+        List[RecurringTransactionResponse]: List of detected recurring transactions
+
+    Raises:
+        HTTPException: 400 Bad Request if an unknown field is requested
+        HTTPException: 500 Internal Server Error if database operation fails
+
+    Example:
+        GET /api/v1/recurring-transactions/
+        Returns: [
+            {
+                "id": 1,
+                "categoryId": 4,
+                "amount": 9.99,
+                "cadence": "monthly",
+                "intervalDays": 30.5,
+                "occurrences": 12,
+                "lastDate": "2024-05-03T00:00:00Z",
+                "nextDate": "2024-06-02T12:00:00Z",
+                "confidence": 1.0
+            }
+        ]
+    """
+    selected = parse_fields(fields, RECURRENCE_FIELDS)
+    try:
+        user = request.state.user_info
+        recurrences = [
+            row_to_item(recurrence, selected, RECURRENCE_FIELDS)
+            for recurrence in db.query(*select_columns(selected, RECURRENCE_FIELDS))
+            .filter(RecurringTransaction.user_id == user["id"])
+            .order_by(RecurringTransaction.next_date)
+            .all()
+        ]
+        encoded = render_list(
+            request, recurrences, sparse=is_sparse(selected, RECURRENCE_FIELDS)
+        )
+        if encoded is not None:
+            return encoded
+        return [
+            RecurringTransactionResponse(**recurrence) for recurrence in recurrences
+        ]
+    except Exception:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal Server Error",
+        )
@@ -0,0 +1,150 @@
+"""
+Reports entity module for Finance Tracker API.
+
+This module provides the heavy, long-range report endpoints of the internal
+dashboards. They aggregate the data of all users and are therefore limited
+to administrators (see ``auth.admin``).
+
+The reports are computed by the DuckDB analytics engine over the Parquet
+export of the database (see ``services.analytics_engine`` and
+``jobs.analytics_export``), so they never load the PostgreSQL database that
+serves the other endpoints. Their data is as fresh as the last export run.
+
+Endpoints:
+- GET /api/v1/reports/category-breakdown: Totals per year, category and type
+- GET /api/v1/reports/monthly-flows: Expenses, incomes and capital per month
+"""
+
+from fastapi import APIRouter, HTTPException, Depends, Request, status
+from auth.admin import require_admin
+from schemas.report_schema import CategoryBreakdownResponse, MonthlyFlowsResponse
+from services.analytics_engine import AnalyticsDataMissing, analytics_cursor
+from services.analytics_reports import category_breakdown, monthly_flows
+from services.profiling import ProfiledRoute
+
+MAX_REPORT_YEARS = 20
+
+router = APIRouter(
+    prefix="/api/v1/reports",
+    tags=["Reports"],
+    dependencies=[Depends(require_admin)],
+    route_class=ProfiledRoute,
+)
+
+
+def check_year_range(year_from: int, year_to: int):
+    """
+    Validate the year range of a report.
+
+    Args:
+        year_from (int): First year of the report
+        year_to (int): Last year of the report
+
+    Raises:
+        HTTPException: 400 Bad Request if the range is empty or too long
+    """
+    if not 1 <= year_from <= year_to < year_from + MAX_REPORT_YEARS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"The range must cover 1 to {MAX_REPORT_YEARS} years",
+        )
+
+
+def run_report(request: Request, report, year_from: int, year_to: int):
+    """
+    Run a report on a new analytics cursor.
+
+    Args:
+        request (Request): The HTTP request object
+        report: Report function of ``services.analytics_reports``
+        year_from (int): First year of the report
+        year_to (int): Last year of the report
+
+    Returns:
+        The result of the report function
+
+    Raises:
+        HTTPException: 503 Service Unavailable if the data has not been exported yet
+        HTTPException: 500 Internal Server Error if the query fails
+    """
+    try:
+        with analytics_cursor(request.app.state.settings) as cursor:
+            return report(cursor, year_from, year_to)
+    except AnalyticsDataMissing:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Analytics data has not been exported yet",
+        )
+    except Exception:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal Server Error",
+        )
+
+
+@router.get("/category-breakdown", response_model=CategoryBreakdownResponse)
+def get_category_breakdown(request: Request, yearFrom: int, yearTo: int):
+    """
+    Retrieve transaction totals per year, category and type across all users.
+
+    Args:
+        request (Request): The HTTP request object containing user authentication info
+        yearFrom (int): First year of the report
+        yearTo (int): Last year of the report (inclusive)
+
+    Returns:
+        CategoryBreakdownResponse: Totals ordered by year and descending total
+
+    Raises:
+        HTTPException: 400 Bad Request if the range is empty or longer than 20 years
+        HTTPException: 403 Forbidden if the user is not an administrator
+        HTTPException: 503 Service Unavailable if the data has not been exported yet
+        HTTPException: 500 Internal Server Error if the query fails
+
+    Example:
+        GET /api/v1/reports/category-breakdown?yearFrom=2023&yearTo=2024
+        Returns: {
+            "yearFrom": 2023,
+            "yearTo": 2024,
+            "rows": [
+                {"year": 2023, "category": "food", "type": "expense",
+                 "total": 125000.0, "count": 5210, "users": 312}
+            ]
+        }
+    """
+    check_year_range(yearFrom, yearTo)
+    rows = run_report(request, category_breakdown, yearFrom, yearTo)
+    return {"yearFrom": yearFrom, "yearTo": yearTo, "rows": rows}
+
+
+@router.get("/monthly-flows", response_model=MonthlyFlowsResponse)
+def get_monthly_flows(request: Request, yearFrom: int, yearTo: int):
+    """
+    Retrieve expenses, incomes and capital movements per month across all users.
+
+    Args:
+        request (Request): The HTTP request object containing user authentication info
+        yearFrom (int): First year of the report
+        yearTo (int): Last year of the report (inclusive)
+
+    Returns:
+        MonthlyFlowsResponse: Dense monthly series
+
+    Raises:
+        HTTPException: 400 Bad Request if the range is empty or longer than 20 years
+        HTTPException: 403 Forbidden if the user is not an administrator
+        HTTPException: 503 Service Unavailable if the data has not been exported yet
+        HTTPException: 500 Internal Server Error if the query fails
+
+    Example:
+        GET /api/v1/reports/monthly-flows?yearFrom=2024&yearTo=2024
+        Returns: {
+            "months": ["2024-01", ..., "2024-12"],
+            "expenses": [52000.0, ...],
+            "incomes": [81000.0, ...],
+            "capital": [12000.0, ...],
+            "activeUsers": [290, ...]
+        }
+    """
+    check_year_range(yearFrom, yearTo)
+    return run_report(request, monthly_flows, yearFrom, yearTo)
@@ -9,25 +9,42 @@ and organize transactions into meaningful groups (e.g., 'Food', 'Transportation'
 Endpoints:
 - GET /api/v1/transaction-category/: Retrieve all transaction categories for the authenticated user
 - POST /api/v1/transaction-category/: Create a new transaction category
+
+The category list can be limited to a subset of fields with ``fields=`` (see
+``services.fieldsets``).
 """
 
 from fastapi import APIRouter, HTTPException, Depends, Request, status
 from sqlalchemy.orm import Session
-from db.connect import get_db
+from db.connect import get_db, get_read_db
 from typing import List
 from db.models.transaction_categories_model import TransactionCategory
 from schemas.transaction_category_schema import (
     TransactionCategoryResponse,
     TransactionCategoryCreate,
 )
+from services.category_cache import invalidate_category_lookup
+from services.fieldsets import is_sparse, parse_fields, row_to_item, select_columns
+from services.profiling import ProfiledRoute
+from services.response_formats import render_list
 
 router = APIRouter(
-    prefix="/api/v1/transaction-category", tags=["Transaction Categories"]
+    prefix="/api/v1/transaction-category",
+    tags=["Transaction Categories"],
+    route_class=ProfiledRoute,
 )
 
+CATEGORY_FIELDS = {
+    "id": TransactionCategory.id,
+    "name": TransactionCategory.name,
+    "type": TransactionCategory.type,
+}
+
 
 @router.get("/", response_model=List[TransactionCategoryResponse])
-def get_transaction_categories(request: Request, db: Session = Depends(get_db)):
+def get_transaction_categories(
+    request: Request, db: Session = Depends(get_read_db), fields: str = ""
+):
     """
     Retrieve all transaction categories for the authenticated user.
 
@@ -38,11 +55,14 @@ def get_transaction_categories(request: Request, db: Session = Depends(get_db)):
     Args:
         request (Request): The HTTP request object containing user authentication info
         db (Session): Database session dependency for data access
+        fields (str, optional): Comma separated fields to return (e.g. ``id,name``);
+            ``id`` is always included. Defaults to all fields
 
     Returns:
         List[TransactionCategoryResponse]: List of transaction categories with their details
 
     Raises:
+        HTTPException: 400 Bad Request if an unknown field is requested
         HTTPException: 500 Internal Server Error if database operation fails
 
     Example:
@@ -60,9 +80,21 @@ def get_transaction_categories(request: Request, db: Session = Depends(get_db)):
             }
         ]
     """
+    selected = parse_fields(fields, CATEGORY_FIELDS)
     try:
         user = request.state.user_info
-        return db.query(TransactionCategory).filter_by(user_id=user["id"]).all()
+        categories = [
+            row_to_item(category, selected, CATEGORY_FIELDS)
+            for category in db.query(*select_columns(selected, CATEGORY_FIELDS))
+            .filter(TransactionCategory.user_id == user["id"])
+            .all()
+        ]
+        encoded = render_list(
+            request, categories, sparse=is_sparse(selected, CATEGORY_FIELDS)
+        )
+        if encoded is not None:
+            return encoded
+        return categories
     except:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -79,7 +111,9 @@ def create_transaction_categories(
 
     This endpoint creates a new transaction category with the specified name
     and type. Transaction categories help organize transactions into meaningful
-    groups for better financial tracking and analysis.
+    groups for better financial tracking and analysis. The user's cached
+    category lookup is invalidated after the category is stored, and the
+    category is published to the user's event streams.
 
     Args:
         category (TransactionCategoryCreate): The category data including name and type
@@ -114,7 +148,8 @@ def create_transaction_categories(
         db.add(new_category)
         db.commit()
         db.refresh(new_category)
-        return TransactionCategoryResponse(
+        invalidate_category_lookup(user["id"])
+        response = TransactionCategoryResponse(
             id=new_category.id,
             name=new_category.name,
             type=new_category.type,
@@ -124,3 +159,6 @@ def create_transaction_categories(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Internal Server Error",
         )
+
+    request.app.state.events.publish(user["id"], "category.created", response, db=db)
+    return response
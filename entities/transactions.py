@@ -4,64 +4,138 @@ Transactions entity module for Finance Tracker API.
 This module provides API endpoints for managing financial transactions in the
 Finance Tracker application. Transactions represent individual financial
 movements (income or expenses) with associated metadata like category, date,
-amount, and comments. The module supports pagination and filtering by finance
-periods and categories.
+amount, and comments. The module supports pagination, filtering by finance
+periods, categories, type, wallet, amount and date ranges, and sorting by date
+or amount (see ``services.transaction_filters``).
 
 Endpoints:
 - GET /api/v1/transactions/: Retrieve paginated transactions with optional filtering
+- GET /api/v1/transactions/export: Export the full history as Arrow, Parquet or CSV
 - POST /api/v1/transactions/: Create a new transaction
+
+Creating a transaction publishes ``transaction.created`` and ``period.totals``
+events to the user's live event streams (see ``entities.events``).
+
+The transaction list also answers in MessagePack and columnar JSON when the
+client asks for them in the ``Accept`` header (see ``services.response_formats``)
+and can be limited to a subset of fields with ``fields=`` (see
+``services.fieldsets``). Pages are cached per user and invalidated by any
+write of the user (see ``services.result_cache``); the ``X-Cache`` response
+header tells whether a page was served from the cache.
 """
 
-from fastapi import APIRouter, HTTPException, Depends, Request, status
+from datetime import datetime
+from typing import List, Optional
+from fastapi import APIRouter, HTTPException, Depends, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from db.models.finance_periods_model import FinancePeriod
-from db.models.transaction_categories_model import TransactionCategory
 from db.models.transaction_model import Transaction
-from db.connect import get_db
+from db.connect import get_db, get_read_db, in_read_your_writes_window
 from schemas.pagination_schema import Pagination
 from schemas.transaction_schema import (
     TransactionCreate,
     TransactionCreateResponse,
     TransactionResponse,
 )
+from services.category_cache import get_category_lookup_for
+from services.category_spend_stats import record_amount
+from services.fieldsets import is_sparse, parse_fields, row_to_item, select_columns
+from services.period_snapshots import invalidate_period_snapshots, period_totals
+from services.profiling import ProfiledRoute
+from services.response_formats import render_list
+from services.result_cache import result_key, result_ttl_seconds, transaction_pages
+from services.transaction_export import ARROW, EXPORT_FORMATS, stream_export
+from services.transaction_filters import (
+    DEFAULT_SORT,
+    apply_transaction_filters,
+    transaction_order,
+)
 
-router = APIRouter(prefix="/api/v1/transactions", tags=["Posts"])
+router = APIRouter(
+    prefix="/api/v1/transactions", tags=["Posts"], route_class=ProfiledRoute
+)
+
+TRANSACTION_FIELDS = {
+    "id": Transaction.id,
+    "category": Transaction.category_id,
+    "date": Transaction.date,
+    "amount": Transaction.amount,
+    "comment": Transaction.comment,
+    "type": Transaction.type,
+}
 
 
 @router.get("/", response_model=Pagination)
 def get_transactions(
     request: Request,
-    db: Session = Depends(get_db),
+    response: Response,
+    db: Session = Depends(get_read_db),
     periodId: int = 0,
     page: int = 0,
     size: int = 20,
     categoryId: int = 0,
     date: str = "",
+    categoryIds: List[int] = Query(default=[]),
+    type: str = "",
+    walletId: int = 0,
+    amountMin: Optional[float] = None,
+    amountMax: Optional[float] = None,
+    dateFrom: Optional[datetime] = None,
+    dateTo: Optional[datetime] = None,
+    sort: str = DEFAULT_SORT,
+    fields: str = "",
 ):
     """
     Retrieve paginated transactions with optional filtering.
 
     This endpoint returns a paginated list of transactions for the authenticated
-    user with optional filtering by finance period and category. Transactions
-    are joined with their categories to provide complete information.
+    user with optional filtering and sorting. Every filter combination is served
+    by one of the transaction indexes. Only transaction
+    columns are selected; category names are attached from the per-user
+    category lookup cache instead of a join. Results are cached per user and
+    query until the user's next write, except inside the user's
+    read-your-writes window.
+
+    The response format follows the ``Accept`` header: regular JSON by default,
+    ``application/msgpack`` for the same structure as MessagePack, and
+    ``application/vnd.financetracker.columnar+json`` (or ``+msgpack``) for one
+    array per field with categories deduplicated into a lookup table.
 
     Args:
         request (Request): The HTTP request object containing user authentication info
+        response (Response): The outgoing response, used to set the ``Vary`` header
         db (Session): Database session dependency for data access
-        periodId (int, optional): Filter by finance period ID (0 = no filter). Defaults to 0
+        periodId (int, optional): Filter by finance period ID (0 = no filter). Periods that
+            do not belong to the user match no transactions. Defaults to 0
         page (int, optional): Page number for pagination (0-based). Defaults to 0
         size (int, optional): Number of items per page. Defaults to 20
-        date (str, optional): Filter by date. Defaults to empty string
+        date (str, optional): Filter by date range ``start;end``. Superseded by
+            ``dateFrom``/``dateTo``. Defaults to empty string
         categoryId (int, optional): Filter by category ID (0 = no filter). Defaults to 0
+        categoryIds (List[int], optional): Filter by any of several category IDs,
+            repeated as ``categoryIds=1&categoryIds=2``. Defaults to no filter
+        type (str, optional): Filter by transaction type (e.g. 'expense'). Defaults to
+            no filter
+        walletId (int, optional): Filter by wallet ID (0 = no filter). Defaults to 0
+        amountMin (float, optional): Inclusive minimum amount. Defaults to no bound
+        amountMax (float, optional): Inclusive maximum amount. Defaults to no bound
+        dateFrom (datetime, optional): Inclusive ISO 8601 start date. Defaults to no bound
+        dateTo (datetime, optional): Inclusive ISO 8601 end date. Defaults to no bound
+        sort (str, optional): Sort key ``date`` or ``amount``, prefixed with ``-`` for
+            descending order. Defaults to ``-date`` (newest first)
+        fields (str, optional): Comma separated fields to return (e.g. ``date,amount``);
+            ``id`` is always included. Defaults to all fields
 
     Returns:
-        Pagination: Paginated response containing transactions and metadata
+        Pagination: Paginated response containing transactions and metadata, or the
+            same data encoded in the negotiated format
 
     Raises:
+        HTTPException: 400 Bad Request if an unknown field or sort key is requested
         HTTPException: 500 Internal Server Error if database operation fails
 
     Example:
-        GET /api/v1/transactions/?periodId=1&page=0&size=10&categoryId=2
+        GET /api/v1/transactions/?periodId=1&page=0&size=10&categoryIds=2&sort=-amount
         Returns: {
             "content": [
                 {
@@ -78,51 +152,76 @@ def get_transactions(
             "size": 10
         }
     """
+    selected = parse_fields(fields, TRANSACTION_FIELDS)
+    order = transaction_order(sort)
     try:
         user = request.state.user_info
-        transaction_query = (
-            db.query(Transaction, TransactionCategory)
-            .join(TransactionCategory)
-            .filter_by(user_id=user["id"])
-        )
-
-        if periodId != 0:
-            period = db.query(FinancePeriod).filter_by(id=periodId).first()
-            if period:
-                transaction_query = transaction_query.filter(
-                    Transaction.date >= period.date_start,
-                    Transaction.date <= period.date_end,
-                )
-
         if categoryId != 0:
-            transaction_query = transaction_query.filter(
-                TransactionCategory.id == categoryId
-            )
-
+            categoryIds = [*categoryIds, categoryId]
         if date != "":
-            split_date = date.split(";")
-            transaction_query = transaction_query.filter(
-                Transaction.date >= split_date[0], Transaction.date <= split_date[1]
-            )
+            split_date = [datetime.fromisoformat(part) for part in date.split(";")]
+            dateFrom, dateTo = dateFrom or split_date[0], dateTo or split_date[1]
 
-        total_count = transaction_query.count()
+        cache_key = result_key(
+            user["id"],
+            period_id=periodId,
+            category_ids=tuple(sorted(set(categoryIds))),
+            transaction_type=type,
+            wallet_id=walletId,
+            amount_min=amountMin,
+            amount_max=amountMax,
+            date_from=dateFrom,
+            date_to=dateTo,
+            sort=sort,
+            page=page,
+            size=size,
+            fields=tuple(selected),
+        )
+        use_cache = not in_read_your_writes_window(request)
+        cached = transaction_pages.get(cache_key) if use_cache else None
+        if cached is not None:
+            transaction_content, total_count = cached
+        else:
+            transaction_content, total_count = load_transaction_page(
+                db,
+                user["id"],
+                selected,
+                order,
+                page,
+                size,
+                period_id=periodId,
+                category_ids=categoryIds,
+                transaction_type=type,
+                wallet_id=walletId,
+                amount_min=amountMin,
+                amount_max=amountMax,
+                date_from=dateFrom,
+                date_to=dateTo,
+            )
+            if use_cache:
+                transaction_pages.set(
+                    cache_key,
+                    (transaction_content, total_count),
+                    ttl_seconds=result_ttl_seconds(request.app.state.settings),
+                )
+        cache_status = "HIT" if cached is not None else "MISS"
 
-        transactions = transaction_query.offset(page * size).limit(size).all()
-        transaction_content = []
+        pagination = {"totalCount": total_count, "page": page, "size": size}
+        encoded = render_list(
+            request,
+            transaction_content,
+            envelope=pagination,
+            sparse=is_sparse(selected, TRANSACTION_FIELDS),
+        )
+        if encoded is not None:
+            encoded.headers["X-Cache"] = cache_status
+            return encoded
 
-        for transaction in transactions:
-            transaction_content.append(
-                TransactionResponse(
-                    id=transaction[0].id,
-                    category={"name": transaction[1].name, "id": transaction[1].id},
-                    date=transaction[0].date,
-                    amount=transaction[0].amount,
-                    comment=transaction[0].comment,
-                    type=transaction[0].type,
-                )
-            )
+        response.headers["Vary"] = "Accept"
+        response.headers["X-Cache"] = cache_status
         return Pagination(
-            content=transaction_content, totalCount=total_count, page=page, size=size
+            content=[TransactionResponse(**item) for item in transaction_content],
+            **pagination,
         )
     except Exception:
         raise HTTPException(
@@ -131,6 +230,96 @@ def get_transactions(
         )
 
 
+@router.get("/export")
+def export_transactions(request: Request, format: str = ARROW):
+    """
+    Export the complete transaction history of the authenticated user.
+
+    The history is streamed with category names in a columnar format for
+    data tools and notebooks, read in batches from a server-side cursor so
+    that memory use does not grow with the number of transactions (see
+    ``services.transaction_export``).
+
+    Args:
+        request (Request): The HTTP request object containing user authentication info
+        format (str, optional): ``arrow`` (Arrow IPC stream), ``parquet`` or ``csv``.
+            Defaults to ``arrow``
+
+    Returns:
+        StreamingResponse: The export as a file download
+
+    Raises:
+        HTTPException: 400 Bad Request if the format is not supported
+
+    Example:
+        GET /api/v1/transactions/export?format=parquet
+        Returns: transactions.parquet with the columns id, date, amount, type,
+            categoryId, category, walletId and comment
+    """
+    if format not in EXPORT_FORMATS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown format '{format}', expected one of: {', '.join(EXPORT_FORMATS)}",
+        )
+
+    user = request.state.user_info
+    media_type, extension = EXPORT_FORMATS[format]
+    return StreamingResponse(
+        stream_export(
+            user["id"], format, use_replica=not in_read_your_writes_window(request)
+        ),
+        media_type=media_type,
+        headers={
+            "Content-Disposition": f'attachment; filename="transactions.{extension}"'
+        },
+    )
+
+
+def load_transaction_page(
+    db: Session, user_id: int, selected, order, page: int, size: int, **filters
+):
+    """
+    Run the count and page queries of the transaction list.
+
+    Args:
+        db (Session): Database session for data access
+        user_id (int): ID of the user whose transactions are listed
+        selected (list): Selected fields (see ``services.fieldsets``)
+        order (list): ORDER BY clauses (see ``transaction_order``)
+        page (int): Page number (0-based)
+        size (int): Number of items per page
+        **filters: Filters passed to ``apply_transaction_filters``
+
+    Returns:
+        tuple: Items of the page with categories attached, and the total count
+    """
+    transaction_query = apply_transaction_filters(
+        db.query(*select_columns(selected, TRANSACTION_FIELDS)), user_id, **filters
+    )
+
+    total_count = transaction_query.count()
+
+    transactions = (
+        transaction_query.order_by(*order).offset(page * size).limit(size).all()
+    )
+    transaction_content = [
+        row_to_item(transaction, selected, TRANSACTION_FIELDS)
+        for transaction in transactions
+    ]
+
+    if "category" in selected:
+        categories = get_category_lookup_for(
+            db, user_id, {item["category"] for item in transaction_content}
+        )
+        for item in transaction_content:
+            category = categories.get(item["category"], {})
+            item["category"] = {
+                "name": category.get("name"),
+                "id": item["category"],
+            }
+    return transaction_content, total_count
+
+
 @router.post("/", response_model=TransactionCreateResponse)
 def create_transaction(
     transaction: TransactionCreate, request: Request, db: Session = Depends(get_db)
@@ -141,6 +330,13 @@ def create_transaction(
     This endpoint creates a new financial transaction with the specified
     details including category, date, amount, comment, and type. The transaction
     is associated with the authenticated user and linked to the specified category.
+    Snapshots of closed finance periods containing the transaction date are
+    invalidated, and the amount is added to the streaming statistics of its
+    category, in the same database transaction. The response scores how
+    unusual the amount is for the category. When the user has event streams,
+    the new totals of the periods containing the transaction are computed in
+    that database transaction too; after the commit they are published with
+    the new transaction.
 
     Args:
         transaction (TransactionCreate): The transaction data including all required fields
@@ -168,7 +364,8 @@ def create_transaction(
             "date": "2024-01-15T10:30:00",
             "amount": 25.50,
             "comment": "Lunch at restaurant",
-            "type": "expense"
+            "type": "expense",
+            "anomaly": 0.4
         }
     """
     user = request.state.user_info
@@ -183,19 +380,36 @@ def create_transaction(
         )
 
         db.add(new_transaction)
+        periods = invalidate_period_snapshots(db, user["id"], transaction.date)
+        anomaly = record_amount(
+            db, user["id"], transaction.categoryId, transaction.amount
+        )
+        events = request.app.state.events
+        totals = []
+        if periods and events.wants(user["id"]):
+            db.flush()
+            totals = period_totals(db, user["id"], periods)
         db.commit()
         db.refresh(new_transaction)
 
-        return TransactionCreateResponse(
+        response = TransactionCreateResponse(
             id=new_transaction.id,
             category_id=new_transaction.category_id,
             date=new_transaction.date,
             amount=new_transaction.amount,
             comment=new_transaction.comment,
             type=new_transaction.type,
+            anomaly=anomaly,
         )
     except Exception:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Internal Server Error",
         )
+
+    # The transaction is stored; publishing is best effort and never fails the request.
+    if events.wants(user["id"]):
+        events.publish(user["id"], "transaction.created", response, db=db)
+        for period in totals:
+            events.publish(user["id"], "period.totals", period, db=db)
+    return response
@@ -1,16 +1,18 @@
 from fastapi import APIRouter, HTTPException, Depends, Request, status
 from sqlalchemy.orm import Session
-from db.connect import get_db
-from db.models.users_model import User
+from db.connect import get_read_db
+from services.profiling import ProfiledRoute
+from services.user_cache import get_user_profile
 
-router = APIRouter(prefix="/api/v1/users", tags=["Users"])
+router = APIRouter(prefix="/api/v1/users", tags=["Users"], route_class=ProfiledRoute)
 
 
 @router.get("/")
-def get_user(request: Request, db: Session = Depends(get_db)):
+def get_user(request: Request, db: Session = Depends(get_read_db)):
     try:
         user = request.state.user_info
-        return db.query(User).filter_by(sub_id=user["sub_id"]).first()
+        # The session only connects on a cache miss.
+        return get_user_profile(db, user["id"])
     except:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
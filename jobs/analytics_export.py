@@ -0,0 +1,250 @@
+"""
+Analytics export job for Finance Tracker API.
+
+This module copies the tables behind the heavy reports from PostgreSQL into
+Parquet files under ``ANALYTICS_DIR``, where ``services.analytics_engine``
+queries them with an embedded DuckDB. Long-range reports then scan local
+columnar files instead of competing with ``get_transactions`` for the OLTP
+database.
+
+The export is incremental:
+- Every table has its own directory of part files named after the first and
+  last exported ID (``part-<first>-<last>.parquet``)
+- A run exports the rows with an ID greater than the last exported ID, in
+  chunks of ``ANALYTICS_EXPORT_CHUNK_SIZE`` rows, one part file per chunk
+- A table without rows gets one empty part file that records its schema
+- Part files are written to a temporary name and renamed when complete, so
+  readers never see a partial file and an interrupted run simply resumes
+- The job uses its own single-connection engine, never the request path's pool
+
+The API only inserts into the exported tables. Rows changed in the database
+by other means, and rows whose transaction committed after a row with a
+greater ID was exported, are picked up by ``--rebuild``, which exports every
+table again from scratch.
+
+Usage:
+    python -m jobs.analytics_export [--rebuild]
+"""
+
+import argparse
+import logging
+import os
+import re
+import shutil
+from sqlalchemy import Float, Integer, String, TIMESTAMP, cast, create_engine, select
+from sqlalchemy.orm import Session, sessionmaker
+from config import get_settings
+from db.connect import database_url
+from db.models.capital_transactions_model import CapitalTransaction
+from db.models.incomes_model import Income
+from db.models.transaction_categories_model import TransactionCategory
+from db.models.transaction_model import Transaction
+
+JOB_NAME = "analytics_export"
+
+PART_FILE = re.compile(r"part-(\d+)-(\d+)\.parquet")
+
+# Incomes store their user and wallet IDs as strings; they are exported as
+# integers so they join with the other tables.
+EXPORTED_COLUMNS = {
+    "transactions": [
+        Transaction.id,
+        Transaction.user_id,
+        Transaction.category_id,
+        Transaction.wallet_id,
+        Transaction.date,
+        Transaction.amount,
+        Transaction.type,
+    ],
+    "incomes": [
+        Income.id,
+        cast(Income.user_id, Integer).label("user_id"),
+        cast(Income.wallet_id, Integer).label("wallet_id"),
+        Income.date,
+        Income.amount,
+    ],
+    "capital_transactions": [
+        CapitalTransaction.id,
+        CapitalTransaction.user_id,
+        CapitalTransaction.currency_id,
+        CapitalTransaction.wallet_id,
+        CapitalTransaction.capital_storing_place_id,
+        CapitalTransaction.date,
+        CapitalTransaction.amount,
+    ],
+    "transaction_categories": [
+        TransactionCategory.id,
+        TransactionCategory.user_id,
+        TransactionCategory.name,
+        TransactionCategory.type,
+    ],
+}
+
+logger = logging.getLogger(__name__)
+
+
+def arrow_schema(columns):
+    """
+    Build the Parquet schema of an exported table.
+
+    The schema is fixed rather than inferred, so chunks in which a column is
+    entirely NULL are written with the same types as all other chunks.
+
+    Args:
+        columns (list): Exported SQLAlchemy columns
+
+    Returns:
+        pyarrow.Schema: Schema of the part files
+    """
+    import pyarrow as pa
+
+    arrow_types = {
+        Integer: pa.int64(),
+        Float: pa.float64(),
+        String: pa.string(),
+        TIMESTAMP: pa.timestamp("us", tz="UTC"),
+    }
+    fields = []
+    for column in columns:
+        for sql_type, arrow_type in arrow_types.items():
+            if isinstance(column.type, sql_type):
+                fields.append((column.name, arrow_type))
+                break
+    return pa.schema(fields)
+
+
+def last_exported_id(directory: str):
+    """
+    Return the greatest ID exported to a table directory.
+
+    Args:
+        directory (str): Directory of the table's part files
+
+    Returns:
+        int: Last exported ID (0 if nothing was exported yet)
+    """
+    if not os.path.isdir(directory):
+        return 0
+    return max(
+        (
+            int(match.group(2))
+            for match in map(PART_FILE.fullmatch, os.listdir(directory))
+            if match
+        ),
+        default=0,
+    )
+
+
+def write_part(directory: str, data, first_id: int, last_id: int):
+    """
+    Write a part file atomically.
+
+    Args:
+        directory (str): Directory of the table's part files
+        data (pyarrow.Table): Rows of the part
+        first_id (int): First ID in the part
+        last_id (int): Last ID in the part
+    """
+    import pyarrow.parquet as pq
+
+    name = f"part-{first_id:012d}-{last_id:012d}.parquet"
+    temporary = os.path.join(directory, f".{name}.tmp")
+    pq.write_table(data, temporary, compression="zstd")
+    os.replace(temporary, os.path.join(directory, name))
+
+
+def export_table(db: Session, table: str, directory: str, chunk_size: int):
+    """
+    Export the rows of a table that were added since the last run.
+
+    Args:
+        db (Session): Job database session
+        table (str): Name of the exported table (key of ``EXPORTED_COLUMNS``)
+        directory (str): Directory of the table's part files
+        chunk_size (int): Maximum number of rows per part file
+
+    Returns:
+        int: Number of exported rows
+    """
+    import pyarrow as pa
+
+    columns = EXPORTED_COLUMNS[table]
+    schema = arrow_schema(columns)
+    os.makedirs(directory, exist_ok=True)
+    after_id = last_exported_id(directory)
+    exported = 0
+
+    while True:
+        rows = db.execute(
+            select(*columns)
+            .where(columns[0] > after_id)
+            .order_by(columns[0])
+            .limit(chunk_size)
+        ).all()
+        # Release the connection while the file is written.
+        db.commit()
+        if not rows:
+            if not last_exported_id(directory) and not os.listdir(directory):
+                # An empty table gets an empty part file, so its schema is known.
+                write_part(directory, schema.empty_table(), 0, 0)
+            return exported
+
+        data = pa.Table.from_arrays(
+            [
+                pa.array(values, arrow_type)
+                for values, arrow_type in zip(zip(*rows), schema.types)
+            ],
+            schema=schema,
+        )
+        write_part(directory, data, rows[0][0], rows[-1][0])
+        after_id = rows[-1][0]
+        exported += len(rows)
+        logger.info("Exported %s rows of %s up to ID %s", len(rows), table, after_id)
+
+
+def run(rebuild: bool = False):
+    """
+    Export every analytics table.
+
+    Args:
+        rebuild (bool): Delete the exported files and export all rows again
+    """
+    settings = get_settings()
+    engine = create_engine(
+        database_url(settings),
+        pool_size=1,
+        max_overflow=0,
+        connect_args={"application_name": JOB_NAME},
+    )
+    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    try:
+        with session_factory() as db:
+            for table in EXPORTED_COLUMNS:
+                directory = os.path.join(settings.analytics_dir, table)
+                if rebuild:
+                    shutil.rmtree(directory, ignore_errors=True)
+                exported = export_table(
+                    db, table, directory, settings.analytics_export_chunk_size
+                )
+                logger.info("%s: %s new rows", table, exported)
+    finally:
+        engine.dispose()
+
+
+def main():
+    """Parse command line arguments and run the export job."""
+    parser = argparse.ArgumentParser(description="Export analytics tables to Parquet.")
+    parser.add_argument(
+        "--rebuild",
+        action="store_true",
+        help="delete the exported files and export all rows again",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    run(rebuild=args.rebuild)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""
+Category statistics backfill job for Finance Tracker API.
+
+This module loads the streaming category statistics (see
+``services.category_spend_stats``) from the existing transaction history.
+New transactions update the statistics when they are created; this job is
+run once after the ``category_spend_stats`` table is introduced, or to
+repair the statistics after transactions were changed outside the API.
+
+Users are processed in chunks of ``RECURRING_JOB_CHUNK_SIZE``. For every
+chunk the moments and the sketch buckets are aggregated by the database and
+the statistics of the chunk's categories are replaced in one transaction.
+Transactions created by the API while their chunk is being replaced may be
+counted twice or not at all; run the job when write traffic is low.
+
+Usage:
+    python -m jobs.category_stats_backfill
+"""
+
+import logging
+import time
+from collections import defaultdict
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+from config import get_settings
+from db.models.category_spend_stats_model import CategorySpendStats
+from db.models.transaction_model import Transaction
+from db.models.users_model import User
+from jobs.recurring_detection import create_job_session_factory
+from services.category_spend_stats import SKETCH_BUCKETS, bucket_index_sql
+
+logger = logging.getLogger(__name__)
+
+
+def load_statistics(db: Session, user_ids):
+    """
+    Aggregate the statistics of the categories of a chunk of users.
+
+    Args:
+        db (Session): Job database session
+        user_ids (list): IDs of the users in the chunk
+
+    Returns:
+        list: Row dicts for ``category_spend_stats``
+    """
+    moments = db.execute(
+        select(
+            Transaction.user_id,
+            Transaction.category_id,
+            func.count(),
+            func.avg(Transaction.amount),
+            func.var_pop(Transaction.amount),
+        )
+        .where(Transaction.user_id.in_(user_ids))
+        .group_by(Transaction.user_id, Transaction.category_id)
+    ).all()
+
+    bucket = bucket_index_sql(Transaction.amount).label("bucket")
+    buckets = db.execute(
+        select(Transaction.user_id, Transaction.category_id, bucket, func.count())
+        .where(Transaction.user_id.in_(user_ids))
+        .group_by(Transaction.user_id, Transaction.category_id, bucket)
+    ).all()
+
+    sketches = defaultdict(lambda: [0] * SKETCH_BUCKETS)
+    for user_id, category_id, bucket_index, count in buckets:
+        sketches[user_id, category_id][int(bucket_index)] = count
+
+    return [
+        {
+            "user_id": user_id,
+            "category_id": category_id,
+            "count": count,
+            "mean": mean,
+            "m2": variance * count,
+            "sketch": sketches[user_id, category_id],
+        }
+        for user_id, category_id, count, mean, variance in moments
+    ]
+
+
+def run():
+    """Rebuild the category statistics of all users."""
+    settings = get_settings()
+    session_factory = create_job_session_factory(settings)
+    after_user_id = 0
+
+    with session_factory() as db:
+        while True:
+            user_ids = db.scalars(
+                select(User.id)
+                .where(User.id > after_user_id)
+                .order_by(User.id)
+                .limit(settings.recurring_job_chunk_size)
+            ).all()
+            if not user_ids:
+                db.commit()
+                logger.info("Category statistics backfill complete")
+                return
+
+            rows = load_statistics(db, user_ids)
+            db.execute(
+                delete(CategorySpendStats).where(
+                    CategorySpendStats.user_id.in_(user_ids)
+                )
+            )
+            if rows:
+                db.execute(insert(CategorySpendStats), rows)
+            db.commit()
+
+            after_user_id = user_ids[-1]
+            logger.info(
+                "Processed users up to %s, %s categories", after_user_id, len(rows)
+            )
+            time.sleep(settings.recurring_job_pause_seconds)
+
+
+def main():
+    """Run the backfill job."""
+    logging.basicConfig(level=logging.INFO)
+    run()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,235 @@
+"""
+Recurring-transaction detection job for Finance Tracker API.
+
+This module scans the transactions table in chunks of users and stores the
+detected recurring transactions (subscriptions, rent, salary) in the
+recurring_transactions table, where the API serves them from.
+
+The job is designed to run next to the API without hurting it:
+- It uses its own single-connection engine, never the request path's pool
+- The database work of a chunk is one read and one write transaction
+- CPU-heavy pattern matching runs in a ``ProcessPoolExecutor`` worker pool
+  while no database connection is held
+- A configurable pause between chunks throttles the scan
+- A checkpoint is committed with every chunk so an interrupted run resumes
+  after the last processed user
+
+Usage:
+    python -m jobs.recurring_detection [--restart]
+"""
+
+import argparse
+import logging
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta, timezone
+import numpy as np
+from sqlalchemy import Float, cast, create_engine, delete, func, select
+from sqlalchemy.orm import Session, sessionmaker
+from config import get_settings
+from db.connect import database_url
+from db.models.job_checkpoints_model import JobCheckpoint
+from db.models.recurring_transactions_model import RecurringTransaction
+from db.models.transaction_model import Transaction
+from db.models.users_model import User
+from services.recurring_patterns import detect_user_recurrences
+
+JOB_NAME = "recurring_detection"
+
+logger = logging.getLogger(__name__)
+
+
+def create_job_session_factory(settings):
+    """
+    Create a session factory bound to a dedicated single-connection engine.
+
+    Args:
+        settings (Settings): Application settings
+
+    Returns:
+        sessionmaker: Session factory for the job's own connection
+    """
+    engine = create_engine(
+        database_url(settings),
+        pool_size=1,
+        max_overflow=0,
+        connect_args={"application_name": JOB_NAME},
+    )
+    return sessionmaker(
+        autocommit=False, autoflush=False, expire_on_commit=False, bind=engine
+    )
+
+
+def get_checkpoint(db: Session):
+    """
+    Load the job checkpoint, creating it on the first run.
+
+    Args:
+        db (Session): Job database session
+
+    Returns:
+        JobCheckpoint: Checkpoint of the recurring-detection job
+    """
+    checkpoint = db.get(JobCheckpoint, JOB_NAME)
+    if not checkpoint:
+        checkpoint = JobCheckpoint(name=JOB_NAME, last_user_id=0)
+        db.add(checkpoint)
+        db.commit()
+    return checkpoint
+
+
+def load_chunk(db: Session, after_user_id: int, chunk_size: int, since: datetime):
+    """
+    Load the transactions of the next chunk of users in one query.
+
+    Args:
+        db (Session): Job database session
+        after_user_id (int): Only users with a greater ID are loaded
+        chunk_size (int): Maximum number of users in the chunk
+        since (datetime): Only transactions on or after this date are loaded
+
+    Returns:
+        tuple: ``(user_ids, payloads)`` where ``payloads`` are the arguments
+            for ``detect_user_recurrences``, one per user with transactions
+    """
+    user_ids = db.scalars(
+        select(User.id)
+        .where(User.id > after_user_id)
+        .order_by(User.id)
+        .limit(chunk_size)
+    ).all()
+    if not user_ids:
+        return [], []
+
+    rows = db.execute(
+        select(
+            Transaction.user_id,
+            Transaction.category_id,
+            cast(func.extract("epoch", Transaction.date), Float),
+            Transaction.amount,
+        ).where(Transaction.user_id.in_(user_ids), Transaction.date >= since)
+    ).all()
+    if not rows:
+        return user_ids, []
+
+    user_id, category_id, epoch, amount = (np.asarray(column) for column in zip(*rows))
+    order = np.argsort(user_id, kind="stable")
+    users, starts = np.unique(user_id[order], return_index=True)
+    as_of = time.time()
+
+    payloads = [
+        (
+            user,
+            category_id[indexes].astype(np.int64),
+            epoch[indexes].astype(np.float64),
+            amount[indexes].astype(np.float64),
+            as_of,
+        )
+        for user, indexes in zip(users.tolist(), np.split(order, starts[1:]))
+    ]
+    return user_ids, payloads
+
+
+def store_chunk(db: Session, checkpoint: JobCheckpoint, user_ids, recurrences):
+    """
+    Replace the recurrences of a chunk of users and advance the checkpoint.
+
+    Both changes are committed in one transaction, so a chunk is either fully
+    stored and checkpointed or processed again by the next run.
+
+    Args:
+        db (Session): Job database session
+        checkpoint (JobCheckpoint): Checkpoint of the job
+        user_ids (list): IDs of all users in the chunk
+        recurrences (list): Detected recurrences of the chunk
+    """
+    db.execute(
+        delete(RecurringTransaction).where(RecurringTransaction.user_id.in_(user_ids))
+    )
+    db.add_all(
+        RecurringTransaction(
+            **{
+                **recurrence,
+                "last_date": datetime.fromtimestamp(
+                    recurrence["last_date"], timezone.utc
+                ),
+                "next_date": datetime.fromtimestamp(
+                    recurrence["next_date"], timezone.utc
+                ),
+            }
+        )
+        for recurrence in recurrences
+    )
+    checkpoint.last_user_id = user_ids[-1]
+    db.commit()
+
+
+def run(restart: bool = False):
+    """
+    Run one full pass of the detection job, resuming from the checkpoint.
+
+    When the pass reaches the last user the checkpoint is reset, so the next
+    run starts a new pass from the first user.
+
+    Args:
+        restart (bool): Ignore the checkpoint and start from the first user
+    """
+    settings = get_settings()
+    session_factory = create_job_session_factory(settings)
+
+    with ProcessPoolExecutor(
+        max_workers=settings.recurring_job_workers
+    ) as executor, session_factory() as db:
+        checkpoint = get_checkpoint(db)
+        if restart:
+            checkpoint.last_user_id = 0
+            db.commit()
+
+        while True:
+            since = datetime.now(timezone.utc) - timedelta(
+                days=settings.recurring_job_lookback_days
+            )
+            user_ids, payloads = load_chunk(
+                db, checkpoint.last_user_id, settings.recurring_job_chunk_size, since
+            )
+            # Release the connection while the workers are busy.
+            db.commit()
+
+            if not user_ids:
+                checkpoint.last_user_id = 0
+                db.commit()
+                logger.info("Recurring detection pass complete")
+                return
+
+            recurrences = [
+                recurrence
+                for _, user_recurrences in executor.map(
+                    detect_user_recurrences, payloads, chunksize=16
+                )
+                for recurrence in user_recurrences
+            ]
+            store_chunk(db, checkpoint, user_ids, recurrences)
+            logger.info(
+                "Processed users up to %s, %s recurrences detected",
+                checkpoint.last_user_id,
+                len(recurrences),
+            )
+            time.sleep(settings.recurring_job_pause_seconds)
+
+
+def main():
+    """Parse command line arguments and run the detection job."""
+    parser = argparse.ArgumentParser(description="Detect recurring transactions.")
+    parser.add_argument(
+        "--restart",
+        action="store_true",
+        help="ignore the checkpoint and start from the first user",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    run(restart=args.restart)
+
+
+if __name__ == "__main__":
+    main()
@@ -7,43 +7,141 @@ Architecture:
 - FastAPI web framework
 - SQLAlchemy ORM for database operations
 - JWT authentication with cookie-based sessions
+- Per-user rate limiting and load shedding (``AdmissionMiddleware``)
+- Live change events over Server-Sent Events (``services.events``)
+- On-demand request profiling (``ProfilingMiddleware``), only installed when
+  ``PROFILE_ENABLED`` is set
+
+Startup:
+- ``create_app(settings)`` builds the application for a ``Settings`` instance,
+  so tests and tools can run it against another database
+- Database engines, the shared HTTP client and the event bus listener are
+  created in the lifespan, not at import time, and released again on shutdown
+- Heavy dependencies (google-auth, NumPy, DuckDB) are imported by the endpoints that
+  need them on first use
+- ``main.app`` is created on first access, so ``uvicorn main:app`` keeps
+  working while importing this module stays cheap
+
+``benchmarks.import_time`` reports the cold-start cost of each phase.
 """
 
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from auth.auth import router as auth_router
+from config import Settings, get_settings
+from db.connect import dispose_db, init_db
+from services.analytics_engine import close_analytics
+from services.events import EventBus, create_backend
+from services.profiling import install_sql_capture, profiling_enabled
+from entities.analytics import router as analytics_router
+from entities.bootstrap import router as bootstrap_router
+from entities.changes import router as changes_router
+from entities.diagnostics import router as diagnostics_router
+from entities.events import router as events_router
 from entities.finance_periods import router as finance_periods_router
+from entities.profiles import router as profiles_router
+from entities.recurring_transactions import router as recurring_transactions_router
+from entities.reports import router as reports_router
 from entities.transaction_categories import router as transaction_categories_router
 from entities.transactions import router as transactions_router
 from entities.users import router as users_router
+from middlewares.admission_middleware import AdmissionMiddleware
 from middlewares.cookie_middleware import CookieMiddleware
+from middlewares.profiling_middleware import ProfilingMiddleware
 
 origins = [
     "http://localhost:5173",
     "https://accounts.google.com",
 ]
 
-app = FastAPI(
-    title="Finance Tracker API",
-    description="A comprehensive financial management API for tracking transactions, categories, and finance periods",
-    version="1.0.0",
-    docs_url="/docs",
-    redoc_url="/redoc",
-)
-
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=origins,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
-app.add_middleware(CookieMiddleware)
-
-app.include_router(auth_router)
-app.include_router(transactions_router)
-app.include_router(transaction_categories_router)
-app.include_router(finance_periods_router)
-app.include_router(users_router)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Create the database engines, the HTTP client and the event bus, and release them on shutdown.
+
+    Args:
+        app (FastAPI): The application being started
+    """
+    import httpx
+
+    init_db(app.state.settings)
+    app.state.http_client = httpx.AsyncClient()
+    await app.state.events.start()
+    try:
+        yield
+    finally:
+        await app.state.events.stop()
+        await app.state.http_client.aclose()
+        dispose_db()
+        close_analytics()
+
+
+def create_app(settings: Settings = None):
+    """
+    Build the Finance Tracker application.
+
+    Args:
+        settings (Settings, optional): Application settings. Defaults to ``get_settings()``
+
+    Returns:
+        FastAPI: The configured application
+
+    Example:
+        ```python
+        app = create_app(Settings(db_url="postgresql://localhost/test", ...))
+        ```
+    """
+    app = FastAPI(
+        title="Finance Tracker API",
+        description="A comprehensive financial management API for tracking transactions, categories, and finance periods",
+        version="1.0.0",
+        docs_url="/docs",
+        redoc_url="/redoc",
+        lifespan=lifespan,
+    )
+    app.state.settings = settings or get_settings()
+    app.state.events = EventBus(create_backend(app.state.settings))
+
+    # Added first so they run innermost: after CookieMiddleware has decoded the
+    # user, and with rejections still passing through CORSMiddleware.
+    if profiling_enabled(app.state.settings):
+        install_sql_capture()
+        app.add_middleware(ProfilingMiddleware, settings=app.state.settings)
+    app.add_middleware(AdmissionMiddleware, settings=app.state.settings)
+
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=origins,
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+
+    app.add_middleware(CookieMiddleware)
+
+    app.include_router(auth_router)
+    app.include_router(transactions_router)
+    app.include_router(transaction_categories_router)
+    app.include_router(finance_periods_router)
+    app.include_router(users_router)
+    app.include_router(analytics_router)
+    app.include_router(recurring_transactions_router)
+    app.include_router(reports_router)
+    app.include_router(events_router)
+    app.include_router(changes_router)
+    app.include_router(bootstrap_router)
+    app.include_router(profiles_router)
+    app.include_router(diagnostics_router)
+
+    return app
+
+
+def __getattr__(name: str):
+    """Create the default application on first access of ``main.app``."""
+    if name == "app":
+        app = globals()["app"] = create_app()
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,106 @@
+"""
+Admission middleware module for Finance Tracker API.
+
+This module provides admission control for authenticated requests. It runs
+after ``CookieMiddleware`` has decoded the user, so limits are keyed on the
+user ID, and rejects requests quickly before they reach the database pool:
+
+- ``429 Too Many Requests`` when the user's token bucket is empty
+- ``503 Service Unavailable`` when the worker already handles
+  ``MAX_IN_FLIGHT_REQUESTS`` requests, or when more than
+  ``DB_POOL_QUEUE_THRESHOLD`` requests are waiting for a database connection
+
+Both rejections carry a ``Retry-After`` header. Limits apply per worker
+process (see ``services.admission``). Long-lived streams (``STREAMING_PATHS``)
+are rate limited but do not count as in-flight requests, since they stay
+open without holding a database connection.
+"""
+
+from fastapi import status
+from fastapi.responses import JSONResponse
+from starlette.middleware.base import BaseHTTPMiddleware
+from config import Settings
+from db.connect import get_engine, pool_options
+from services.admission import (
+    InFlightLimiter,
+    TokenBuckets,
+    pool_queue_length,
+    retry_after,
+)
+
+STREAMING_PATHS = ("/api/v1/events",)
+
+
+class AdmissionMiddleware(BaseHTTPMiddleware):
+    """
+    Per-user rate limiting and load shedding middleware.
+
+    Requests without a decoded user (public routes and OPTIONS requests) are
+    not limited.
+
+    Attributes:
+        buckets (TokenBuckets): Per-user token buckets
+        in_flight (InFlightLimiter): Cap on concurrently handled requests
+        pool_capacity (int): Database connections of this worker's pool
+        pool_queue_threshold (int): Queued requests before shedding load (0 = disabled)
+    """
+
+    def __init__(self, app, settings: Settings):
+        super().__init__(app)
+        self.buckets = TokenBuckets(
+            settings.rate_limit_per_second, settings.rate_limit_burst
+        )
+        self.in_flight = InFlightLimiter(settings.max_in_flight_requests)
+        self.pool_capacity = sum(pool_options(settings).values())
+        self.pool_queue_threshold = settings.db_pool_queue_threshold
+
+    async def dispatch(self, request, call_next):
+        """
+        Admit, throttle or shed an incoming request.
+
+        Args:
+            request: The incoming HTTP request object
+            call_next: The next middleware/handler in the chain
+
+        Returns:
+            JSONResponse: 429 or 503 response with a ``Retry-After`` header if
+                the request is rejected
+            Response: The response from the next handler if the request is admitted
+        """
+        user_info = getattr(request.state, "user_info", None)
+        if user_info is None:
+            return await call_next(request)
+
+        wait_seconds = self.buckets.acquire(user_info["id"])
+        if wait_seconds:
+            return JSONResponse(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                content={"message": "Too many requests"},
+                headers={"Retry-After": retry_after(wait_seconds)},
+            )
+
+        if request.url.path.startswith(STREAMING_PATHS):
+            return await call_next(request)
+
+        if not self.in_flight.try_enter():
+            return self.service_unavailable()
+        try:
+            if self.pool_queue_threshold and (
+                pool_queue_length(
+                    get_engine().pool, self.pool_capacity, self.in_flight.in_flight
+                )
+                > self.pool_queue_threshold
+            ):
+                return self.service_unavailable()
+            return await call_next(request)
+        finally:
+            self.in_flight.leave()
+
+    @staticmethod
+    def service_unavailable():
+        """Build the load shedding response."""
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={"message": "Server is busy, please retry"},
+            headers={"Retry-After": retry_after(1)},
+        )
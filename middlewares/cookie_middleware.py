@@ -12,6 +12,10 @@ from fastapi import status
 from fastapi.responses import JSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
 from auth.jwt_generation import decode_jwt
+from db.connect import READ_YOUR_WRITES_COOKIE, mark_user_write
+from services.result_cache import bump_data_version
+
+WRITE_METHODS = {"POST", "PUT", "PATCH", "DELETE"}
 
 
 class CookieMiddleware(BaseHTTPMiddleware):
@@ -27,6 +31,8 @@ class CookieMiddleware(BaseHTTPMiddleware):
     - Validates token authenticity and expiration
     - Injects user information into request context
     - Handles authentication errors with appropriate HTTP responses
+    - Starts the user's read-your-writes window after successful writes
+    - Invalidates the user's cached results after successful writes
     """
 
     async def dispatch(self, request, call_next):
@@ -53,6 +59,9 @@ class CookieMiddleware(BaseHTTPMiddleware):
         - Protected routes require a valid JWT token in the 'jwt_token' cookie
         - Invalid or missing tokens return 401 Unauthorized with error message
         - Valid tokens have user information injected into request.state.user_info
+        - Successful write requests mark the user so that read-only endpoints use
+          the primary database for a short time (in-process and via a cookie)
+          and bump the user's data version (see ``services.result_cache``)
         """
 
         if request.url.path.startswith("/api/v1/auth") or request.method == "OPTIONS":
@@ -65,8 +74,9 @@ class CookieMiddleware(BaseHTTPMiddleware):
                 content={"message": "No authentication credentials provided"},
             )
 
+        settings = request.app.state.settings
         try:
-            user_info = decode_jwt(jwt_token)
+            user_info = decode_jwt(jwt_token, settings)
         except InvalidTokenError:
             return JSONResponse(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -75,4 +85,15 @@ class CookieMiddleware(BaseHTTPMiddleware):
 
         request.state.user_info = user_info
         response = await call_next(request)
+
+        if request.method in WRITE_METHODS and response.status_code < 400:
+            mark_user_write(user_info["id"], settings.read_your_writes_seconds)
+            bump_data_version(user_info["id"])
+            response.set_cookie(
+                key=READ_YOUR_WRITES_COOKIE,
+                value="1",
+                max_age=settings.read_your_writes_seconds,
+                secure=True,
+                httponly=True,
+            )
         return response
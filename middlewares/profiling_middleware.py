@@ -0,0 +1,116 @@
+"""
+Profiling middleware module for Finance Tracker API.
+
+This module selects the requests that are profiled when ``PROFILE_ENABLED``
+is set (see ``services.profiling``):
+
+- requests of administrators that send the ``X-Profile`` header
+- every request of the users listed in ``PROFILE_USER_IDS``
+- a random ``PROFILE_SAMPLE_RATE`` fraction of all authenticated requests
+
+Long-lived event streams are never profiled.
+
+The report ID of a profiled request is returned in the ``X-Profile-Id``
+response header; administrators download the report from
+``/api/v1/profiles/``.
+
+Unlike the other middlewares this is a plain ASGI middleware: requests that
+are not profiled are passed on directly, without the extra task and
+response wrapping of ``BaseHTTPMiddleware``.
+"""
+
+import random
+from starlette.concurrency import run_in_threadpool
+from auth.admin import is_admin
+from config import Settings
+from middlewares.admission_middleware import STREAMING_PATHS
+from services.profiling import ProfileStore, RequestProfile, current_profile
+
+PROFILE_HEADER = b"x-profile"
+
+
+class ProfilingMiddleware:
+    """
+    Middleware that profiles selected authenticated requests.
+
+    Must run after ``CookieMiddleware`` so the user of the request is known.
+
+    Attributes:
+        app: The next ASGI application
+        settings (Settings): Application settings
+        user_ids (set): IDs of the users whose requests are always profiled
+        sample_rate (float): Fraction of requests profiled at random
+        store (ProfileStore): Directory the reports are written to
+    """
+
+    def __init__(self, app, settings: Settings):
+        self.app = app
+        self.settings = settings
+        self.user_ids = {
+            int(user_id)
+            for user_id in settings.profile_user_ids.split(",")
+            if user_id.strip()
+        }
+        self.sample_rate = settings.profile_sample_rate
+        self.store = ProfileStore(settings.profile_dir, settings.profile_max_reports)
+
+    def trigger(self, scope, user_info: dict):
+        """
+        Decide whether a request is profiled.
+
+        Args:
+            scope (dict): ASGI scope of the request
+            user_info (dict): Decoded JWT payload of the user
+
+        Returns:
+            str: 'header', 'user' or 'sample', or None if the request is not profiled
+        """
+        if any(name == PROFILE_HEADER for name, _ in scope["headers"]) and is_admin(
+            user_info, self.settings
+        ):
+            return "header"
+        if user_info["id"] in self.user_ids:
+            return "user"
+        if self.sample_rate and random.random() < self.sample_rate:
+            return "sample"
+        return None
+
+    async def __call__(self, scope, receive, send):
+        """
+        Run a request, under a profile if it is selected.
+
+        Args:
+            scope (dict): ASGI scope of the request
+            receive: ASGI receive channel
+            send: ASGI send channel
+        """
+        user_info = scope.get("state", {}).get("user_info")
+        trigger = (
+            self.trigger(scope, user_info)
+            if scope["type"] == "http"
+            and user_info is not None
+            and not scope["path"].startswith(STREAMING_PATHS)
+            else None
+        )
+        if trigger is None:
+            return await self.app(scope, receive, send)
+
+        profile = RequestProfile(
+            scope["method"], scope["path"], user_info["id"], trigger
+        )
+
+        async def send_with_profile_id(message):
+            if message["type"] == "http.response.start":
+                profile.status = message["status"]
+                message["headers"] = [
+                    *message.get("headers", ()),
+                    (b"x-profile-id", profile.id.encode()),
+                ]
+            await send(message)
+
+        token = current_profile.set(profile)
+        try:
+            await self.app(scope, receive, send_with_profile_id)
+        finally:
+            current_profile.reset(token)
+            await run_in_threadpool(self.store.save, profile)
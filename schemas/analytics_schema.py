@@ -0,0 +1,144 @@
+"""
+Analytics schema module for Finance Tracker API.
+
+This module defines Pydantic models for handling spending statistics
+in the Finance Tracker application. Statistics are returned as compact
+arrays (one value per month, weekday or hour) rather than per-transaction
+objects so that large histories stay small on the wire.
+"""
+
+from typing import Dict, List, Optional
+from pydantic import BaseModel
+
+
+class MonthlySpendingTrend(BaseModel):
+    """
+    Schema for the monthly spending trend.
+
+    All lists are aligned: the value at index ``i`` of every list belongs
+    to the month at index ``i`` of ``months``. Months without spending
+    are included with zero totals so the series is dense.
+
+    Attributes:
+        months (List[str]): Months in ``YYYY-MM`` format, oldest first
+        totals (List[float]): Total spend per month
+        counts (List[int]): Number of expense transactions per month
+        movingAverage (List[Optional[float]]): Trailing moving average of
+            the monthly totals (``None`` until the window is filled)
+    """
+
+    months: List[str]
+    totals: List[float]
+    counts: List[int]
+    movingAverage: List[Optional[float]]
+
+
+class CategorySpendingStatistics(BaseModel):
+    """
+    Schema for the spend distribution of a single category.
+
+    Attributes:
+        categoryId (int): The ID of the transaction category
+        count (int): Number of expense transactions in the category
+        total (float): Total spend in the category
+        mean (float): Mean transaction amount
+        median (float): Median transaction amount
+        percentiles (Dict[str, float]): Transaction amount percentiles keyed
+            by percentile (e.g. ``"p90"``)
+    """
+
+    categoryId: int
+    count: int
+    total: float
+    mean: float
+    median: float
+    percentiles: Dict[str, float]
+
+
+class SpendingTimeProfile(BaseModel):
+    """
+    Schema for weekday and hour-of-day spending profiles.
+
+    Attributes:
+        weekday (List[float]): Total spend per weekday (Monday first)
+        hour (List[float]): Total spend per hour of day (0-23)
+        weekdayHour (List[List[float]]): Total spend as a 7x24 matrix of
+            weekday rows and hour columns
+    """
+
+    weekday: List[float]
+    hour: List[float]
+    weekdayHour: List[List[float]]
+
+
+class SpendingStatisticsResponse(BaseModel):
+    """
+    Schema for the spending statistics response.
+
+    Attributes:
+        transactionCount (int): Number of expense transactions analysed
+        monthly (MonthlySpendingTrend): Monthly totals and moving average
+        categories (List[CategorySpendingStatistics]): Per-category distribution
+        profile (SpendingTimeProfile): Weekday and hour-of-day profiles
+    """
+
+    transactionCount: int
+    monthly: MonthlySpendingTrend
+    categories: List[CategorySpendingStatistics]
+    profile: SpendingTimeProfile
+
+
+class SpendingHeatmapResponse(BaseModel):
+    """
+    Schema for the calendar heatmap of daily totals.
+
+    The lists are dense and aligned: the value at index ``i`` belongs to the
+    day ``startDate + i days``. Days without transactions hold zeros.
+
+    Attributes:
+        startDate (str): First day of the range in ``YYYY-MM-DD`` format
+        endDate (str): Last day of the range in ``YYYY-MM-DD`` format
+        totals (List[float]): Total amount per day
+        counts (List[int]): Number of transactions per day
+        maxTotal (float): Largest daily total, for scaling the colour range
+    """
+
+    startDate: str
+    endDate: str
+    totals: List[float]
+    counts: List[int]
+    maxTotal: float
+
+
+class CategoryTypicalSpend(BaseModel):
+    """
+    Schema for the typical transaction amounts of a single category.
+
+    Percentiles are estimated from a log-bucketed sketch and are accurate
+    to about 9% of the amount.
+
+    Attributes:
+        categoryId (int): The ID of the transaction category
+        count (int): Number of transactions recorded
+        mean (float): Mean transaction amount
+        std (float): Sample standard deviation of the amounts
+        percentiles (Dict[str, Optional[float]]): Estimated amount percentiles
+            keyed by percentile (e.g. ``"p90"``)
+    """
+
+    categoryId: int
+    count: int
+    mean: float
+    std: float
+    percentiles: Dict[str, Optional[float]]
+
+
+class TypicalSpendResponse(BaseModel):
+    """
+    Schema for the typical spend response.
+
+    Attributes:
+        categories (List[CategoryTypicalSpend]): Typical amounts per category
+    """
+
+    categories: List[CategoryTypicalSpend]
@@ -0,0 +1,51 @@
+"""
+Bootstrap schema module for Finance Tracker API.
+
+This module defines Pydantic models for the dashboard bootstrap response,
+which combines the data the frontend loads on startup with one ETag per
+section.
+"""
+
+from typing import List, Optional
+from pydantic import BaseModel
+from schemas.finance_period_schema import FinancePeriodResponse
+from schemas.pagination_schema import Pagination
+from schemas.transaction_category_schema import TransactionCategoryResponse
+
+
+class BootstrapETags(BaseModel):
+    """
+    Schema for the ETags of the bootstrap sections.
+
+    Attributes:
+        user (str): ETag of the user profile
+        categories (str): ETag of the transaction categories
+        periods (str): ETag of the finance periods
+        transactions (str): ETag of the first transactions page
+    """
+
+    user: str
+    categories: str
+    periods: str
+    transactions: str
+
+
+class BootstrapResponse(BaseModel):
+    """
+    Schema for the dashboard bootstrap response.
+
+    A section is None if the client sent its current ETag in ``If-None-Match``.
+
+    Attributes:
+        user (dict, optional): Profile of the user, as returned by ``/api/v1/users/``
+        categories (List[TransactionCategoryResponse], optional): Transaction categories
+        periods (List[FinancePeriodResponse], optional): Finance periods
+        transactions (Pagination, optional): First page of the transactions, newest first
+        etags (BootstrapETags): Current ETag of every section
+    """
+
+    user: Optional[dict] = None
+    categories: Optional[List[TransactionCategoryResponse]] = None
+    periods: Optional[List[FinancePeriodResponse]] = None
+    transactions: Optional[Pagination] = None
+    etags: BootstrapETags
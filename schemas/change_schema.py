@@ -0,0 +1,70 @@
+"""
+Change feed schema module for Finance Tracker API.
+
+This module defines Pydantic models for the change feed of offline-first
+clients: the rows changed since a sync token, the IDs of deleted rows and
+the token of the next sync.
+"""
+
+from datetime import datetime
+from typing import List, Optional
+from pydantic import BaseModel
+from schemas.finance_period_schema import FinancePeriodResponse
+from schemas.transaction_category_schema import TransactionCategoryResponse
+
+
+class ChangedTransaction(BaseModel):
+    """
+    Schema for a created or updated transaction in the change feed.
+
+    Attributes:
+        id (int): The unique identifier of the transaction
+        categoryId (int): The ID of the transaction category
+        walletId (int, optional): The ID of the wallet involved
+        date (datetime): The date when the transaction occurred
+        amount (float): The monetary amount of the transaction
+        comment (str, optional): Comment or description for the transaction
+        type (str): The type of transaction (e.g., 'income', 'expense')
+    """
+
+    id: int
+    categoryId: int
+    walletId: Optional[int] = None
+    date: datetime
+    amount: float
+    comment: Optional[str] = None
+    type: str
+
+
+class DeletedIds(BaseModel):
+    """
+    Schema for the IDs of rows deleted since a sync token.
+
+    Attributes:
+        transactions (List[int]): IDs of deleted transactions
+        categories (List[int]): IDs of deleted transaction categories
+        periods (List[int]): IDs of deleted finance periods
+    """
+
+    transactions: List[int]
+    categories: List[int]
+    periods: List[int]
+
+
+class ChangesResponse(BaseModel):
+    """
+    Schema for the change feed response.
+
+    Attributes:
+        token (int): Token to send as ``since`` on the next sync
+        transactions (List[ChangedTransaction]): Created or updated transactions
+        categories (List[TransactionCategoryResponse]): Created or updated categories
+        periods (List[FinancePeriodResponse]): Created or updated finance periods
+        deleted (DeletedIds): IDs of deleted rows per entity
+    """
+
+    token: int
+    transactions: List[ChangedTransaction]
+    categories: List[TransactionCategoryResponse]
+    periods: List[FinancePeriodResponse]
+    deleted: DeletedIds
@@ -0,0 +1,40 @@
+"""
+Diagnostics schema module for Finance Tracker API.
+
+This module defines Pydantic models for the operator diagnostics endpoints.
+"""
+
+from typing import Dict
+from pydantic import BaseModel
+
+
+class CacheStats(BaseModel):
+    """
+    Schema for the counters of an in-process cache.
+
+    Attributes:
+        size (int): Number of entries currently stored
+        maxEntries (int): Maximum number of entries
+        hits (int): Lookups that found a live entry
+        misses (int): Lookups that found no live entry
+        evictions (int): Entries evicted because the cache was full
+    """
+
+    size: int
+    maxEntries: int
+    hits: int
+    misses: int
+    evictions: int
+
+
+class CacheStatsResponse(BaseModel):
+    """
+    Schema for the cache counters of one worker process.
+
+    Attributes:
+        pid (int): Process ID of the worker that answered
+        caches (Dict[str, CacheStats]): Counters keyed by cache name
+    """
+
+    pid: int
+    caches: Dict[str, CacheStats]
@@ -8,6 +8,7 @@ financial data and transactions.
 """
 
 from datetime import datetime
+from typing import Dict, List, Optional
 from pydantic import BaseModel
 
 
@@ -77,3 +78,139 @@ class FinancePeriodResponse(BaseModel):
         """
 
         orm_mode = True
+
+
+class PeriodForecastProjection(BaseModel):
+    """
+    Schema for a single end-of-period projection.
+
+    Attributes:
+        amountSoFar (float): Amount recorded since the period start
+        paceProjection (Optional[float]): Amount so far extrapolated linearly
+            to the period end (``None`` before the period starts)
+        historyProjection (Optional[float]): Amount so far plus the average
+            amount past periods added after the same point (``None`` without history)
+        projected (float): Best projection of the end-of-period amount
+        low (float): Lower bound of the confidence range
+        high (float): Upper bound of the confidence range
+    """
+
+    amountSoFar: float
+    paceProjection: Optional[float]
+    historyProjection: Optional[float]
+    projected: float
+    low: float
+    high: float
+
+
+class CategoryForecast(PeriodForecastProjection):
+    """
+    Schema for the projection of a single category and transaction type.
+
+    Attributes:
+        categoryId (int): The ID of the transaction category
+        type (str): The type of transactions projected (e.g., 'income', 'expense')
+    """
+
+    categoryId: int
+    type: str
+
+
+class TypeForecast(PeriodForecastProjection):
+    """
+    Schema for the projection of all categories of a transaction type.
+
+    Attributes:
+        type (str): The type of transactions projected (e.g., 'income', 'expense')
+    """
+
+    type: str
+
+
+class PeriodForecastResponse(BaseModel):
+    """
+    Schema for the end-of-period forecast of a finance period.
+
+    Attributes:
+        periodId (int): The unique identifier of the finance period
+        elapsedFraction (float): Fraction of the period that has elapsed (0-1)
+        historyPeriods (int): Number of past windows the history projection is based on
+        categories (List[CategoryForecast]): Projections per category and type
+        totals (List[TypeForecast]): Projections per transaction type
+    """
+
+    periodId: int
+    elapsedFraction: float
+    historyPeriods: int
+    categories: List[CategoryForecast]
+    totals: List[TypeForecast]
+
+
+class PeriodCategoryTotal(BaseModel):
+    """
+    Schema for the total of a single category within a finance period.
+
+    Attributes:
+        categoryId (int): The ID of the transaction category
+        type (str): The type of transactions (e.g., 'income', 'expense')
+        total (float): Sum of the transaction amounts
+        count (int): Number of transactions
+    """
+
+    categoryId: int
+    type: str
+    total: float
+    count: int
+
+
+class PeriodSummaryResponse(BaseModel):
+    """
+    Schema for the aggregated summary of a finance period.
+
+    Attributes:
+        periodId (int): The unique identifier of the finance period
+        closed (bool): Whether the period has ended and is served from a snapshot
+        transactionCount (int): Number of transactions in the period
+        totals (Dict[str, float]): Sum of the transaction amounts per type
+        categories (List[PeriodCategoryTotal]): Totals per category and type
+    """
+
+    periodId: int
+    closed: bool
+    transactionCount: int
+    totals: Dict[str, float]
+    categories: List[PeriodCategoryTotal]
+
+
+class PeriodComparison(BaseModel):
+    """
+    Schema for the totals of one period in a period comparison.
+
+    Attributes:
+        periodId (int): The unique identifier of the finance period
+        name (str): A descriptive name for the finance period
+        startDate (datetime): The start date of the finance period
+        endDate (datetime): The end date of the finance period
+        transactionCount (int): Number of transactions in the period
+        totals (Dict[str, float]): Sum of the transaction amounts per type
+        categories (List[PeriodCategoryTotal]): Totals per category and type
+    """
+
+    periodId: int
+    name: Optional[str]
+    startDate: datetime
+    endDate: datetime
+    transactionCount: int
+    totals: Dict[str, float]
+    categories: List[PeriodCategoryTotal]
+
+
+class PeriodComparisonResponse(BaseModel):
+    """
+    Schema for the side-by-side totals of several finance periods.
+
+    Attributes:
+        periods (List[PeriodComparison]): Periods ordered by start date
+    """
+
+    periods: List[PeriodComparison]
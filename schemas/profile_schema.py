@@ -0,0 +1,50 @@
+"""
+Profile schema module for Finance Tracker API.
+
+This module defines Pydantic models for listing the stored request profile
+reports (see ``services.profiling``).
+"""
+
+from datetime import datetime
+from typing import List, Optional
+from pydantic import BaseModel
+
+
+class ProfileSummary(BaseModel):
+    """
+    Schema for a stored request profile report.
+
+    Attributes:
+        id (str): Report ID, as returned in the ``X-Profile-Id`` header
+        method (str): HTTP method of the profiled request
+        path (str): Path of the profiled request
+        userId (int): ID of the user who sent the request
+        trigger (str): Why the request was profiled ('header', 'user' or 'sample')
+        status (int, optional): HTTP status of the response
+        startedAt (datetime): When the request started
+        milliseconds (float): Total duration of the request
+        sqlMilliseconds (float): Time spent executing SQL statements
+        statementCount (int): Number of SQL statements recorded
+    """
+
+    id: str
+    method: str
+    path: str
+    userId: int
+    trigger: str
+    status: Optional[int] = None
+    startedAt: datetime
+    milliseconds: float
+    sqlMilliseconds: float
+    statementCount: int
+
+
+class ProfileListResponse(BaseModel):
+    """
+    Schema for the list of stored request profile reports.
+
+    Attributes:
+        profiles (List[ProfileSummary]): Reports, newest first
+    """
+
+    profiles: List[ProfileSummary]
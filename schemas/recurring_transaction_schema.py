@@ -0,0 +1,38 @@
+"""
+Recurring transaction schema module for Finance Tracker API.
+
+This module defines Pydantic models for handling recurring transaction data
+in the Finance Tracker application. Recurring transactions are repeated
+payments (e.g., subscriptions, rent, salary) detected from the user's
+transaction history by the recurring-transaction detection job.
+"""
+
+from datetime import datetime
+from pydantic import BaseModel
+
+
+class RecurringTransactionResponse(BaseModel):
+    """
+    Schema for recurring transaction data retrieval.
+
+    Attributes:
+        id (int): The unique identifier of the recurrence
+        categoryId (int): The ID of the transaction category
+        amount (float): Typical amount of the repeated transactions
+        cadence (str): Detected cadence (e.g., 'weekly', 'monthly', 'yearly')
+        intervalDays (float): Median number of days between occurrences
+        occurrences (int): Number of matching transactions found
+        lastDate (datetime): Date of the most recent occurrence
+        nextDate (datetime): Expected date of the next occurrence
+        confidence (float): Regularity score of the recurrence (0-1)
+    """
+
+    id: int
+    categoryId: int
+    amount: float
+    cadence: str
+    intervalDays: float
+    occurrences: int
+    lastDate: datetime
+    nextDate: datetime
+    confidence: float
@@ -0,0 +1,69 @@
+"""
+Report schema module for Finance Tracker API.
+
+This module defines Pydantic models for the internal dashboard reports,
+which aggregate the data of all users and are computed by the analytics
+engine rather than the OLTP database.
+"""
+
+from typing import List
+from pydantic import BaseModel
+
+
+class CategoryBreakdownRow(BaseModel):
+    """
+    Schema for the totals of one category in one year.
+
+    Attributes:
+        year (int): Calendar year (UTC)
+        category (str): Lower-cased category name (empty if the category is unknown)
+        type (str): Transaction type (e.g. 'expense')
+        total (float): Sum of the transaction amounts
+        count (int): Number of transactions
+        users (int): Number of distinct users with such transactions
+    """
+
+    year: int
+    category: str
+    type: str
+    total: float
+    count: int
+    users: int
+
+
+class CategoryBreakdownResponse(BaseModel):
+    """
+    Schema for the category breakdown report.
+
+    Attributes:
+        yearFrom (int): First year of the report
+        yearTo (int): Last year of the report
+        rows (List[CategoryBreakdownRow]): Totals ordered by year and descending total
+    """
+
+    yearFrom: int
+    yearTo: int
+    rows: List[CategoryBreakdownRow]
+
+
+class MonthlyFlowsResponse(BaseModel):
+    """
+    Schema for the monthly money flows report.
+
+    All lists are aligned: the value at index ``i`` of every list belongs
+    to the month at index ``i`` of ``months``. Months without activity are
+    included with zero totals.
+
+    Attributes:
+        months (List[str]): Months in ``YYYY-MM`` format, oldest first
+        expenses (List[float]): Total of expense transactions per month
+        incomes (List[float]): Total of incomes and income transactions per month
+        capital (List[float]): Total of capital transactions per month
+        activeUsers (List[int]): Users with any activity per month
+    """
+
+    months: List[str]
+    expenses: List[float]
+    incomes: List[float]
+    capital: List[float]
+    activeUsers: List[int]
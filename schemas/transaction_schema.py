@@ -8,6 +8,7 @@ like category, date, amount, and comments.
 """
 
 from datetime import datetime
+from typing import Optional
 from pydantic import BaseModel
 
 
@@ -47,6 +48,8 @@ class TransactionCreateResponse(BaseModel):
         amount (float): The monetary amount of the transaction
         comment (str): Optional comment or description for the transaction
         type (str): The type of transaction (e.g., 'income', 'expense')
+        anomaly (float, optional): Distance of the amount from the category's mean
+            in standard deviations (None until the category has enough history)
     """
 
     id: int
@@ -55,6 +58,7 @@ class TransactionCreateResponse(BaseModel):
     amount: float
     comment: str
     type: str
+    anomaly: Optional[float] = None
 
 
 class TransactionResponse(BaseModel):
@@ -0,0 +1,69 @@
+"""
+Production server entry point for Finance Tracker API.
+
+This module starts the application with uvicorn, configured from
+``Settings``:
+
+- ``SERVER_WORKERS`` worker processes (0 = one per CPU core), each building
+  its own application with ``main.create_app``
+- ``SERVER_LOOP`` and ``SERVER_HTTP`` select uvloop and httptools when they
+  are installed (``auto``)
+- ``SERVER_KEEP_ALIVE_SECONDS`` and ``SERVER_BACKLOG`` tune connection handling
+- ``SERVER_GRACEFUL_TIMEOUT_SECONDS`` bounds how long in-flight requests may
+  run after a shutdown signal
+
+The resolved worker count is exported to the workers through the
+``SERVER_WORKERS`` environment variable, so every worker sizes its database
+pool to its share of ``DB_MAX_CONNECTIONS`` (see ``db.connect.pool_options``).
+
+Usage:
+    python -m serve [--host HOST] [--port PORT] [--workers N]
+"""
+
+import argparse
+import os
+import uvicorn
+from config import get_settings
+from db.connect import worker_count
+
+
+def main():
+    """Parse command line overrides and run the server."""
+    settings = get_settings()
+    parser = argparse.ArgumentParser(description="Run the Finance Tracker API.")
+    parser.add_argument("--host", default=settings.server_host)
+    parser.add_argument("--port", type=int, default=settings.server_port)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=settings.server_workers,
+        help="worker processes (0 = one per CPU core)",
+    )
+    args = parser.parse_args()
+
+    workers = worker_count(settings.model_copy(update={"server_workers": args.workers}))
+    if workers > settings.db_max_connections:
+        parser.error(
+            f"{workers} workers need at least {workers} database connections, "
+            f"DB_MAX_CONNECTIONS is {settings.db_max_connections}"
+        )
+    os.environ["SERVER_WORKERS"] = str(workers)
+    # A single worker runs in this process, make it see the exported count.
+    get_settings.cache_clear()
+
+    uvicorn.run(
+        "main:create_app",
+        factory=True,
+        host=args.host,
+        port=args.port,
+        workers=workers,
+        loop=settings.server_loop,
+        http=settings.server_http,
+        timeout_keep_alive=settings.server_keep_alive_seconds,
+        backlog=settings.server_backlog,
+        timeout_graceful_shutdown=settings.server_graceful_timeout_seconds,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+Admission control module for Finance Tracker API.
+
+This module provides the building blocks of ``AdmissionMiddleware``:
+
+- ``TokenBuckets``: per-user token buckets that refill at a steady rate and
+  allow short bursts, so a single client in a retry loop is throttled with
+  ``429 Too Many Requests`` before it can occupy the database pool
+- ``InFlightLimiter``: a cap on concurrently handled requests of a worker
+- ``pool_queue_length``: an estimate of how many requests of a worker are
+  queued for a database connection
+
+All state lives in the memory of one worker process; limits therefore apply
+per worker.
+"""
+
+import math
+import threading
+import time
+from services.cache import LRUCache
+
+MAX_TRACKED_USERS = 100000
+
+
+class TokenBuckets:
+    """
+    Per-user token bucket rate limiter.
+
+    Every user starts with a full bucket of ``burst`` tokens. Each request
+    takes one token and tokens are refilled at ``rate`` per second up to
+    ``burst``. Buckets of inactive users are evicted least recently used
+    first; an evicted user simply starts again with a full bucket.
+
+    Attributes:
+        rate (float): Tokens added per second (0 = no rate limit)
+        burst (int): Bucket capacity
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self._buckets = LRUCache(max_entries=MAX_TRACKED_USERS)
+        self._lock = threading.Lock()
+
+    def acquire(self, key):
+        """
+        Take a token from a user's bucket.
+
+        Args:
+            key: Bucket key (the user ID)
+
+        Returns:
+            float: 0 if the request is admitted, otherwise the seconds until
+                the next token is available
+        """
+        if not self.rate:
+            return 0.0
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated_at = self._buckets.get(key, (self.burst, now))
+            tokens = min(self.burst, tokens + (now - updated_at) * self.rate)
+            if tokens >= 1:
+                self._buckets.set(key, (tokens - 1, now))
+                return 0.0
+            self._buckets.set(key, (tokens, now))
+            return (1 - tokens) / self.rate
+
+
+class InFlightLimiter:
+    """
+    Cap on the number of requests handled at the same time.
+
+    Attributes:
+        limit (int): Maximum number of concurrent requests (0 = unlimited)
+        in_flight (int): Number of requests currently admitted
+    """
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.in_flight = 0
+        self._lock = threading.Lock()
+
+    def try_enter(self):
+        """
+        Admit a request if the cap is not reached.
+
+        Returns:
+            bool: True if the request was admitted and must call ``leave``
+        """
+        with self._lock:
+            if self.limit and self.in_flight >= self.limit:
+                return False
+            self.in_flight += 1
+            return True
+
+    def leave(self):
+        """Release the slot of an admitted request."""
+        with self._lock:
+            self.in_flight -= 1
+
+
+def pool_queue_length(pool, capacity: int, in_flight: int):
+    """
+    Estimate the number of requests waiting for a database connection.
+
+    When every connection of the pool is checked out, admitted requests that
+    do not hold a connection are assumed to be waiting for one.
+
+    Args:
+        pool: Connection pool of the primary engine
+        capacity (int): Maximum number of connections of the pool
+        in_flight (int): Number of requests currently admitted
+
+    Returns:
+        int: Estimated number of queued requests
+    """
+    if pool.checkedout() < capacity:
+        return 0
+    return max(0, in_flight - capacity)
+
+
+def retry_after(seconds: float):
+    """
+    Format a delay as a ``Retry-After`` header value.
+
+    Args:
+        seconds (float): Delay in seconds
+
+    Returns:
+        str: Whole seconds, at least 1
+    """
+    return str(max(1, math.ceil(seconds)))
@@ -0,0 +1,99 @@
+"""
+Analytics engine module for Finance Tracker API.
+
+This module answers the heavy report endpoints with an embedded DuckDB
+database over the Parquet files written by ``jobs.analytics_export``. The
+reports scan years of data across all users; running them here keeps that
+load off the PostgreSQL database that serves the OLTP endpoints.
+
+One in-memory DuckDB database is opened per worker process on first use, with
+a view per exported table over its part files. Views read the current set of
+files on every query, so new exports are visible without a restart. Every
+query runs on its own cursor, which DuckDB allows from several threads, and
+DuckDB is limited to ``ANALYTICS_THREADS`` threads so reports cannot take all
+cores of the API host.
+
+All timestamps are evaluated in UTC.
+"""
+
+import glob
+import os
+import threading
+from config import Settings
+
+ANALYTICS_TABLES = (
+    "transactions",
+    "incomes",
+    "capital_transactions",
+    "transaction_categories",
+)
+
+_connection = None
+_connection_lock = threading.Lock()
+
+
+class AnalyticsDataMissing(Exception):
+    """Raised when a table has not been exported to Parquet yet."""
+
+
+def table_files(settings: Settings, table: str):
+    """
+    Return the glob pattern of a table's part files.
+
+    Args:
+        settings (Settings): Application settings
+        table (str): Name of the exported table
+
+    Returns:
+        str: Glob pattern of the part files
+    """
+    return os.path.join(os.path.abspath(settings.analytics_dir), table, "*.parquet")
+
+
+def analytics_cursor(settings: Settings):
+    """
+    Return a new cursor of the analytics database, opening it on first use.
+
+    Args:
+        settings (Settings): Application settings
+
+    Returns:
+        duckdb.DuckDBPyConnection: Cursor for one query
+
+    Raises:
+        AnalyticsDataMissing: If a table has not been exported yet
+    """
+    global _connection
+    with _connection_lock:
+        if _connection is None:
+            missing = [
+                table
+                for table in ANALYTICS_TABLES
+                if not glob.glob(table_files(settings, table))
+            ]
+            if missing:
+                raise AnalyticsDataMissing(", ".join(missing))
+
+            # DuckDB is only needed by the report endpoints.
+            import duckdb
+
+            connection = duckdb.connect(
+                ":memory:", config={"threads": settings.analytics_threads}
+            )
+            connection.execute("SET TimeZone = 'UTC'")
+            for table in ANALYTICS_TABLES:
+                pattern = table_files(settings, table).replace("'", "''")
+                connection.execute(
+                    f"CREATE VIEW {table} AS SELECT * FROM read_parquet('{pattern}')"
+                )
+            _connection = connection
+        return _connection.cursor()
+
+
+def close_analytics():
+    """Close the analytics database of this process, if it was opened."""
+    global _connection
+    with _connection_lock:
+        if _connection is not None:
+            _connection.close()
+            _connection = None
@@ -0,0 +1,134 @@
+"""
+Analytics reports module for Finance Tracker API.
+
+This module holds the queries of the internal dashboard reports. They run on
+the DuckDB analytics engine (see ``services.analytics_engine``) and aggregate
+the exported data of all users over ranges of whole years.
+"""
+
+from datetime import datetime, timezone
+
+
+def year_range(year_from: int, year_to: int):
+    """
+    Return the UTC bounds of a range of whole years.
+
+    Args:
+        year_from (int): First year of the range
+        year_to (int): Last year of the range (inclusive)
+
+    Returns:
+        tuple: Inclusive start and exclusive end timestamps
+    """
+    return (
+        datetime(year_from, 1, 1, tzinfo=timezone.utc),
+        datetime(year_to + 1, 1, 1, tzinfo=timezone.utc),
+    )
+
+
+def category_breakdown(cursor, year_from: int, year_to: int):
+    """
+    Aggregate transactions per year, category name and type across all users.
+
+    Category names are compared case-insensitively, so categories that
+    different users named alike are reported together.
+
+    Args:
+        cursor: Analytics database cursor
+        year_from (int): First year of the report
+        year_to (int): Last year of the report (inclusive)
+
+    Returns:
+        list: ``{"year", "category", "type", "total", "count", "users"}`` dicts,
+            ordered by year and descending total
+    """
+    start, end = year_range(year_from, year_to)
+    rows = cursor.execute(
+        """
+        SELECT
+            CAST(date_part('year', t.date) AS INTEGER) AS year,
+            coalesce(lower(trim(c.name)), '') AS category,
+            t.type,
+            sum(t.amount) AS total,
+            count(*) AS count,
+            count(DISTINCT t.user_id) AS users
+        FROM transactions t
+        LEFT JOIN transaction_categories c ON c.id = t.category_id
+        WHERE t.date >= ? AND t.date < ?
+        GROUP BY ALL
+        ORDER BY year, total DESC, category
+        """,
+        [start, end],
+    ).fetchall()
+    return [
+        {
+            "year": year,
+            "category": category,
+            "type": transaction_type,
+            "total": total,
+            "count": count,
+            "users": users,
+        }
+        for year, category, transaction_type, total, count, users in rows
+    ]
+
+
+def monthly_flows(cursor, year_from: int, year_to: int):
+    """
+    Aggregate money flows per month across all users.
+
+    Months without any activity are included with zero totals so the series
+    is dense.
+
+    Args:
+        cursor: Analytics database cursor
+        year_from (int): First year of the report
+        year_to (int): Last year of the report (inclusive)
+
+    Returns:
+        dict: Aligned lists ``months`` (``YYYY-MM``), ``expenses`` (expense
+            transactions), ``incomes`` (incomes and income transactions),
+            ``capital`` (capital transactions) and ``activeUsers`` (users with
+            any of them)
+    """
+    start, end = year_range(year_from, year_to)
+    rows = cursor.execute(
+        """
+        WITH flows AS (
+            SELECT date, user_id,
+                CASE WHEN type = 'expense' THEN amount ELSE 0 END AS expense,
+                CASE WHEN type = 'income' THEN amount ELSE 0 END AS income,
+                0 AS capital
+            FROM transactions
+            UNION ALL
+            SELECT date, user_id, 0, amount, 0 FROM incomes
+            UNION ALL
+            SELECT date, user_id, 0, 0, amount FROM capital_transactions
+        ),
+        monthly AS (
+            SELECT
+                date_trunc('month', date) AS month,
+                sum(expense) AS expenses,
+                sum(income) AS incomes,
+                sum(capital) AS capital,
+                count(DISTINCT user_id) AS active_users
+            FROM flows
+            WHERE date >= $1 AND date < $2
+            GROUP BY 1
+        )
+        SELECT
+            strftime(months.month, '%Y-%m'),
+            coalesce(monthly.expenses, 0),
+            coalesce(monthly.incomes, 0),
+            coalesce(monthly.capital, 0),
+            coalesce(monthly.active_users, 0)
+        FROM (
+            SELECT range AS month FROM range($1, $2, INTERVAL 1 MONTH)
+        ) months
+        LEFT JOIN monthly ON monthly.month = months.month
+        ORDER BY months.month
+        """,
+        [start, end],
+    ).fetchall()
+    keys = ("months", "expenses", "incomes", "capital", "activeUsers")
+    return {key: [row[index] for row in rows] for index, key in enumerate(keys)}
@@ -0,0 +1,109 @@
+"""
+Dashboard bootstrap module for Finance Tracker API.
+
+This module computes the per-section validators of the dashboard bootstrap
+endpoint (see ``entities.bootstrap``). The versions of the user's categories,
+periods and transactions are read with one statement of index-only scans on
+the ``(user_id, row_version)`` indexes (see ``db.change_tracking``). Sections
+whose ETag the client already has are not loaded at all.
+
+Transactions can commit out of order, so the highest ``row_version`` alone
+could stay the same when an older transaction commits its write after a
+newer one. Like the change feed (see ``services.change_feed``), versions are
+therefore split at the oldest running transaction (``pg_snapshot_xmin``):
+below it only the highest version is used, because every transaction there
+has finished; rows written at or above it are listed with their IDs. Together
+with the row count, which covers deletions, the version changes with every
+committed write.
+"""
+
+import hashlib
+from sqlalchemy import BigInteger, Integer, Text, cast, func, literal, select, union_all
+from sqlalchemy.orm import Session
+from db.models.finance_periods_model import FinancePeriod
+from db.models.transaction_categories_model import TransactionCategory
+from db.models.transaction_model import Transaction
+
+VERSIONED_SECTIONS = {
+    "categories": TransactionCategory,
+    "periods": FinancePeriod,
+    "transactions": Transaction,
+}
+
+
+def section_versions(db: Session, user_id: int):
+    """
+    Read the versions of a user's categories, periods and transactions.
+
+    Args:
+        db (Session): Database session used for data access
+        user_id (int): ID of the user
+
+    Returns:
+        dict: ``(row count, highest row_version below the watermark, recent rows)``
+            per section, where recent rows are sorted ``(id, row_version)`` pairs
+    """
+    # Evaluated once per statement, so every branch uses the same watermark.
+    watermark = cast(
+        cast(func.pg_snapshot_xmin(func.pg_current_snapshot()), Text), BigInteger
+    )
+    no_value = literal(None, BigInteger)
+    statement = union_all(
+        *(
+            select(
+                literal(section),
+                func.count(),
+                func.coalesce(
+                    func.max(model.row_version).filter(model.row_version < watermark),
+                    0,
+                ),
+                literal(None, Integer),
+                no_value,
+            ).where(model.user_id == user_id)
+            for section, model in VERSIONED_SECTIONS.items()
+        ),
+        *(
+            select(
+                literal(section), no_value, no_value, model.id, model.row_version
+            ).where(model.user_id == user_id, model.row_version >= watermark)
+            for section, model in VERSIONED_SECTIONS.items()
+        ),
+    )
+    totals = {}
+    recent = {section: [] for section in VERSIONED_SECTIONS}
+    for section, count, version, row_id, row_version in db.execute(statement):
+        if row_id is None:
+            totals[section] = (count, version)
+        else:
+            recent[section].append((row_id, row_version))
+    return {
+        section: (*totals[section], tuple(sorted(recent[section])))
+        for section in VERSIONED_SECTIONS
+    }
+
+
+def section_etag(*parts):
+    """
+    Build a strong ETag from the values a section depends on.
+
+    Args:
+        *parts: Versions, query parameters or content of the section
+
+    Returns:
+        str: Quoted ETag
+    """
+    digest = hashlib.sha1(repr(parts).encode()).hexdigest()[:20]
+    return f'"{digest}"'
+
+
+def parse_if_none_match(header: str):
+    """
+    Parse the ETags of an ``If-None-Match`` header.
+
+    Args:
+        header (str): Header value, e.g. ``"a1", "b2"``
+
+    Returns:
+        set: Quoted ETags, without weak validator prefixes
+    """
+    return {tag.strip().removeprefix("W/") for tag in header.split(",") if tag.strip()}
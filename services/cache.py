@@ -0,0 +1,123 @@
+"""
+In-process cache module for Finance Tracker API.
+
+This module provides a small thread-safe LRU cache used by the per-user
+lookup and result caches of the application. Entries can expire after a
+time-to-live, the number of entries is bounded, and hit, miss and eviction
+counters are kept for monitoring.
+
+The caches live in the memory of one worker process. Every cache that holds
+data which can change is invalidated explicitly by the write paths of the
+same process; the time-to-live bounds how long other worker processes can
+serve stale entries. Named caches are listed in ``CACHES`` so their counters
+can be inspected (see ``entities.diagnostics``).
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+CACHES = {}
+
+
+class LRUCache:
+    """
+    Thread-safe bounded LRU cache with optional time-to-live.
+
+    Attributes:
+        max_entries (int): Maximum number of entries before the least recently
+            used entry is evicted
+        ttl_seconds (float, optional): Lifetime of an entry in seconds (None = no expiry)
+        name (str, optional): Name the cache is registered under in ``CACHES``
+        hits (int): Number of lookups that found a live entry
+        misses (int): Number of lookups that found no live entry
+        evictions (int): Number of entries evicted because the cache was full
+    """
+
+    def __init__(
+        self, max_entries: int = 1024, ttl_seconds: float = None, name: str = None
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.name = name
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        if name is not None:
+            CACHES[name] = self
+
+    def get(self, key, default=None):
+        """
+        Look up an entry and mark it as recently used.
+
+        Args:
+            key: Cache key
+            default: Value returned when the key is missing or expired
+
+        Returns:
+            The cached value, or ``default``
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or (entry[0] is not None and entry[0] < time.monotonic()):
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return default
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key, value, ttl_seconds: float = None):
+        """
+        Store an entry, evicting the least recently used one if the cache is full.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl_seconds (float, optional): Lifetime of this entry. Defaults to the
+                cache's ``ttl_seconds``
+        """
+        if ttl_seconds is None:
+            ttl_seconds = self.ttl_seconds
+        expires_at = time.monotonic() + ttl_seconds if ttl_seconds is not None else None
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def pop(self, key):
+        """
+        Remove an entry if it exists.
+
+        Args:
+            key: Cache key
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        """
+        Return the cache counters.
+
+        Returns:
+            dict: ``size``, ``maxEntries``, ``hits``, ``misses`` and ``evictions``
+        """
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "maxEntries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
@@ -0,0 +1,101 @@
+"""
+Transaction category lookup cache module for Finance Tracker API.
+
+This module keeps a per-user dictionary of transaction categories in memory.
+A user's category set is small and rarely changes, so list endpoints can
+select transaction columns only and attach category names from this lookup
+instead of joining the transaction_categories table on every page.
+
+The lookup of a user is dropped by ``create_transaction_categories``. Workers
+that did not handle the write reload the lookup when they meet an unknown
+category ID, and entries expire after ``CATEGORY_CACHE_TTL_SECONDS``. IDs
+that are still unknown after a reload (deleted categories, or categories of
+another user) are remembered for ``MISSING_CATEGORY_TTL_SECONDS``, so pages
+that reference them do not reload the lookup on every request.
+"""
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from db.models.transaction_categories_model import TransactionCategory
+from services.cache import LRUCache
+
+CATEGORY_CACHE_SIZE = 10000
+CATEGORY_CACHE_TTL_SECONDS = 300
+MISSING_CATEGORY_TTL_SECONDS = 60
+
+_category_lookups = LRUCache(
+    max_entries=CATEGORY_CACHE_SIZE,
+    ttl_seconds=CATEGORY_CACHE_TTL_SECONDS,
+    name="category_lookups",
+)
+_missing_categories = LRUCache(
+    max_entries=CATEGORY_CACHE_SIZE, ttl_seconds=MISSING_CATEGORY_TTL_SECONDS
+)
+
+
+def get_category_lookup(db: Session, user_id: int):
+    """
+    Return the categories of a user keyed by category ID.
+
+    Args:
+        db (Session): Database session used on a cache miss
+        user_id (int): ID of the user whose categories are returned
+
+    Returns:
+        dict: Mapping of category ID to ``{"id", "name", "type"}`` dicts
+    """
+    lookup = _category_lookups.get(user_id)
+    if lookup is None:
+        rows = db.execute(
+            select(
+                TransactionCategory.id,
+                TransactionCategory.name,
+                TransactionCategory.type,
+            ).where(TransactionCategory.user_id == user_id)
+        ).all()
+        lookup = {
+            category_id: {"id": category_id, "name": name, "type": category_type}
+            for category_id, name, category_type in rows
+        }
+        _category_lookups.set(user_id, lookup)
+    return lookup
+
+
+def get_category_lookup_for(db: Session, user_id: int, category_ids):
+    """
+    Return the categories of a user, reloading once if any ID is unknown.
+
+    IDs that were already unknown after a recent reload do not cause another.
+
+    Args:
+        db (Session): Database session used on a cache miss
+        user_id (int): ID of the user whose categories are returned
+        category_ids (Iterable[int]): Category IDs that must be resolvable
+
+    Returns:
+        dict: Mapping of category ID to ``{"id", "name", "type"}`` dicts
+    """
+    lookup = get_category_lookup(db, user_id)
+    missing = _missing_categories.get(user_id, frozenset())
+    unknown = {category_id for category_id in category_ids if category_id not in lookup}
+    if unknown - missing:
+        invalidate_category_lookup(user_id)
+        lookup = get_category_lookup(db, user_id)
+        missing = frozenset(
+            category_id
+            for category_id in unknown | missing
+            if category_id not in lookup
+        )
+        _missing_categories.set(user_id, missing)
+    return lookup
+
+
+def invalidate_category_lookup(user_id: int):
+    """
+    Drop the cached categories of a user.
+
+    Args:
+        user_id (int): ID of the user whose categories changed
+    """
+    _category_lookups.pop(user_id)
+    _missing_categories.pop(user_id)
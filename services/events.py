@@ -0,0 +1,323 @@
+"""
+Event bus module for Finance Tracker API.
+
+This module pushes change events to the browser sessions of a user, so the
+frontend can update its lists instead of polling them. Endpoints publish
+events after their writes are committed; ``GET /api/v1/events`` streams the
+events of the authenticated user as Server-Sent Events.
+
+The bus fans events out to the subscribers connected to this worker process.
+Events travel between publishers and the bus through a backend, selected
+with the ``EVENT_BACKEND`` setting:
+
+- ``memory``: events are delivered in-process only. Suitable for a single
+  worker
+- ``postgres``: events are sent with ``NOTIFY`` and every worker ``LISTEN``s
+  on one channel, so events reach subscribers on all workers without extra
+  infrastructure. Publishers pass their request's session, so the ``NOTIFY``
+  reuses its connection instead of taking a second one from the pool
+
+Events are best effort: publish errors are logged, never raised. A
+subscriber that cannot keep up, or that may have missed events while the
+backend reconnected, receives a ``resync`` event and should refetch its data.
+"""
+
+import asyncio
+import json
+import logging
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import Session
+from config import Settings
+from db.connect import database_url, get_engine
+
+SUBSCRIBER_QUEUE_SIZE = 100
+NOTIFY_CHANNEL = "finance_events"
+# PostgreSQL rejects NOTIFY payloads of 8000 bytes or more.
+MAX_NOTIFY_PAYLOAD = 7900
+RECONNECT_DELAY_SECONDS = 1
+RESYNC = {"event": "resync", "data": {}}
+
+logger = logging.getLogger(__name__)
+
+
+class MemoryBackend:
+    """Backend that delivers events to the subscribers of this process only."""
+
+    async def start(self, deliver):
+        """
+        Start delivering published events.
+
+        Args:
+            deliver: Callback ``deliver(user_id, event)`` of the bus
+        """
+        self.deliver = deliver
+
+    async def stop(self):
+        """Stop delivering events."""
+
+    def publish(self, user_id: int, event: dict, db: Session = None):
+        """
+        Publish an event of a user.
+
+        Args:
+            user_id (int): ID of the user the event belongs to
+            event (dict): Event with ``event`` and ``data`` keys
+            db (Session, optional): Session of the publishing request (unused)
+        """
+        self.deliver(user_id, event)
+
+    @staticmethod
+    def is_local():
+        """Return True because events never leave this process."""
+        return True
+
+
+class PostgresBackend:
+    """
+    Backend that fans events out to all workers with LISTEN/NOTIFY.
+
+    Attributes:
+        url (str): libpq URL of the primary database
+    """
+
+    def __init__(self, settings: Settings):
+        self.url = (
+            make_url(database_url(settings))
+            .set(drivername="postgresql")
+            .render_as_string(hide_password=False)
+        )
+        self.listener = None
+
+    async def start(self, deliver):
+        """
+        Start listening for events on a dedicated connection.
+
+        Args:
+            deliver: Callback ``deliver(user_id, event)`` of the bus
+        """
+        self.listener = asyncio.create_task(self.listen(deliver))
+
+    async def stop(self):
+        """Stop listening and close the listening connection."""
+        if self.listener is not None:
+            self.listener.cancel()
+            try:
+                await self.listener
+            except asyncio.CancelledError:
+                pass
+
+    async def listen(self, deliver):
+        """
+        Deliver notifications, reconnecting when the connection is lost.
+
+        Args:
+            deliver: Callback ``deliver(user_id, event)`` of the bus
+        """
+        import psycopg
+
+        reconnecting = False
+        while True:
+            try:
+                async with await psycopg.AsyncConnection.connect(
+                    self.url, autocommit=True
+                ) as connection:
+                    await connection.execute(f"LISTEN {NOTIFY_CHANNEL}")
+                    if reconnecting:
+                        # Events sent while disconnected are lost.
+                        deliver(None, RESYNC)
+                    reconnecting = True
+                    async for notification in connection.notifies():
+                        message = json.loads(notification.payload)
+                        deliver(message["userId"], message["event"])
+            except psycopg.Error:
+                logger.exception("Event listener connection lost")
+                reconnecting = True
+                await asyncio.sleep(RECONNECT_DELAY_SECONDS)
+
+    def publish(self, user_id: int, event: dict, db: Session = None):
+        """
+        Publish an event of a user to all workers.
+
+        Args:
+            user_id (int): ID of the user the event belongs to
+            event (dict): Event with ``event`` and ``data`` keys
+            db (Session, optional): Session of the publishing request, whose
+                committed write the event reports. The notification is sent
+                in a new transaction of the session. Without a session a
+                connection is taken from the pool
+        """
+        payload = json.dumps({"userId": user_id, "event": event})
+        if len(payload) > MAX_NOTIFY_PAYLOAD:
+            payload = json.dumps({"userId": user_id, "event": RESYNC})
+        statement = text("SELECT pg_notify(:channel, :payload)")
+        parameters = {"channel": NOTIFY_CHANNEL, "payload": payload}
+        if db is None:
+            with get_engine().begin() as connection:
+                connection.execute(statement, parameters)
+            return
+        try:
+            db.execute(statement, parameters)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+
+    @staticmethod
+    def is_local():
+        """Return False because subscribers may be connected to other workers."""
+        return False
+
+
+def create_backend(settings: Settings):
+    """
+    Create the event backend selected by ``EVENT_BACKEND``.
+
+    Args:
+        settings (Settings): Application settings
+
+    Returns:
+        MemoryBackend | PostgresBackend: The event backend
+    """
+    if settings.event_backend == "postgres":
+        return PostgresBackend(settings)
+    return MemoryBackend()
+
+
+class EventBus:
+    """
+    Per-user publish/subscribe hub of one worker process.
+
+    ``publish`` may be called from any thread, including the threadpool that
+    runs synchronous endpoints. Subscribers are asyncio queues served by the
+    event loop the bus was started on. Before ``start`` and after ``stop``
+    published events are dropped.
+
+    Attributes:
+        backend: Backend that carries events from publishers to the bus
+        subscribers (dict): Subscriber queues per user ID
+    """
+
+    def __init__(self, backend):
+        self.backend = backend
+        self.subscribers = defaultdict(set)
+        self.loop = None
+
+    async def start(self):
+        """Start receiving events on the running event loop."""
+        self.loop = asyncio.get_running_loop()
+        await self.backend.start(self.deliver)
+
+    async def stop(self):
+        """Stop receiving events and end every subscription."""
+        await self.backend.stop()
+        self.loop = None
+        for queues in self.subscribers.values():
+            for queue in queues:
+                self.close_queue(queue)
+
+    def wants(self, user_id: int):
+        """
+        Check whether events of a user may have subscribers.
+
+        Publishers use this to skip building events nobody receives.
+
+        Args:
+            user_id (int): ID of the user
+
+        Returns:
+            bool: False only if the user certainly has no subscribers
+        """
+        if self.loop is None:
+            return False
+        return not self.backend.is_local() or bool(self.subscribers.get(user_id))
+
+    def publish(self, user_id: int, event_type: str, data, db: Session = None):
+        """
+        Publish an event of a user.
+
+        Must be called after the write is committed. Errors are logged, so
+        callers can publish outside their error handling.
+
+        Args:
+            user_id (int): ID of the user the event belongs to
+            event_type (str): Event name (e.g. ``transaction.created``)
+            data: JSON-serialisable payload, such as a response model
+            db (Session, optional): Session of the publishing request
+        """
+        if self.loop is None:
+            return
+        try:
+            event = {"event": event_type, "data": jsonable_encoder(data)}
+            self.backend.publish(user_id, event, db)
+        except Exception:
+            logger.exception("Could not publish %s event", event_type)
+
+    def deliver(self, user_id, event: dict):
+        """
+        Hand an event to the event loop for fan-out.
+
+        Args:
+            user_id (int): ID of the user, or None for all users
+            event (dict): Event with ``event`` and ``data`` keys
+        """
+        loop = self.loop
+        if loop is not None:
+            loop.call_soon_threadsafe(self.fan_out, user_id, event)
+
+    def fan_out(self, user_id, event: dict):
+        """
+        Put an event into the queues of the user's subscribers.
+
+        Args:
+            user_id (int): ID of the user, or None for all users
+            event (dict): Event with ``event`` and ``data`` keys
+        """
+        if user_id is None:
+            queues = [queue for queues in self.subscribers.values() for queue in queues]
+        else:
+            queues = list(self.subscribers.get(user_id, ()))
+        for queue in queues:
+            if queue.full():
+                # The subscriber is too slow; make it start over.
+                self.close_queue(queue, RESYNC)
+            else:
+                queue.put_nowait(event)
+
+    @staticmethod
+    def close_queue(queue: asyncio.Queue, last_event: dict = None):
+        """
+        End a subscription, optionally after one final event.
+
+        Args:
+            queue (asyncio.Queue): Subscriber queue
+            last_event (dict, optional): Event delivered before the end
+        """
+        while not queue.empty():
+            queue.get_nowait()
+        if last_event is not None:
+            queue.put_nowait(last_event)
+        queue.put_nowait(None)
+
+    @asynccontextmanager
+    async def subscribe(self, user_id: int):
+        """
+        Subscribe to the events of a user.
+
+        Args:
+            user_id (int): ID of the user
+
+        Yields:
+            asyncio.Queue: Queue of events; ``None`` marks the end of the subscription
+        """
+        queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        self.subscribers[user_id].add(queue)
+        try:
+            yield queue
+        finally:
+            self.subscribers[user_id].discard(queue)
+            if not self.subscribers[user_id]:
+                del self.subscribers[user_id]
@@ -0,0 +1,89 @@
+"""
+Sparse fieldsets module for Finance Tracker API.
+
+This module implements the ``fields=`` query parameter of the list endpoints.
+Each endpoint describes its response fields as a mapping of API field name to
+the ORM column that backs it; the requested subset then drives both the SQL
+SELECT list and the keys of the serialized items, so columns a client does
+not render are neither read, hydrated nor encoded.
+
+The ``id`` field is always returned so that clients can keep identifying
+rows. An empty ``fields`` parameter selects every field.
+
+Example:
+    GET /api/v1/transactions/?fields=date,amount
+    Returns: {"content": [{"id": 1, "date": "...", "amount": 25.5}], ...}
+"""
+
+from fastapi import HTTPException, status
+
+
+def parse_fields(fields: str, available: dict):
+    """
+    Parse a comma separated ``fields`` parameter.
+
+    Args:
+        fields (str): Requested field names (empty = all fields)
+        available (dict): Mapping of API field name to ORM column, in response order
+
+    Returns:
+        list: Selected API field names in response order, always including ``id``
+
+    Raises:
+        HTTPException: 400 Bad Request if an unknown field is requested
+    """
+    if not fields:
+        return list(available)
+
+    requested = {field.strip() for field in fields.split(",") if field.strip()}
+    unknown = requested - available.keys()
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown fields: {', '.join(sorted(unknown))}",
+        )
+    requested.add("id")
+    return [field for field in available if field in requested]
+
+
+def select_columns(selected, available: dict):
+    """
+    Return the ORM columns backing the selected fields.
+
+    Args:
+        selected (list): Field names returned by ``parse_fields``
+        available (dict): Mapping of API field name to ORM column
+
+    Returns:
+        list: Columns to pass to ``Session.query`` or ``select``
+    """
+    return [available[field] for field in selected]
+
+
+def row_to_item(row, selected, available: dict):
+    """
+    Build a response item holding only the selected fields of a result row.
+
+    Args:
+        row: Result row of a query over ``select_columns(selected, available)``
+        selected (list): Field names returned by ``parse_fields``
+        available (dict): Mapping of API field name to ORM column
+
+    Returns:
+        dict: Item keyed by API field name
+    """
+    return {field: getattr(row, available[field].key) for field in selected}
+
+
+def is_sparse(selected, available: dict):
+    """
+    Check whether a field selection omits any field.
+
+    Args:
+        selected (list): Field names returned by ``parse_fields``
+        available (dict): Mapping of API field name to ORM column
+
+    Returns:
+        bool: True if some fields were left out
+    """
+    return len(selected) < len(available)
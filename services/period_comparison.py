@@ -0,0 +1,141 @@
+"""
+Period comparison module for Finance Tracker API.
+
+This module summarises many finance periods of a user side by side, e.g.
+every month of the last two years, without one query per period.
+
+Periods are loaded together with their snapshots (see
+``services.period_snapshots``). Closed periods that already have a snapshot
+are served from it. All other periods are summarised by a single range
+join: every period is joined to the transactions whose date lies within
+its bounds and the result is grouped by period, category and type. The join
+condition uses the plain date bounds, so PostgreSQL probes the
+``(user_id, date, id)`` transaction index once per period.
+
+A transaction inside several overlapping periods is counted in each of
+them, exactly as the single-period summary would count it.
+"""
+
+from collections import defaultdict
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import and_, func, select
+from sqlalchemy.orm import Session
+from db.models.finance_period_snapshots_model import FinancePeriodSnapshot
+from db.models.finance_periods_model import FinancePeriod
+from db.models.transaction_model import Transaction
+from services.period_snapshots import summarize_totals
+
+
+def load_periods(
+    db: Session,
+    user_id: int,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+    limit: Optional[int] = None,
+):
+    """
+    Load a user's periods that overlap a date range, with their snapshots.
+
+    Args:
+        db (Session): Database session used for data access
+        user_id (int): ID of the user who owns the periods
+        date_from (datetime, optional): Only periods ending on or after this date
+        date_to (datetime, optional): Only periods starting on or before this date
+        limit (int, optional): Maximum number of periods to load
+
+    Returns:
+        list: ``(id, name, date_start, date_end, summary)`` rows ordered by start
+            date, where ``summary`` is the snapshot summary or None
+    """
+    query = (
+        select(
+            FinancePeriod.id,
+            FinancePeriod.name,
+            FinancePeriod.date_start,
+            FinancePeriod.date_end,
+            FinancePeriodSnapshot.summary,
+        )
+        .outerjoin(
+            FinancePeriodSnapshot, FinancePeriodSnapshot.period_id == FinancePeriod.id
+        )
+        .where(FinancePeriod.user_id == user_id)
+        .order_by(FinancePeriod.date_start, FinancePeriod.id)
+        .limit(limit)
+    )
+    if date_from is not None:
+        query = query.where(FinancePeriod.date_end >= date_from)
+    if date_to is not None:
+        query = query.where(FinancePeriod.date_start <= date_to)
+    return db.execute(query).all()
+
+
+def range_join_totals(db: Session, user_id: int, period_ids):
+    """
+    Aggregate the transactions of several periods with one range join.
+
+    Args:
+        db (Session): Database session used for data access
+        user_id (int): ID of the user who owns the periods
+        period_ids (list): IDs of the periods to aggregate
+
+    Returns:
+        dict: ``(category_id, type, total, count)`` rows per period ID
+    """
+    rows = db.execute(
+        select(
+            FinancePeriod.id,
+            Transaction.category_id,
+            Transaction.type,
+            func.sum(Transaction.amount),
+            func.count(),
+        )
+        .join(
+            Transaction,
+            and_(
+                Transaction.user_id == user_id,
+                Transaction.date >= FinancePeriod.date_start,
+                Transaction.date <= FinancePeriod.date_end,
+            ),
+        )
+        .where(FinancePeriod.id.in_(period_ids))
+        .group_by(FinancePeriod.id, Transaction.category_id, Transaction.type)
+    )
+    totals = defaultdict(list)
+    for period_id, *category_total in rows:
+        totals[period_id].append(category_total)
+    return totals
+
+
+def compare_periods(db: Session, user_id: int, periods):
+    """
+    Summarise several periods of a user.
+
+    Args:
+        db (Session): Database session used for data access
+        user_id (int): ID of the user who owns the periods
+        periods (list): Rows returned by ``load_periods``
+
+    Returns:
+        list: Period dicts with ``periodId``, ``name``, ``startDate``,
+            ``endDate``, ``transactionCount``, ``totals`` and ``categories``,
+            in the order of ``periods``
+    """
+    unsnapshotted = [period.id for period in periods if period.summary is None]
+    joined = range_join_totals(db, user_id, unsnapshotted) if unsnapshotted else {}
+
+    comparison = []
+    for period in periods:
+        summary = period.summary or summarize_totals(joined.get(period.id, ()))
+        comparison.append(
+            {
+                "periodId": period.id,
+                "name": period.name,
+                "startDate": period.date_start,
+                "endDate": period.date_end,
+                "transactionCount": summary["transactionCount"],
+                "totals": summary["totals"],
+                "categories": summary["categories"],
+            }
+        )
+    return comparison
@@ -0,0 +1,223 @@
+"""
+Finance period forecasting module for Finance Tracker API.
+
+This module projects end-of-period spend and income per category for a
+finance period. The history of every category is loaded in one columnar
+query covering the period itself and a number of preceding windows of the
+same length; all projections are then computed at once with NumPy.
+
+Two projections are produced for each category:
+- Pace projection: the amount so far extrapolated linearly to the period end
+- History projection: the amount so far plus what was added during the rest
+  of each past window, averaged across windows
+
+The spread of the per-window history projections provides the confidence range.
+"""
+
+import time
+import numpy as np
+from sqlalchemy import Float, cast, func, select
+from sqlalchemy.orm import Session
+from db.models.finance_periods_model import FinancePeriod
+from db.models.transaction_model import Transaction
+
+CONFIDENCE_PERCENTILES = (10, 90)
+
+
+def load_forecast_columns(
+    db: Session, user_id: int, window_start: float, window_end: float
+):
+    """
+    Load the transaction columns needed for a forecast in one query.
+
+    Args:
+        db (Session): Database session used to run the query
+        user_id (int): ID of the user whose transactions are loaded
+        window_start (float): Start of the history window in epoch seconds
+        window_end (float): End of the loaded range in epoch seconds
+
+    Returns:
+        dict: NumPy arrays keyed by ``epoch``, ``amount``, ``category_id`` and ``type``
+    """
+    epoch = cast(func.extract("epoch", Transaction.date), Float)
+    statement = select(
+        epoch,
+        Transaction.amount,
+        Transaction.category_id,
+        Transaction.type,
+    ).where(
+        Transaction.user_id == user_id,
+        Transaction.date >= func.to_timestamp(window_start),
+        Transaction.date <= func.to_timestamp(window_end),
+    )
+    rows = db.execute(statement).all()
+    epochs, amount, category_id, transaction_type = zip(*rows) if rows else ((),) * 4
+
+    return {
+        "epoch": np.asarray(epochs, dtype=np.float64),
+        "amount": np.asarray(amount, dtype=np.float64),
+        "category_id": np.asarray(category_id, dtype=np.int64),
+        "type": np.asarray(transaction_type, dtype=np.str_),
+    }
+
+
+def forecast_period(
+    db: Session, user_id: int, period: FinancePeriod, history_periods: int
+):
+    """
+    Forecast the end-of-period totals of a finance period.
+
+    Args:
+        db (Session): Database session used to load the history
+        user_id (int): ID of the user who owns the period
+        period (FinancePeriod): The finance period to forecast
+        history_periods (int): Number of past windows of the same length to use
+
+    Returns:
+        dict: Forecast matching ``PeriodForecastResponse``
+    """
+    start = period.date_start.timestamp()
+    end = period.date_end.timestamp()
+    now = min(max(time.time(), start), end)
+    history_periods = max(0, history_periods)
+    length = max(end - start, 1.0)
+
+    columns = load_forecast_columns(db, user_id, start - history_periods * length, now)
+    forecast = compute_forecast(columns, start, length, now - start, history_periods)
+    forecast["periodId"] = period.id
+    return forecast
+
+
+def compute_forecast(
+    columns, start: float, length: float, elapsed: float, history_periods: int
+):
+    """
+    Compute per-category and per-type projections from columnar data.
+
+    Transactions before ``start`` are assigned to the past window they fall
+    in (window 0 immediately precedes the period). For every window the total
+    added after the same elapsed offset is what the history projection adds
+    to the amount so far.
+
+    Args:
+        columns (dict): Arrays as returned by ``load_forecast_columns``
+        start (float): Period start in epoch seconds
+        length (float): Period length in seconds
+        elapsed (float): Seconds elapsed since the period start
+        history_periods (int): Number of past windows loaded
+
+    Returns:
+        dict: Forecast without the ``periodId`` key
+    """
+    epoch = columns["epoch"]
+    amount = columns["amount"]
+    fraction = elapsed / length
+
+    type_names, type_codes = np.unique(columns["type"], return_inverse=True)
+    keys, key_index = np.unique(
+        columns["category_id"] * max(type_names.size, 1) + type_codes,
+        return_inverse=True,
+    )
+    key_count = keys.size
+
+    current = epoch >= start
+    so_far = np.bincount(
+        key_index[current], weights=amount[current], minlength=key_count
+    )
+
+    past = ~current
+    window = np.floor((start - epoch[past]) / length).astype(np.int64)
+    window = np.minimum(window, max(history_periods - 1, 0))
+    offset = epoch[past] - (start - (window + 1) * length)
+    cell = window * key_count + key_index[past]
+    cells = max(history_periods, 1) * key_count
+    full = np.bincount(cell, weights=amount[past], minlength=cells)
+    before = offset < elapsed
+    partial = np.bincount(cell[before], weights=amount[past][before], minlength=cells)
+    remaining = (full - partial).reshape(max(history_periods, 1), key_count)
+
+    # Windows older than the oldest transaction would count as zero spend.
+    window_counts = np.bincount(window, minlength=max(history_periods, 1))
+    populated = np.flatnonzero(window_counts)
+    valid_windows = int(populated.max()) + 1 if populated.size else 0
+    history = so_far[None, :] + remaining[:valid_windows]
+
+    type_of_key = keys % max(type_names.size, 1)
+    type_matrix = (type_of_key[:, None] == np.arange(type_names.size)[None, :]).astype(
+        np.float64
+    )
+
+    categories = _projections(so_far, history, fraction, valid_windows)
+    totals = _projections(
+        so_far @ type_matrix, history @ type_matrix, fraction, valid_windows
+    )
+    category_ids = (keys // max(type_names.size, 1)).tolist()
+    key_types = type_names[type_of_key].tolist()
+
+    return {
+        "elapsedFraction": fraction,
+        "historyPeriods": valid_windows,
+        "categories": [
+            {"categoryId": category_id, "type": key_type, **projection}
+            for category_id, key_type, projection in zip(
+                category_ids, key_types, categories
+            )
+        ],
+        "totals": [
+            {"type": type_name, **projection}
+            for type_name, projection in zip(type_names.tolist(), totals)
+        ],
+    }
+
+
+def _projections(so_far, history, fraction: float, valid_windows: int):
+    """
+    Combine pace and history projections with their confidence range.
+
+    Args:
+        so_far (np.ndarray): Amount so far per series
+        history (np.ndarray): History projections with one row per past window
+        fraction (float): Elapsed fraction of the period
+        valid_windows (int): Number of rows in ``history``
+
+    Returns:
+        list: One projection dict per series
+    """
+    pace = so_far / fraction if fraction > 0 else np.full(so_far.shape, np.nan)
+
+    if valid_windows:
+        history_mean = history.mean(axis=0)
+        low, high = np.percentile(history, CONFIDENCE_PERCENTILES, axis=0)
+        projected = history_mean
+    else:
+        history_mean = np.full(so_far.shape, np.nan)
+        projected = np.where(np.isnan(pace), so_far, pace)
+        low = high = projected
+
+    # The period can never end below what has already been recorded.
+    low = np.maximum(np.minimum(low, projected), so_far)
+    high = np.maximum(high, projected)
+
+    return [
+        {
+            "amountSoFar": amount,
+            "paceProjection": _optional(pace_value),
+            "historyProjection": _optional(history_value),
+            "projected": projected_value,
+            "low": low_value,
+            "high": high_value,
+        }
+        for amount, pace_value, history_value, projected_value, low_value, high_value in zip(
+            so_far.tolist(),
+            pace.tolist(),
+            history_mean.tolist(),
+            projected.tolist(),
+            low.tolist(),
+            high.tolist(),
+        )
+    ]
+
+
+def _optional(value: float):
+    """Return ``None`` for NaN so that missing projections serialize as null."""
+    return None if value != value else value
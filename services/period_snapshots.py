@@ -0,0 +1,247 @@
+"""
+Finance period snapshots module for Finance Tracker API.
+
+This module summarises finance periods and freezes the summary of closed
+periods. Once ``FinancePeriod.date_end`` has passed, the first summary request
+stores the aggregated totals in the finance_period_snapshots table and every
+later request is served from that row. Creating a backdated transaction that
+falls inside a closed period deletes its snapshot, so the next request
+recomputes it. Both paths lock the period row, so a snapshot is never taken
+from totals that miss a concurrently committed transaction.
+``period_totals`` recomputes the periods touched by a new transaction for the
+live update events (see ``services.events``).
+"""
+
+import hashlib
+import json
+from datetime import datetime, timezone
+from sqlalchemy import delete, func, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from db.models.finance_period_snapshots_model import FinancePeriodSnapshot
+from db.models.finance_periods_model import FinancePeriod
+from db.models.transaction_model import Transaction
+
+
+def compute_period_summary(
+    db: Session, user_id: int, date_start: datetime, date_end: datetime
+):
+    """
+    Aggregate the transactions of a date range with a single GROUP BY query.
+
+    Args:
+        db (Session): Database session used to run the query
+        user_id (int): ID of the user whose transactions are aggregated
+        date_start (datetime): Start of the range (inclusive)
+        date_end (datetime): End of the range (inclusive)
+
+    Returns:
+        dict: Summary with ``categories``, ``totals`` and ``transactionCount`` keys
+    """
+    rows = db.execute(
+        select(
+            Transaction.category_id,
+            Transaction.type,
+            func.sum(Transaction.amount),
+            func.count(),
+        )
+        .where(
+            Transaction.user_id == user_id,
+            Transaction.date >= date_start,
+            Transaction.date <= date_end,
+        )
+        .group_by(Transaction.category_id, Transaction.type)
+    ).all()
+    return summarize_totals(rows)
+
+
+def summarize_totals(rows):
+    """
+    Build a period summary from per-category totals.
+
+    Args:
+        rows (Iterable[tuple]): ``(category_id, type, total, count)`` rows
+
+    Returns:
+        dict: Summary with ``categories``, ``totals`` and ``transactionCount`` keys
+    """
+    categories = [
+        {
+            "categoryId": category_id,
+            "type": transaction_type,
+            "total": float(total),
+            "count": count,
+        }
+        for category_id, transaction_type, total, count in rows
+    ]
+    totals = {}
+    for category in categories:
+        totals[category["type"]] = totals.get(category["type"], 0.0) + category["total"]
+
+    return {
+        "categories": categories,
+        "totals": totals,
+        "transactionCount": sum(category["count"] for category in categories),
+    }
+
+
+def is_period_closed(period: FinancePeriod):
+    """
+    Check whether a finance period has ended.
+
+    Args:
+        period (FinancePeriod): The finance period to check
+
+    Returns:
+        bool: True if the period's end date is in the past
+    """
+    return period.date_end < datetime.now(timezone.utc)
+
+
+def get_period_summary(db: Session, user_id: int, period: FinancePeriod):
+    """
+    Summarise a finance period, serving closed periods from their snapshot.
+
+    Open periods are always computed from the transactions. For closed periods
+    the stored snapshot is returned, and taken first if it does not exist yet.
+
+    Args:
+        db (Session): Database session used for data access
+        user_id (int): ID of the user who owns the period
+        period (FinancePeriod): The finance period to summarise
+
+    Returns:
+        tuple: ``(summary, snapshot)`` where ``snapshot`` is the
+            ``FinancePeriodSnapshot`` of a closed period and ``None`` otherwise
+    """
+    if not is_period_closed(period):
+        summary = compute_period_summary(
+            db, user_id, period.date_start, period.date_end
+        )
+        return summary, None
+
+    snapshot = db.get(FinancePeriodSnapshot, period.id)
+    if not snapshot:
+        # Wait for backdated transactions of the period to commit, and keep
+        # new ones from invalidating the snapshot before it is stored.
+        db.execute(
+            select(FinancePeriod.id)
+            .where(FinancePeriod.id == period.id)
+            .with_for_update()
+        )
+        snapshot = db.get(FinancePeriodSnapshot, period.id)
+    if not snapshot:
+        summary = compute_period_summary(
+            db, user_id, period.date_start, period.date_end
+        )
+        snapshot = FinancePeriodSnapshot(
+            period_id=period.id,
+            user_id=user_id,
+            summary=summary,
+            transaction_count=summary["transactionCount"],
+        )
+        db.add(snapshot)
+        try:
+            db.commit()
+        except IntegrityError:
+            # A concurrent request stored the snapshot first.
+            db.rollback()
+            snapshot = db.get(FinancePeriodSnapshot, period.id)
+        else:
+            db.refresh(snapshot)
+
+    return snapshot.summary, snapshot
+
+
+def summary_etag(period_id: int, summary: dict):
+    """
+    Build the ETag of a period summary from its content.
+
+    Args:
+        period_id (int): ID of the finance period
+        summary (dict): Summary of the period
+
+    Returns:
+        str: Quoted ETag
+    """
+    content = json.dumps([period_id, summary], sort_keys=True)
+    return f'"{hashlib.sha1(content.encode()).hexdigest()[:20]}"'
+
+
+def periods_containing(user_id: int, date: datetime):
+    """
+    Build the query of the IDs of a user's periods that contain a date.
+
+    Args:
+        user_id (int): ID of the user who owns the periods
+        date (datetime): Date the periods must contain
+
+    Returns:
+        Select: Query of ``FinancePeriod.id``
+    """
+    return select(FinancePeriod.id).where(
+        FinancePeriod.user_id == user_id,
+        FinancePeriod.date_start <= date,
+        FinancePeriod.date_end >= date,
+    )
+
+
+def period_totals(db: Session, user_id: int, periods):
+    """
+    Recompute the totals of periods that contain a new transaction.
+
+    Called in the transaction that adds the transaction, after a flush, so
+    the totals include it.
+
+    Args:
+        db (Session): Database session of the write
+        user_id (int): ID of the user who owns the periods
+        periods (list): ``(id, date_start, date_end)`` rows returned by
+            ``invalidate_period_snapshots``
+
+    Returns:
+        list: ``{"periodId", "totals", "transactionCount"}`` dicts
+    """
+    result = []
+    for period_id, date_start, date_end in periods:
+        summary = compute_period_summary(db, user_id, date_start, date_end)
+        result.append(
+            {
+                "periodId": period_id,
+                "totals": summary["totals"],
+                "transactionCount": summary["transactionCount"],
+            }
+        )
+    return result
+
+
+def invalidate_period_snapshots(db: Session, user_id: int, date: datetime):
+    """
+    Delete the snapshots of all of a user's periods that contain a date.
+
+    This should be called in the same database transaction that adds the
+    transaction, so the snapshot and the new row are committed together. The
+    periods are share-locked until then: a snapshot being taken concurrently
+    either waits for the transaction or is stored first and deleted here.
+
+    Args:
+        db (Session): Database session of the write
+        user_id (int): ID of the user who owns the transaction
+        date (datetime): Date of the new transaction
+
+    Returns:
+        list: ``(id, date_start, date_end)`` rows of the periods that contain the date
+    """
+    periods = db.execute(
+        periods_containing(user_id, date)
+        .add_columns(FinancePeriod.date_start, FinancePeriod.date_end)
+        .order_by(FinancePeriod.id)
+        .with_for_update(read=True)
+    ).all()
+    if periods:
+        db.execute(
+            delete(FinancePeriodSnapshot).where(
+                FinancePeriodSnapshot.period_id.in_([period.id for period in periods])
+            )
+        )
+    return periods
@@ -0,0 +1,279 @@
+"""
+Request profiling module for Finance Tracker API.
+
+This module records where the time of individual requests goes, so slow
+requests reported by a user can be diagnosed in production. A profiled
+request produces a report with:
+
+- a cProfile call-stack profile of the endpoint function
+- every SQL statement executed for the request, with its duration
+- the request line, user, status and total duration
+
+Requests are selected by ``ProfilingMiddleware`` (see
+``middlewares.profiling_middleware``). The active profile is kept in the
+``current_profile`` context variable, which FastAPI copies into the
+threadpool thread that runs a synchronous endpoint. ``ProfiledRoute`` runs
+the endpoint under the profiler in that thread, and the SQLAlchemy cursor
+events append statements to it. Asynchronous endpoints share the event loop
+thread with other requests, so their reports contain the SQL statements and
+timings but no call-stack profile.
+
+Profiling is switched on with ``PROFILE_ENABLED``. When it is off, the
+middleware and the cursor events are not installed and the only cost is one
+context variable lookup per endpoint call. When it is on, requests that are
+not profiled also pay one lookup per SQL statement.
+
+Reports are stored in ``PROFILE_DIR`` as ``<id>.json`` plus ``<id>.prof``
+(``pstats`` format, e.g. for snakeviz). Only the ``PROFILE_MAX_REPORTS``
+newest reports are kept.
+"""
+
+import cProfile
+import functools
+import inspect
+import io
+import json
+import os
+import pstats
+import time
+import uuid
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from pathlib import Path
+from fastapi.routing import APIRoute
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from config import Settings
+
+MAX_SQL_STATEMENTS = 1000
+STATS_LINES = 60
+
+current_profile: ContextVar = ContextVar("current_profile", default=None)
+
+
+def profiling_enabled(settings: Settings):
+    """
+    Check whether request profiling is switched on.
+
+    Args:
+        settings (Settings): Application settings
+
+    Returns:
+        bool: The ``PROFILE_ENABLED`` setting
+    """
+    return settings.profile_enabled
+
+
+class RequestProfile:
+    """
+    Profile of one request.
+
+    Attributes:
+        id (str): Report ID, returned in the ``X-Profile-Id`` response header
+        method (str): HTTP method of the request
+        path (str): Path of the request
+        user_id (int): ID of the authenticated user
+        trigger (str): Why the request was profiled ('header', 'user' or 'sample')
+        profiler (cProfile.Profile): Call-stack profiler of the endpoint
+        statements (list): ``{"statement", "milliseconds"}`` dicts in execution order
+        status (int): HTTP status of the response
+    """
+
+    def __init__(self, method: str, path: str, user_id: int, trigger: str):
+        self.id = uuid.uuid4().hex[:16]
+        self.method = method
+        self.path = path
+        self.user_id = user_id
+        self.trigger = trigger
+        self.profiler = None
+        self.statements = []
+        self.status = None
+        self.started_at = datetime.now(timezone.utc)
+        self.started = time.perf_counter()
+
+    def run(self, function, *args, **kwargs):
+        """
+        Call a function under the call-stack profiler of this request.
+
+        Args:
+            function: Function to call in the current thread
+            *args: Positional arguments of the function
+            **kwargs: Keyword arguments of the function
+
+        Returns:
+            The return value of the function
+        """
+        self.profiler = self.profiler or cProfile.Profile()
+        self.profiler.enable()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            self.profiler.disable()
+
+    def add_statement(self, statement: str, seconds: float):
+        """
+        Record an executed SQL statement.
+
+        Args:
+            statement (str): SQL text, without parameter values
+            seconds (float): Execution time in seconds
+        """
+        if len(self.statements) < MAX_SQL_STATEMENTS:
+            self.statements.append(
+                {"statement": statement, "milliseconds": round(seconds * 1000, 3)}
+            )
+
+    def report(self):
+        """
+        Build the JSON report of the profile.
+
+        Returns:
+            dict: Request details, SQL statements and the top of the call-stack profile
+        """
+        stats = None
+        if self.profiler is not None:
+            output = io.StringIO()
+            pstats.Stats(self.profiler, stream=output).sort_stats(
+                "cumulative"
+            ).print_stats(STATS_LINES)
+            stats = output.getvalue()
+        return {
+            "id": self.id,
+            "method": self.method,
+            "path": self.path,
+            "userId": self.user_id,
+            "trigger": self.trigger,
+            "status": self.status,
+            "startedAt": self.started_at.isoformat(),
+            "milliseconds": round((time.perf_counter() - self.started) * 1000, 3),
+            "sqlMilliseconds": round(
+                sum(statement["milliseconds"] for statement in self.statements), 3
+            ),
+            "statements": self.statements,
+            "stats": stats,
+        }
+
+
+def profiled_endpoint(endpoint):
+    """
+    Wrap an endpoint so that it runs under the profiler of profiled requests.
+
+    Args:
+        endpoint: Endpoint function of a route
+
+    Returns:
+        The wrapped endpoint, with the same signature
+    """
+    if inspect.iscoroutinefunction(endpoint):
+        return endpoint
+
+    @functools.wraps(endpoint)
+    def wrapper(*args, **kwargs):
+        profile = current_profile.get()
+        if profile is None:
+            return endpoint(*args, **kwargs)
+        return profile.run(endpoint, *args, **kwargs)
+
+    return wrapper
+
+
+class ProfiledRoute(APIRoute):
+    """Route class that profiles the endpoint of profiled requests."""
+
+    def __init__(self, path: str, endpoint, **kwargs):
+        super().__init__(path, profiled_endpoint(endpoint), **kwargs)
+
+
+def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    """Remember the start time of a statement of a profiled request."""
+    if current_profile.get() is not None and context is not None:
+        # The execution context lives for this statement only, so a statement
+        # that fails leaves nothing behind on the pooled connection.
+        context.profile_started = time.perf_counter()
+
+
+def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    """Record a finished statement in the profile of the request."""
+    profile = current_profile.get()
+    started = getattr(context, "profile_started", None)
+    if profile is not None and started is not None:
+        profile.add_statement(statement, time.perf_counter() - started)
+
+
+def install_sql_capture():
+    """Register the cursor events that record SQL statements on all engines."""
+    if not event.contains(Engine, "before_cursor_execute", before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", after_cursor_execute)
+
+
+class ProfileStore:
+    """
+    Directory of profile reports.
+
+    Attributes:
+        directory (Path): Directory the reports are written to
+        max_reports (int): Number of newest reports to keep
+    """
+
+    def __init__(self, directory: str, max_reports: int):
+        self.directory = Path(directory)
+        self.max_reports = max_reports
+
+    def save(self, profile: RequestProfile):
+        """
+        Write the report of a finished profile and remove the oldest reports.
+
+        Args:
+            profile (RequestProfile): The finished profile
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        report_path = self.directory / f"{profile.id}.json"
+        temporary = report_path.with_suffix(".tmp")
+        temporary.write_text(json.dumps(profile.report()))
+        if profile.profiler is not None:
+            profile.profiler.dump_stats(self.directory / f"{profile.id}.prof")
+        os.replace(temporary, report_path)
+        for old in self.list()[self.max_reports :]:
+            self.remove(old.stem)
+
+    def list(self):
+        """
+        List the stored reports, newest first.
+
+        Returns:
+            list: Paths of the JSON reports
+        """
+        if not self.directory.is_dir():
+            return []
+        return sorted(
+            self.directory.glob("*.json"),
+            key=lambda path: path.stat().st_mtime,
+            reverse=True,
+        )
+
+    def path(self, profile_id: str, suffix: str = ".json"):
+        """
+        Return the path of a stored report file.
+
+        Args:
+            profile_id (str): Report ID
+            suffix (str): ``.json`` for the report, ``.prof`` for the pstats dump
+
+        Returns:
+            Path: Path of the file, or None if the ID is invalid or the file is missing
+        """
+        if not profile_id.isalnum():
+            return None
+        path = self.directory / f"{profile_id}{suffix}"
+        return path if path.is_file() else None
+
+    def remove(self, profile_id: str):
+        """
+        Delete the files of a report.
+
+        Args:
+            profile_id (str): Report ID
+        """
+        for suffix in (".json", ".prof"):
+            (self.directory / f"{profile_id}{suffix}").unlink(missing_ok=True)
@@ -0,0 +1,115 @@
+"""
+Recurring pattern detection module for Finance Tracker API.
+
+This module finds repeated transactions (subscriptions, rent, salary) in a
+user's history. Transactions of the same category with similar amounts are
+grouped together and a group is reported as recurring when the gaps between
+its transactions match a known cadence closely enough.
+
+The detection functions are pure and take only plain arrays so that they can
+run in worker processes of a ``ProcessPoolExecutor``.
+"""
+
+import numpy as np
+
+SECONDS_PER_DAY = 86400
+
+# (name, expected interval in days, allowed deviation in days)
+CADENCES = (
+    ("weekly", 7.0, 1.5),
+    ("biweekly", 14.0, 2.0),
+    ("monthly", 30.44, 3.5),
+    ("quarterly", 91.31, 7.0),
+    ("yearly", 365.25, 10.0),
+)
+AMOUNT_TOLERANCE = 0.1
+MIN_OCCURRENCES = 3
+MIN_REGULARITY = 0.75
+FULL_CONFIDENCE_OCCURRENCES = 6
+
+
+def match_cadence(interval_days: float):
+    """
+    Find the known cadence matching a median interval.
+
+    Args:
+        interval_days (float): Median number of days between occurrences
+
+    Returns:
+        tuple: ``(name, allowed deviation)`` of the cadence, or ``None`` if none matches
+    """
+    for name, expected, deviation in CADENCES:
+        if abs(interval_days - expected) <= deviation:
+            return name, deviation
+    return None
+
+
+def detect_user_recurrences(payload):
+    """
+    Detect the recurring transactions of a single user.
+
+    Transactions are sorted by category and amount; a new amount group starts
+    whenever the category changes or the amount grows by more than
+    ``AMOUNT_TOLERANCE``. Each group with enough occurrences is checked for a
+    regular cadence and must still be active at ``as_of``.
+
+    Args:
+        payload (tuple): ``(user_id, category_id, epoch, amount, as_of)`` where the
+            middle three are NumPy arrays and ``as_of`` is epoch seconds
+
+    Returns:
+        tuple: ``(user_id, recurrences)`` where ``recurrences`` is a list of dicts
+    """
+    user_id, category_id, epoch, amount, as_of = payload
+    if amount.size < MIN_OCCURRENCES:
+        return user_id, []
+
+    order = np.lexsort((amount, category_id))
+    category_id = category_id[order]
+    epoch = epoch[order]
+    amount = amount[order]
+
+    group_start = np.ones(amount.size, dtype=bool)
+    group_start[1:] = (category_id[1:] != category_id[:-1]) | (
+        np.abs(amount[1:]) > np.abs(amount[:-1]) * (1 + AMOUNT_TOLERANCE) + 0.01
+    )
+    starts = np.flatnonzero(group_start)
+    ends = np.append(starts[1:], amount.size)
+
+    recurrences = []
+    for start, end in zip(starts.tolist(), ends.tolist()):
+        if end - start < MIN_OCCURRENCES:
+            continue
+
+        dates = np.sort(epoch[start:end])
+        intervals = np.diff(dates) / SECONDS_PER_DAY
+        interval_days = float(np.median(intervals))
+        cadence = match_cadence(interval_days)
+        if cadence is None:
+            continue
+
+        name, deviation = cadence
+        regularity = float(np.mean(np.abs(intervals - interval_days) <= deviation))
+        last_date = float(dates[-1])
+        if regularity < MIN_REGULARITY:
+            continue
+        if as_of - last_date > 2 * interval_days * SECONDS_PER_DAY:
+            continue
+
+        occurrences = end - start
+        recurrences.append(
+            {
+                "user_id": user_id,
+                "category_id": int(category_id[start]),
+                "amount": float(np.median(amount[start:end])),
+                "cadence": name,
+                "interval_days": interval_days,
+                "occurrences": occurrences,
+                "last_date": last_date,
+                "next_date": last_date + interval_days * SECONDS_PER_DAY,
+                "confidence": regularity
+                * min(1.0, occurrences / FULL_CONFIDENCE_OCCURRENCES),
+            }
+        )
+
+    return user_id, recurrences
@@ -0,0 +1,189 @@
+"""
+Response format negotiation module for Finance Tracker API.
+
+This module lets list endpoints answer in more compact formats than the
+default JSON array of objects, selected with the ``Accept`` header:
+
+- ``application/json`` (default): the endpoint's regular response model
+- ``application/msgpack``: the same structure encoded as MessagePack
+- ``application/vnd.financetracker.columnar+json``: one array per field
+- ``application/vnd.financetracker.columnar+msgpack``: the columnar shape
+  encoded as MessagePack
+
+In the columnar shape nested objects that carry an ``id`` (such as the
+transaction ``category``) are replaced by an ``<name>Id`` column and
+deduplicated into a lookup table, so every category name is sent only once.
+
+Example columnar transaction page:
+    {
+        "totalCount": 150, "page": 0, "size": 2,
+        "columns": {
+            "id": [1, 2],
+            "categoryId": [2, 2],
+            "date": ["2024-01-15T10:30:00Z", "2024-01-16T08:00:00Z"],
+            "amount": [25.5, 4.2],
+            "comment": ["Lunch", "Coffee"],
+            "type": ["expense", "expense"]
+        },
+        "lookups": {"category": {"name": ["Food"], "id": [2]}}
+    }
+"""
+
+import json
+from datetime import date, datetime
+import msgpack
+from fastapi import Request, Response
+
+JSON = "json"
+MSGPACK = "msgpack"
+COLUMNAR_JSON = "columnar+json"
+COLUMNAR_MSGPACK = "columnar+msgpack"
+
+MEDIA_TYPES = {
+    "application/json": JSON,
+    "application/msgpack": MSGPACK,
+    "application/x-msgpack": MSGPACK,
+    "application/vnd.msgpack": MSGPACK,
+    "application/vnd.financetracker.columnar+json": COLUMNAR_JSON,
+    "application/vnd.financetracker.columnar+msgpack": COLUMNAR_MSGPACK,
+}
+
+RESPONSE_MEDIA_TYPES = {
+    JSON: "application/json",
+    MSGPACK: "application/msgpack",
+    COLUMNAR_JSON: "application/vnd.financetracker.columnar+json",
+    COLUMNAR_MSGPACK: "application/vnd.financetracker.columnar+msgpack",
+}
+
+
+def negotiate_format(request: Request):
+    """
+    Pick the response format from the request's ``Accept`` header.
+
+    Media types are ranked by their ``q`` parameter; the first supported one
+    wins. Unknown or missing headers fall back to JSON.
+
+    Args:
+        request (Request): The HTTP request object
+
+    Returns:
+        str: One of ``JSON``, ``MSGPACK``, ``COLUMNAR_JSON``, ``COLUMNAR_MSGPACK``
+    """
+    accept = request.headers.get("accept", "")
+    if not accept or accept == "*/*":
+        return JSON
+
+    ranked = []
+    for position, media_range in enumerate(accept.split(",")):
+        media_type, *parameters = (part.strip() for part in media_range.split(";"))
+        quality = 1.0
+        for parameter in parameters:
+            name, _, value = parameter.partition("=")
+            if name.strip() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if quality > 0 and media_type.lower() in MEDIA_TYPES:
+            ranked.append((-quality, position, MEDIA_TYPES[media_type.lower()]))
+
+    return min(ranked)[2] if ranked else JSON
+
+
+def to_columnar(items):
+    """
+    Convert a list of objects into one array per field.
+
+    Nested dicts with an ``id`` key become an ``<field>Id`` column plus a
+    deduplicated lookup table with one array per nested field.
+
+    Args:
+        items (list): Objects (dicts) that all share the same keys
+
+    Returns:
+        dict: ``{"columns": {...}, "lookups": {...}}``
+    """
+    columns = {}
+    lookups = {}
+    if not items:
+        return {"columns": columns, "lookups": lookups}
+
+    for field, sample in items[0].items():
+        values = [item[field] for item in items]
+        if isinstance(sample, dict) and "id" in sample:
+            columns[f"{field}Id"] = [value["id"] for value in values]
+            unique = {value["id"]: value for value in values}
+            lookups[field] = {
+                key: [value.get(key) for value in unique.values()] for key in sample
+            }
+        else:
+            columns[field] = values
+
+    return {"columns": columns, "lookups": lookups}
+
+
+def _encode_default(value):
+    """Encode values the JSON and MessagePack encoders do not support."""
+    if isinstance(value, datetime):
+        # Same representation as the Pydantic response models use.
+        encoded = value.isoformat()
+        return encoded[:-6] + "Z" if encoded.endswith("+00:00") else encoded
+    if isinstance(value, date):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not serializable")
+
+
+def encode(payload, response_format: str):
+    """
+    Encode a payload in a negotiated non-default format.
+
+    Args:
+        payload: Plain Python data (dicts, lists, scalars, datetimes)
+        response_format (str): Format returned by ``negotiate_format``
+
+    Returns:
+        bytes: Encoded body
+    """
+    if response_format in (MSGPACK, COLUMNAR_MSGPACK):
+        return msgpack.packb(payload, default=_encode_default)
+    return json.dumps(payload, default=_encode_default, separators=(",", ":")).encode()
+
+
+def render_list(
+    request: Request,
+    items,
+    envelope: dict = None,
+    key: str = "content",
+    sparse: bool = False,
+):
+    """
+    Render a list response in the negotiated format.
+
+    Args:
+        request (Request): The HTTP request object
+        items (list): Items of the list as plain dicts
+        envelope (dict, optional): Extra top-level fields such as pagination metadata
+        key (str): Key of the items in the row-based shape when ``envelope`` is given
+        sparse (bool): Whether the items hold a sparse fieldset; such items do not
+            fit the endpoint's response model, so JSON is encoded here as well
+
+    Returns:
+        Response: Encoded response, or ``None`` when the client asked for
+            regular JSON and the endpoint should return its response model
+    """
+    response_format = negotiate_format(request)
+    if response_format == JSON and not sparse:
+        return None
+
+    if response_format in (COLUMNAR_JSON, COLUMNAR_MSGPACK):
+        payload = {**(envelope or {}), **to_columnar(items)}
+    elif envelope is None:
+        payload = items
+    else:
+        payload = {**envelope, key: items}
+
+    return Response(
+        content=encode(payload, response_format),
+        media_type=RESPONSE_MEDIA_TYPES[response_format],
+        headers={"Vary": "Accept"},
+    )
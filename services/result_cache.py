@@ -0,0 +1,98 @@
+"""
+Versioned result cache module for Finance Tracker API.
+
+This module caches pages of the transaction list in memory. Users flip
+between the same few periods and filters, so the count and page queries of
+a view are often repeated with unchanged data.
+
+Every user has a data version. Cached results are keyed by the user, the
+user's current data version and the normalized query, so a write only has to
+bump the version (O(1)) to make all cached results of the user unreachable;
+they are evicted least recently used as new results come in.
+``CookieMiddleware`` bumps the version after every successful write request.
+
+Versions live in the worker process that handled the write, so other
+workers keep serving results of an older version until they expire. Requests
+inside the user's read-your-writes window bypass the cache, and entries
+expire after at most that window (see ``result_ttl_seconds``), so a result
+cached before a write is gone from every worker by the time the window ends
+and users always see their own writes.
+"""
+
+import itertools
+import threading
+from config import Settings
+from services.cache import LRUCache
+
+RESULT_CACHE_SIZE = 5000
+RESULT_CACHE_TTL_SECONDS = 60
+DATA_VERSION_CACHE_SIZE = 100000
+
+transaction_pages = LRUCache(
+    max_entries=RESULT_CACHE_SIZE,
+    ttl_seconds=RESULT_CACHE_TTL_SECONDS,
+    name="transaction_pages",
+)
+
+_data_versions = LRUCache(max_entries=DATA_VERSION_CACHE_SIZE)
+_version_counter = itertools.count(1)
+_version_lock = threading.Lock()
+
+
+def result_ttl_seconds(settings: Settings):
+    """
+    Return the lifetime of cached results.
+
+    Args:
+        settings (Settings): Application settings
+
+    Returns:
+        int: ``RESULT_CACHE_TTL_SECONDS``, capped at ``READ_YOUR_WRITES_SECONDS``
+    """
+    return min(RESULT_CACHE_TTL_SECONDS, settings.read_your_writes_seconds)
+
+
+def get_data_version(user_id: int):
+    """
+    Return the current data version of a user.
+
+    Versions are drawn from one process-wide counter, so a user whose
+    version was evicted gets a new version instead of reusing an old one.
+
+    Args:
+        user_id (int): ID of the user
+
+    Returns:
+        int: Data version of the user
+    """
+    with _version_lock:
+        version = _data_versions.get(user_id)
+        if version is None:
+            version = next(_version_counter)
+            _data_versions.set(user_id, version)
+        return version
+
+
+def bump_data_version(user_id: int):
+    """
+    Invalidate all cached results of a user.
+
+    Args:
+        user_id (int): ID of the user whose data changed
+    """
+    with _version_lock:
+        _data_versions.set(user_id, next(_version_counter))
+
+
+def result_key(user_id: int, **query):
+    """
+    Build the cache key of a result.
+
+    Args:
+        user_id (int): ID of the user the result belongs to
+        **query: Normalized query parameters; lists must be sorted by the caller
+
+    Returns:
+        tuple: Cache key including the user's current data version
+    """
+    return (user_id, get_data_version(user_id), tuple(sorted(query.items())))
@@ -0,0 +1,94 @@
+"""
+Spending heatmap module for Finance Tracker API.
+
+This module computes the per-day totals behind the calendar heatmap. The
+database groups a user's transactions of the requested range by local day
+with a single ``date_trunc`` GROUP BY, so only one row per active day is
+transferred. The rows are then spread into dense arrays with one entry per
+calendar day, where days without transactions hold zeros.
+
+A year of data is returned as two arrays of 365 numbers, a few kilobytes
+of JSON regardless of the number of transactions.
+"""
+
+from datetime import date, datetime, time, timedelta, timezone
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+from db.models.transaction_model import Transaction
+
+MAX_HEATMAP_DAYS = 366 * 5
+
+
+def load_daily_totals(
+    db: Session,
+    user_id: int,
+    start: date,
+    end: date,
+    tz_offset_minutes: int = 0,
+    transaction_type: str = "expense",
+):
+    """
+    Sum a user's transactions per local day.
+
+    Args:
+        db (Session): Database session used to run the query
+        user_id (int): ID of the user whose transactions are summed
+        start (date): First local day of the range (inclusive)
+        end (date): Last local day of the range (inclusive)
+        tz_offset_minutes (int): Offset of the user's timezone from UTC in minutes
+        transaction_type (str): Transaction type to include (empty = all types)
+
+    Returns:
+        list: ``(day, total, count)`` rows for the days that have transactions
+    """
+    offset = timedelta(minutes=tz_offset_minutes)
+    local_day = func.date_trunc(
+        "day", func.timezone("UTC", Transaction.date) + offset
+    ).label("day")
+    range_start = datetime.combine(start, time(), tzinfo=timezone.utc) - offset
+    range_end = (
+        datetime.combine(end + timedelta(days=1), time(), tzinfo=timezone.utc) - offset
+    )
+
+    statement = (
+        select(local_day, func.sum(Transaction.amount), func.count())
+        .where(
+            Transaction.user_id == user_id,
+            Transaction.date >= range_start,
+            Transaction.date < range_end,
+        )
+        .group_by(local_day)
+    )
+    if transaction_type:
+        statement = statement.where(Transaction.type == transaction_type)
+
+    return db.execute(statement).all()
+
+
+def dense_daily_series(rows, start: date, end: date):
+    """
+    Spread per-day rows into dense arrays covering every day of a range.
+
+    Args:
+        rows (list): ``(day, total, count)`` rows as returned by ``load_daily_totals``
+        start (date): First day of the range (inclusive)
+        end (date): Last day of the range (inclusive)
+
+    Returns:
+        dict: Heatmap matching ``SpendingHeatmapResponse``
+    """
+    days = (end - start).days + 1
+    totals = [0.0] * days
+    counts = [0] * days
+    for day, total, count in rows:
+        index = (day.date() - start).days
+        totals[index] = round(total, 2)
+        counts[index] = count
+
+    return {
+        "startDate": start.isoformat(),
+        "endDate": end.isoformat(),
+        "totals": totals,
+        "counts": counts,
+        "maxTotal": max(totals, default=0.0),
+    }
@@ -0,0 +1,218 @@
+"""
+Spending statistics module for Finance Tracker API.
+
+This module computes spending statistics for a user from a single columnar
+query. Only the ``date``, ``amount``, ``category_id`` and ``type`` columns
+are fetched and converted straight into NumPy arrays; every statistic is
+then computed with vectorized array operations, without ORM objects or
+per-row Python loops.
+
+The statistics include:
+- Dense monthly spend totals with a trailing moving average
+- Per-category mean, median and percentile transaction amounts
+- Weekday and hour-of-day spending profiles
+"""
+
+import numpy as np
+from sqlalchemy import Float, cast, func, select
+from sqlalchemy.orm import Session
+from db.models.transaction_model import Transaction
+
+SECONDS_PER_DAY = 86400
+SECONDS_PER_HOUR = 3600
+# 1970-01-01 was a Thursday, shifting by 3 days makes Monday weekday 0.
+EPOCH_WEEKDAY_SHIFT = 3
+PERCENTILES = (25, 50, 75, 90, 95)
+
+
+def load_spending_columns(db: Session, user_id: int):
+    """
+    Load the transaction columns needed for spending statistics.
+
+    The dates are converted to epoch seconds by the database so that the
+    result can be turned into NumPy arrays without parsing datetimes in Python.
+
+    Args:
+        db (Session): Database session used to run the query
+        user_id (int): ID of the user whose transactions are loaded
+
+    Returns:
+        dict: NumPy arrays keyed by ``epoch``, ``amount``, ``category_id`` and ``type``
+    """
+    statement = select(
+        cast(func.extract("epoch", Transaction.date), Float),
+        Transaction.amount,
+        Transaction.category_id,
+        Transaction.type,
+    ).where(Transaction.user_id == user_id)
+    rows = db.execute(statement).all()
+    epoch, amount, category_id, transaction_type = zip(*rows) if rows else ((),) * 4
+
+    return {
+        "epoch": np.asarray(epoch, dtype=np.float64),
+        "amount": np.asarray(amount, dtype=np.float64),
+        "category_id": np.asarray(category_id, dtype=np.int64),
+        "type": np.asarray(transaction_type, dtype=np.str_),
+    }
+
+
+def compute_spending_statistics(
+    columns, moving_average_window: int = 3, tz_offset_minutes: int = 0
+):
+    """
+    Compute all spending statistics from columnar transaction data.
+
+    Only expense transactions are taken into account. Time based statistics
+    are computed in UTC shifted by ``tz_offset_minutes`` so that weekday and
+    hour profiles match the user's local time.
+
+    Args:
+        columns (dict): Arrays as returned by ``load_spending_columns``
+        moving_average_window (int): Number of months in the moving average
+        tz_offset_minutes (int): Offset of the user's timezone from UTC in minutes
+
+    Returns:
+        dict: Statistics matching ``SpendingStatisticsResponse``
+    """
+    expense = columns["type"] == "expense"
+    epoch = columns["epoch"][expense] + tz_offset_minutes * 60
+    amount = columns["amount"][expense]
+    category_id = columns["category_id"][expense]
+
+    return {
+        "transactionCount": int(amount.size),
+        "monthly": monthly_trend(epoch, amount, moving_average_window),
+        "categories": category_distribution(category_id, amount),
+        "profile": time_profile(epoch, amount),
+    }
+
+
+def monthly_trend(epoch, amount, window: int):
+    """
+    Compute dense monthly spend totals and their trailing moving average.
+
+    Args:
+        epoch (np.ndarray): Transaction times in epoch seconds
+        amount (np.ndarray): Transaction amounts
+        window (int): Number of months in the moving average
+
+    Returns:
+        dict: Monthly trend matching ``MonthlySpendingTrend``
+    """
+    if epoch.size == 0:
+        return {"months": [], "totals": [], "counts": [], "movingAverage": []}
+
+    seconds = np.floor(epoch).astype(np.int64)
+    months = seconds.astype("datetime64[s]").astype("datetime64[M]")
+    first_month = months.min()
+    index = (months - first_month).astype(np.int64)
+    month_count = int(index.max()) + 1
+
+    totals = np.bincount(index, weights=amount, minlength=month_count)
+    counts = np.bincount(index, minlength=month_count)
+    labels = np.arange(first_month, first_month + month_count, dtype="datetime64[M]")
+
+    return {
+        "months": np.datetime_as_string(labels, unit="M").tolist(),
+        "totals": totals.tolist(),
+        "counts": counts.tolist(),
+        "movingAverage": moving_average(totals, window),
+    }
+
+
+def moving_average(values, window: int):
+    """
+    Compute a trailing moving average using cumulative sums.
+
+    Args:
+        values (np.ndarray): Series to average
+        window (int): Number of values in the window
+
+    Returns:
+        list: Averages aligned with ``values``, ``None`` until the window is filled
+    """
+    window = max(1, window)
+    cumulative = np.concatenate(([0.0], np.cumsum(values)))
+    averages = (cumulative[window:] - cumulative[:-window]) / window
+    padding = min(window - 1, values.size)
+    return [None] * padding + averages.tolist()
+
+
+def category_distribution(category_id, amount):
+    """
+    Compute per-category totals, means and percentile transaction amounts.
+
+    Transactions are sorted once by category and amount. Percentiles for all
+    categories are then read from the sorted array with linear interpolation,
+    which matches ``numpy.percentile`` without a per-category Python loop.
+
+    Args:
+        category_id (np.ndarray): Category ID of each transaction
+        amount (np.ndarray): Transaction amounts
+
+    Returns:
+        list: Per-category statistics matching ``CategorySpendingStatistics``
+    """
+    if amount.size == 0:
+        return []
+
+    order = np.lexsort((amount, category_id))
+    sorted_amount = amount[order]
+    categories, starts, counts = np.unique(
+        category_id[order], return_index=True, return_counts=True
+    )
+    totals = np.add.reduceat(sorted_amount, starts)
+
+    quantiles = np.asarray(PERCENTILES, dtype=np.float64) / 100
+    positions = starts[:, None] + quantiles[None, :] * (counts[:, None] - 1)
+    lower = np.floor(positions).astype(np.int64)
+    upper = np.ceil(positions).astype(np.int64)
+    values = sorted_amount[lower] + (sorted_amount[upper] - sorted_amount[lower]) * (
+        positions - lower
+    )
+    median = values[:, PERCENTILES.index(50)]
+
+    return [
+        {
+            "categoryId": category,
+            "count": count,
+            "total": total,
+            "mean": total / count,
+            "median": category_median,
+            "percentiles": {
+                f"p{percentile}": value
+                for percentile, value in zip(PERCENTILES, category_values)
+            },
+        }
+        for category, count, total, category_median, category_values in zip(
+            categories.tolist(),
+            counts.tolist(),
+            totals.tolist(),
+            median.tolist(),
+            values.tolist(),
+        )
+    ]
+
+
+def time_profile(epoch, amount):
+    """
+    Compute weekday and hour-of-day spending profiles.
+
+    Args:
+        epoch (np.ndarray): Transaction times in epoch seconds
+        amount (np.ndarray): Transaction amounts
+
+    Returns:
+        dict: Profiles matching ``SpendingTimeProfile``
+    """
+    seconds = np.floor(epoch).astype(np.int64)
+    weekday = (seconds // SECONDS_PER_DAY + EPOCH_WEEKDAY_SHIFT) % 7
+    hour = (seconds % SECONDS_PER_DAY) // SECONDS_PER_HOUR
+    matrix = np.bincount(weekday * 24 + hour, weights=amount, minlength=7 * 24)
+    matrix = matrix.reshape(7, 24)
+
+    return {
+        "weekday": matrix.sum(axis=1).tolist(),
+        "hour": matrix.sum(axis=0).tolist(),
+        "weekdayHour": matrix.tolist(),
+    }
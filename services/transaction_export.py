@@ -0,0 +1,197 @@
+"""
+Transaction export module for Finance Tracker API.
+
+This module streams the complete transaction history of a user, with
+category names, as one of:
+
+- ``arrow``: an Apache Arrow IPC stream (``pyarrow.ipc.open_stream``)
+- ``parquet``: a Parquet file with one row group per batch
+- ``csv``: comma separated values with a header row
+
+Rows are read from a server-side cursor in batches of ``EXPORT_BATCH_SIZE``.
+Every batch is turned into columns with ``zip`` and encoded before the next
+one is fetched, so memory stays bounded by one batch regardless of the size
+of the history, and no per-row dicts or model objects are built.
+
+The export runs in the response body iterator after the endpoint has
+returned, so it opens its own database session instead of using the
+request's dependency.
+"""
+
+import csv
+import io
+from contextlib import closing
+from sqlalchemy import select
+from db.connect import SessionLocal
+from db.models.transaction_categories_model import TransactionCategory
+from db.models.transaction_model import Transaction
+
+ARROW = "arrow"
+PARQUET = "parquet"
+CSV = "csv"
+
+EXPORT_FORMATS = {
+    ARROW: ("application/vnd.apache.arrow.stream", "arrows"),
+    PARQUET: ("application/vnd.apache.parquet", "parquet"),
+    CSV: ("text/csv", "csv"),
+}
+
+EXPORT_BATCH_SIZE = 10000
+
+EXPORT_COLUMNS = (
+    Transaction.id,
+    Transaction.date,
+    Transaction.amount,
+    Transaction.type,
+    Transaction.category_id.label("categoryId"),
+    TransactionCategory.name.label("category"),
+    Transaction.wallet_id.label("walletId"),
+    Transaction.comment,
+)
+
+
+def export_schema():
+    """
+    Return the Arrow schema of the exported columns.
+
+    Returns:
+        pyarrow.Schema: Schema of the Arrow and Parquet exports
+    """
+    import pyarrow as pa
+
+    return pa.schema(
+        [
+            ("id", pa.int64()),
+            ("date", pa.timestamp("us", tz="UTC")),
+            ("amount", pa.float64()),
+            ("type", pa.string()),
+            ("categoryId", pa.int64()),
+            ("category", pa.string()),
+            ("walletId", pa.int64()),
+            ("comment", pa.string()),
+        ]
+    )
+
+
+def export_statement(user_id: int):
+    """
+    Build the query of a user's transactions with category names.
+
+    Args:
+        user_id (int): ID of the user whose transactions are exported
+
+    Returns:
+        Select: Transactions ordered by date and ID
+    """
+    return (
+        select(*EXPORT_COLUMNS)
+        .outerjoin(
+            TransactionCategory, TransactionCategory.id == Transaction.category_id
+        )
+        .where(Transaction.user_id == user_id)
+        .order_by(Transaction.date, Transaction.id)
+    )
+
+
+def iter_batches(user_id: int, use_replica: bool, batch_size: int):
+    """
+    Read a user's transactions in batches from a server-side cursor.
+
+    Args:
+        user_id (int): ID of the user whose transactions are exported
+        use_replica (bool): Whether the session may read from a replica
+        batch_size (int): Number of rows fetched per batch
+
+    Yields:
+        list: Row tuples in the order of ``EXPORT_COLUMNS``
+    """
+    with SessionLocal(use_replica=use_replica) as db:
+        result = db.execute(
+            export_statement(user_id), execution_options={"yield_per": batch_size}
+        )
+        yield from result.partitions()
+
+
+def drain(buffer: io.BytesIO):
+    """
+    Return the bytes written to a buffer and empty it.
+
+    Args:
+        buffer (io.BytesIO): Buffer an encoder writes into
+
+    Returns:
+        bytes: Bytes written since the last call
+    """
+    chunk = buffer.getvalue()
+    buffer.seek(0)
+    buffer.truncate()
+    return chunk
+
+
+def encode_batches(batches, export_format: str):
+    """
+    Encode batches of rows in an export format.
+
+    Args:
+        batches (Iterable[list]): Row tuples in the order of ``EXPORT_COLUMNS``
+        export_format (str): One of ``ARROW``, ``PARQUET``, ``CSV``
+
+    Yields:
+        bytes: Encoded chunks of the export
+    """
+    buffer = io.BytesIO()
+
+    if export_format == CSV:
+        text = io.TextIOWrapper(
+            buffer, encoding="utf-8", newline="", write_through=True
+        )
+        writer = csv.writer(text)
+        writer.writerow([column.name for column in EXPORT_COLUMNS])
+        yield drain(buffer)
+        for rows in batches:
+            writer.writerows(rows)
+            yield drain(buffer)
+        return
+
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = export_schema()
+    if export_format == ARROW:
+        writer = pa.ipc.new_stream(buffer, schema)
+    else:
+        writer = pq.ParquetWriter(buffer, schema, compression="zstd")
+    with writer:
+        for rows in batches:
+            columns = zip(*rows)
+            writer.write_batch(
+                pa.record_batch(
+                    [
+                        pa.array(values, field.type)
+                        for values, field in zip(columns, schema)
+                    ],
+                    schema=schema,
+                )
+            )
+            yield drain(buffer)
+    # Closing writes the end-of-stream marker or the Parquet footer.
+    yield drain(buffer)
+
+
+def stream_export(user_id: int, export_format: str, use_replica: bool = False):
+    """
+    Stream the transaction history of a user.
+
+    Args:
+        user_id (int): ID of the user whose transactions are exported
+        export_format (str): One of ``ARROW``, ``PARQUET``, ``CSV``
+        use_replica (bool): Whether the export may read from a replica
+
+    Yields:
+        bytes: Encoded chunks of the export
+    """
+    # Closing the batches releases the connection when a client disconnects.
+    with closing(iter_batches(user_id, use_replica, EXPORT_BATCH_SIZE)) as batches:
+        for chunk in encode_batches(batches, export_format):
+            if chunk:
+                yield chunk
@@ -0,0 +1,136 @@
+"""
+Transaction filtering and sorting module for Finance Tracker API.
+
+This module builds the WHERE and ORDER BY clauses of the transaction list.
+Every filter is scoped to one user and every supported combination is
+backed by one of the ``(user_id, ...)`` indexes declared on
+``Transaction``:
+
+- date ranges, periods, type and the ``date`` sort: ``(user_id, date, id)``
+- amount ranges and the ``amount`` sort: ``(user_id, amount, id)``
+- category filters: ``(user_id, category_id, date)``
+- wallet filter: ``(user_id, wallet_id, date)``
+
+``tests/test_transaction_indexes.py`` verifies that PostgreSQL plans all
+filter combinations with these indexes.
+"""
+
+from datetime import datetime
+from typing import List, Optional
+from fastapi import HTTPException, status
+from sqlalchemy import select
+from db.models.finance_periods_model import FinancePeriod
+from db.models.transaction_model import Transaction
+
+SORT_KEYS = {
+    "date": Transaction.date,
+    "amount": Transaction.amount,
+}
+DEFAULT_SORT = "-date"
+
+
+def period_bound(column, period_id: int, user_id: int):
+    """
+    Build a scalar subquery selecting one bound of a user's finance period.
+
+    Filtering on these subqueries keeps the period lookup inside the main
+    statement, so the period filter costs no extra database round trip and
+    only matches periods owned by the user.
+
+    Args:
+        column: ``FinancePeriod.date_start`` or ``FinancePeriod.date_end``
+        period_id (int): ID of the finance period
+        user_id (int): ID of the user who must own the period
+
+    Returns:
+        ScalarSelect: Subquery yielding the bound, or NULL for unknown periods
+    """
+    return (
+        select(column)
+        .where(FinancePeriod.id == period_id, FinancePeriod.user_id == user_id)
+        .scalar_subquery()
+    )
+
+
+def apply_transaction_filters(
+    query,
+    user_id: int,
+    period_id: int = 0,
+    category_ids: List[int] = (),
+    transaction_type: str = "",
+    wallet_id: int = 0,
+    amount_min: Optional[float] = None,
+    amount_max: Optional[float] = None,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+):
+    """
+    Restrict a transaction query to a user's transactions matching the filters.
+
+    Args:
+        query: ``Query`` or ``Select`` over transaction columns
+        user_id (int): ID of the user who owns the transactions
+        period_id (int, optional): Finance period ID (0 = no filter)
+        category_ids (List[int], optional): Category IDs (empty = no filter)
+        transaction_type (str, optional): Transaction type (empty = no filter)
+        wallet_id (int, optional): Wallet ID (0 = no filter)
+        amount_min (float, optional): Inclusive lower amount bound
+        amount_max (float, optional): Inclusive upper amount bound
+        date_from (datetime, optional): Inclusive lower date bound
+        date_to (datetime, optional): Inclusive upper date bound
+
+    Returns:
+        The filtered query
+    """
+    query = query.filter(Transaction.user_id == user_id)
+
+    if period_id != 0:
+        query = query.filter(
+            Transaction.date
+            >= period_bound(FinancePeriod.date_start, period_id, user_id),
+            Transaction.date
+            <= period_bound(FinancePeriod.date_end, period_id, user_id),
+        )
+    if category_ids:
+        query = query.filter(Transaction.category_id.in_(category_ids))
+    if transaction_type:
+        query = query.filter(Transaction.type == transaction_type)
+    if wallet_id != 0:
+        query = query.filter(Transaction.wallet_id == wallet_id)
+    if amount_min is not None:
+        query = query.filter(Transaction.amount >= amount_min)
+    if amount_max is not None:
+        query = query.filter(Transaction.amount <= amount_max)
+    if date_from is not None:
+        query = query.filter(Transaction.date >= date_from)
+    if date_to is not None:
+        query = query.filter(Transaction.date <= date_to)
+
+    return query
+
+
+def transaction_order(sort: str = DEFAULT_SORT):
+    """
+    Build the ORDER BY clauses of a transaction sort key.
+
+    The transaction ID breaks ties so that pages are stable.
+
+    Args:
+        sort (str): ``date``, ``amount``, or either prefixed with ``-`` for
+            descending order
+
+    Returns:
+        tuple: Clauses to pass to ``order_by``
+
+    Raises:
+        HTTPException: 400 Bad Request if the sort key is unknown
+    """
+    column = SORT_KEYS.get(sort.removeprefix("-"))
+    if column is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown sort key: {sort}. Use one of: {', '.join(SORT_KEYS)}",
+        )
+    if sort.startswith("-"):
+        return column.desc(), Transaction.id.desc()
+    return column.asc(), Transaction.id.asc()
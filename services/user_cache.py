@@ -0,0 +1,58 @@
+"""
+User profile cache module for Finance Tracker API.
+
+This module keeps the profiles of recently active users in memory, keyed by
+user ID. ``GET /api/v1/users/`` is requested on every page load of the
+frontend; on a cache hit it is answered without touching the database.
+
+A profile only changes when a user logs in with updated Google account
+details. ``auth_callback`` then drops the cached profile of the user. Workers
+that did not handle the login serve the old profile until the entry expires
+after ``USER_CACHE_TTL_SECONDS``.
+"""
+
+from sqlalchemy.orm import Session
+from db.models.users_model import User
+from services.cache import LRUCache
+
+USER_CACHE_SIZE = 10000
+USER_CACHE_TTL_SECONDS = 300
+
+PROFILE_FIELDS = ("id", "name", "email", "sub_id", "picture", "verified_email")
+
+_user_profiles = LRUCache(
+    max_entries=USER_CACHE_SIZE,
+    ttl_seconds=USER_CACHE_TTL_SECONDS,
+    name="user_profiles",
+)
+
+
+def get_user_profile(db: Session, user_id: int):
+    """
+    Return the profile of a user.
+
+    Args:
+        db (Session): Database session used on a cache miss
+        user_id (int): ID of the user
+
+    Returns:
+        dict: Profile fields of the user, or None if the user does not exist
+    """
+    profile = _user_profiles.get(user_id)
+    if profile is None:
+        user = db.get(User, user_id)
+        if user is None:
+            return None
+        profile = {field: getattr(user, field) for field in PROFILE_FIELDS}
+        _user_profiles.set(user_id, profile)
+    return profile
+
+
+def invalidate_user_profile(user_id: int):
+    """
+    Drop the cached profile of a user.
+
+    Args:
+        user_id (int): ID of the user whose profile changed
+    """
+    _user_profiles.pop(user_id)
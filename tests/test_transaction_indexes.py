@@ -0,0 +1,199 @@
+"""
+Transaction filter index tests for Finance Tracker API.
+
+These tests verify that every supported combination of transaction list
+filters and sort keys is planned by PostgreSQL with one of the indexes
+declared on ``Transaction``, and never with a sequential scan of the
+transactions table.
+
+A ``test_filters`` schema of the configured database is filled with
+synthetic transactions and finance periods, the model indexes are created on
+it, and the page and count statements of every filter combination are built
+with ``services.transaction_filters`` exactly as ``get_transactions`` builds
+them. For each statement the scan nodes of ``EXPLAIN (FORMAT JSON)`` on the
+transactions table are inspected.
+
+The tests are skipped when the configured database is not PostgreSQL.
+
+Usage:
+    python -m pytest tests/test_transaction_indexes.py
+"""
+
+import itertools
+import random
+from datetime import datetime, timedelta, timezone
+import pytest
+from sqlalchemy import func, select, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.schema import CreateIndex
+from config import get_settings
+from db.connect import database_url, get_engine
+from db.models.transaction_model import Transaction
+from services.transaction_filters import (
+    SORT_KEYS,
+    apply_transaction_filters,
+    transaction_order,
+)
+
+SCHEMA = "test_filters"
+ROWS = 300_000
+USERS = 2_000
+INDEX_SCANS = {"Index Scan", "Index Only Scan", "Bitmap Heap Scan"}
+START = datetime(datetime.now(timezone.utc).year - 2, 1, 1, tzinfo=timezone.utc)
+SORTS = [*SORT_KEYS, *(f"-{key}" for key in SORT_KEYS)]
+COLUMNS = (
+    Transaction.id,
+    Transaction.category_id,
+    Transaction.date,
+    Transaction.amount,
+    Transaction.comment,
+    Transaction.type,
+)
+
+DDL = (
+    f"""
+    CREATE TABLE {SCHEMA}.transactions (
+        id serial PRIMARY KEY,
+        category_id integer NOT NULL,
+        wallet_id integer,
+        date timestamptz NOT NULL DEFAULT now(),
+        amount double precision NOT NULL,
+        comment varchar,
+        user_id integer NOT NULL,
+        type varchar NOT NULL,
+        row_version bigint NOT NULL DEFAULT 0
+    )
+    """,
+    f"""
+    CREATE TABLE {SCHEMA}.finance_periods (
+        id serial PRIMARY KEY,
+        user_id integer NOT NULL,
+        date_start timestamptz NOT NULL,
+        date_end timestamptz NOT NULL,
+        name varchar
+    )
+    """,
+)
+
+pytestmark = pytest.mark.skipif(
+    make_url(database_url(get_settings())).get_backend_name() != "postgresql",
+    reason="the index check needs a PostgreSQL database",
+)
+
+
+def create_tables(connection):
+    """Create and fill the test tables and build the model indexes."""
+    connection.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+    connection.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+    for statement in DDL:
+        connection.execute(text(statement))
+
+    connection.execute(
+        text(
+            f"INSERT INTO {SCHEMA}.transactions "
+            "(category_id, wallet_id, date, amount, comment, user_id, type) "
+            "SELECT (random() * 19)::int + 1, "
+            "  CASE WHEN random() < 0.5 THEN (random() * 4)::int + 1 END, "
+            "  :start + random() * interval '730 days', "
+            "  round((random() * 500)::numeric, 2), 'check', "
+            "  (random() * (:users - 1))::int + 1, "
+            "  CASE WHEN random() < 0.8 THEN 'expense' ELSE 'income' END "
+            "FROM generate_series(1, :rows)"
+        ),
+        {"start": START, "users": USERS, "rows": ROWS},
+    )
+    connection.execute(
+        text(
+            f"INSERT INTO {SCHEMA}.finance_periods (user_id, date_start, date_end) "
+            "SELECT user_id, :start + (month * interval '1 month'), "
+            "  :start + ((month + 1) * interval '1 month') "
+            "FROM generate_series(1, :users) AS user_id, "
+            "  generate_series(0, 23) AS month"
+        ),
+        {"start": START, "users": USERS},
+    )
+
+    connection.execute(text(f"SET search_path TO {SCHEMA}"))
+    for index in Transaction.__table__.indexes:
+        connection.execute(CreateIndex(index))
+    connection.execute(text("CREATE INDEX ON finance_periods (user_id)"))
+    connection.execute(text("ANALYZE transactions"))
+    connection.execute(text("ANALYZE finance_periods"))
+
+
+def filter_combinations():
+    """Return every combination of the supported filters as keyword arguments."""
+    rng = random.Random(0)
+    values = {
+        "period_id": lambda: rng.randrange(1, USERS * 24 + 1),
+        "category_ids": lambda: rng.sample(range(1, 21), 3),
+        "transaction_type": lambda: "income",
+        "wallet_id": lambda: rng.randrange(1, 6),
+        "amount": lambda: {"amount_min": 50.0, "amount_max": 150.0},
+        "date": lambda: {
+            "date_from": START + timedelta(days=100),
+            "date_to": START + timedelta(days=400),
+        },
+    }
+    combinations = []
+    for size in range(len(values) + 1):
+        for names in itertools.combinations(values, size):
+            filters = {}
+            for name in names:
+                value = values[name]()
+                filters.update(value if isinstance(value, dict) else {name: value})
+            combinations.append(
+                pytest.param(
+                    rng.randrange(1, USERS + 1),
+                    filters,
+                    id="+".join(names) or "none",
+                )
+            )
+    return combinations
+
+
+def scan_nodes(plan):
+    """Yield the scan nodes of the transactions table in an EXPLAIN plan tree."""
+    if plan.get("Relation Name") == "transactions":
+        yield plan
+    for child in plan.get("Plans", []):
+        yield from scan_nodes(child)
+
+
+def explain(connection, statement):
+    """Return the scan node types of a statement on the transactions table."""
+    compiled = statement.compile(
+        dialect=connection.dialect, compile_kwargs={"render_postcompile": True}
+    )
+    plan = connection.exec_driver_sql(
+        f"EXPLAIN (FORMAT JSON) {compiled}", compiled.params
+    ).scalar()[0]["Plan"]
+    return {node["Node Type"] for node in scan_nodes(plan)}
+
+
+@pytest.fixture(scope="module")
+def connection():
+    """Connection to the filled test schema, dropped after the module."""
+    with get_engine().begin() as setup:
+        create_tables(setup)
+    with get_engine().connect() as connection:
+        connection.execute(text(f"SET search_path TO {SCHEMA}"))
+        yield connection
+    with get_engine().begin() as teardown:
+        teardown.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+
+
+@pytest.mark.parametrize("user_id,filters", filter_combinations())
+@pytest.mark.parametrize("sort", ["count", *SORTS])
+def test_transaction_filters_use_index(connection, user_id, filters, sort):
+    """The count and page statements of a filter combination use an index."""
+    query = apply_transaction_filters(select(*COLUMNS), user_id, **filters)
+    if sort == "count":
+        statement = select(func.count()).select_from(query.subquery())
+    else:
+        statement = query.order_by(*transaction_order(sort)).limit(20)
+
+    scans = explain(connection, statement)
+
+    assert scans, "the statement does not read the transactions table"
+    assert scans <= INDEX_SCANS, f"scans the transactions table with {scans}"